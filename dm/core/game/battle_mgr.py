@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from pygame     import Surface
-from typing     import TYPE_CHECKING, Any, List
+from typing     import TYPE_CHECKING, Any, List, Optional
 
 from .encounter import DMEncounter
+from .kernel    import DMCombatKernel
+from .recycler  import DMRecycler
+from .scheduler import DMEncounterScheduler
 from .contexts import AttackContext
 from utilities  import FateType, ArgumentTypeError
 
@@ -21,9 +24,11 @@ class DMHeroSpawner:
     __slots__ = (
         "_parent",
         "_spawn_cd",
+        "_cd_ticks",
         "_base_qty",
         "_scalar",
         "_flat_additional",
+        "_spawned",
     )
 
     SPAWN_RATE = 2.0  # 1 hero spawned every 2 seconds
@@ -34,14 +39,22 @@ class DMHeroSpawner:
         self._parent: DMBattleManager = parent
 
         self._spawn_cd: float = 1.0  # Start this at 1 for timing purposes
+        # Steps since the cooldown was set. The time left is worked out from
+        # this rather than counted down, so skipping ahead matches stepping.
+        self._cd_ticks: int = 0
         self._base_qty: int = 3
         self._scalar: float = 1.0
         self._flat_additional: int = 0
 
+        # Counted separately from the dungeon's heroes since dead heroes are
+        # removed from it and recycled.
+        self._spawned: int = 0
+
 ################################################################################
     def reset_cooldown(self) -> None:
 
         self._spawn_cd = self.SPAWN_RATE
+        self._cd_ticks = 0
 
 ################################################################################
     @property
@@ -70,11 +83,24 @@ class DMHeroSpawner:
 
         self._flat_additional += amount
 
+################################################################################
+    @property
+    def spawned(self) -> int:
+
+        return self._spawned
+
+################################################################################
+    @property
+    def pending(self) -> int:
+        """The number of heroes still to come this battle."""
+
+        return max(self.max_heroes - self._spawned, 0)
+
 ################################################################################
     @property
     def finished_spawning(self) -> bool:
 
-        return len(self.game.heroes) >= self.max_heroes
+        return self._spawned >= self.max_heroes
 
 ################################################################################
     def update(self, dt: float) -> None:
@@ -82,11 +108,36 @@ class DMHeroSpawner:
         if self.finished_spawning:
             return
 
-        self._spawn_cd -= dt
+        self._cd_ticks += 1
 
-        if self._spawn_cd <= 0.0:
+        if self._spawn_cd - self._cd_ticks * dt <= 0.0:
+            # Counted by `hero_entered()`, along with any spawned by hand.
             self.game.spawn_hero()
-            self._spawn_cd = self.SPAWN_RATE
+            self.reset_cooldown()
+
+################################################################################
+    def hero_entered(self) -> None:
+
+        self._spawned += 1
+
+################################################################################
+    def ticks_until_spawn(self, dt: float) -> Optional[int]:
+        """Returns how many steps of the given length can pass without a hero
+        spawning, or None if no more will. Errs on the side of fewer."""
+
+        if self.finished_spawning:
+            return None
+
+        return max(int((self._spawn_cd - self._cd_ticks * dt) / dt) - 1, 0)
+
+################################################################################
+    def skip(self, ticks: int, dt: float) -> None:
+        """Runs the given number of steps in which no hero spawns."""
+
+        if self.finished_spawning:
+            return
+
+        self._cd_ticks += ticks
 
 ################################################################################
 class DMBattleManager:
@@ -95,9 +146,23 @@ class DMBattleManager:
         "_state",
         "_running",
         "_encounters",
+        "_scheduler",
+        "_kernel",
+        "_batch_combat",
+        "_encounter_pool",
+        "_context_pool",
+        "_keep_attack_log",
         "_hero_spawner",
+        "_heroes_in_dungeon",
+        "_active_encounters",
+        "_ended_encounters",
     )
 
+    # Enough for a late-game wave's worth of fights going at once, each with
+    # a full set of attacks kept.
+    ENCOUNTER_POOL_SIZE = 256
+    CONTEXT_POOL_SIZE = 256 * DMEncounter.MAX_ATTACKS
+
 ################################################################################
     def __init__(self, state: DMGame):
 
@@ -106,6 +171,25 @@ class DMBattleManager:
 
         self._running: bool = False
         self._encounters: List[Any] = []
+        self._scheduler: DMEncounterScheduler = DMEncounterScheduler()
+
+        # Off by default: it only pays for itself with lots of fights going
+        # at once, and can't be used while anything hooks "on_attack".
+        self._kernel: DMCombatKernel = DMCombatKernel(state)
+        self._batch_combat: bool = False
+
+        # Encounters and their attack contexts are reused once a fight is
+        # over, rather than rebuilt for every one.
+        self._encounter_pool: DMRecycler = DMRecycler(self.ENCOUNTER_POOL_SIZE)
+        self._context_pool: DMRecycler = DMRecycler(self.CONTEXT_POOL_SIZE)
+        self._keep_attack_log: bool = True
+
+        # Kept up to date as heroes enter and leave the dungeon and
+        # encounters start and end, so checking whether the battle is over
+        # doesn't scan anything.
+        self._heroes_in_dungeon: int = 0
+        self._active_encounters: int = 0
+        self._ended_encounters: int = 0
 
 ################################################################################
     @property
@@ -119,14 +203,74 @@ class DMBattleManager:
 
         return self._running
 
+################################################################################
+    @property
+    def heroes_spawned(self) -> int:
+
+        return self._hero_spawner.spawned
+
+################################################################################
+    @property
+    def heroes_in_dungeon(self) -> int:
+
+        return self._heroes_in_dungeon
+
+################################################################################
+    @property
+    def active_encounters(self) -> int:
+
+        return self._active_encounters
+
+################################################################################
+    @property
+    def batch_combat(self) -> bool:
+        """Whether new encounters are resolved together by the
+        :class:`DMCombatKernel` when nothing needs a context for each attack."""
+
+        return self._batch_combat
+
+################################################################################
+    @batch_combat.setter
+    def batch_combat(self, value: bool) -> None:
+
+        if not isinstance(value, bool):
+            raise ArgumentTypeError("DMBattleManager.batch_combat", type(value), type(bool))
+
+        self._batch_combat = value
+
+################################################################################
+    @property
+    def keep_attack_log(self) -> bool:
+        """Whether encounters keep the context of every attack until they end.
+        When off, only the attack count and damage totals are kept, and each
+        context is reused as soon as it's been dispatched."""
+
+        return self._keep_attack_log
+
+################################################################################
+    @keep_attack_log.setter
+    def keep_attack_log(self, value: bool) -> None:
+
+        if not isinstance(value, bool):
+            raise ArgumentTypeError("DMBattleManager.keep_attack_log", type(value), type(bool))
+
+        self._keep_attack_log = value
+
 ################################################################################
     def update(self, dt: float) -> None:
 
-        for encounter in self._encounters:
-            if not encounter.in_progress:
-                self._encounters.remove(encounter)
-            else:
-                encounter.update(dt)
+        # Something started hooking attacks, so every attack needs its own
+        # context from here on.
+        if len(self._kernel) and self.game.has_subscribers("on_attack"):
+            for encounter, slot, delay in self._kernel.release():
+                self._scheduler.schedule(encounter, slot, delay)
+
+        # Only encounters with an action due this step are touched.
+        self._scheduler.advance(dt)
+        self._kernel.advance(dt)
+
+        if self._ended_encounters:
+            self._compact()
 
         self._hero_spawner.update(dt)
 
@@ -150,19 +294,145 @@ class DMBattleManager:
         attacker._opponent = defender
         defender._opponent = attacker
 
-        self._encounters.append(DMEncounter(self.game, attacker, defender))
+        encounter = self._encounter_pool.acquire(DMEncounter)
+        if encounter is None:
+            encounter = DMEncounter(self.game, attacker, defender, self._keep_attack_log)
+        else:
+            encounter._reset(self.game, attacker, defender, self._keep_attack_log)
+
+        self._encounters.append(encounter)
+        self._active_encounters += 1
+
+        if self._batch_combat and not self.game.has_subscribers("on_attack"):
+            self._kernel.add(encounter)
+        else:
+            self._scheduler.add(encounter)
 
 ################################################################################
-    def check_battle_over(self) -> None:
+    def attack_context(self, attacker: DMUnit, defender: DMUnit) -> AttackContext:
+        """Returns an attack context for the given units, reusing a pooled one
+        if there is one.
 
-        if not self._hero_spawner.finished_spawning:
-            return
+        Parameters:
+        -----------
+        attacker: :class:`DMUnit`
+            The attacking unit.
+
+        defender: :class:`DMUnit`
+            The defending unit.
+        """
+
+        ctx = self._context_pool.acquire(AttackContext)
+        if ctx is None:
+            return AttackContext(self.game, attacker, defender)
+
+        ctx._reset(self.game, attacker, defender)
+        return ctx
+
+################################################################################
+    def release_context(self, ctx: AttackContext) -> None:
+        """Returns an attack context to the pool. Nothing may use it after.
+
+        Contexts that were dispatched to a subscriber belong to whoever kept
+        them, so they're left alone rather than pooled."""
+
+        if not ctx.published:
+            self._context_pool.release(ctx)
+
+################################################################################
+    def hero_entered(self, hero: DMHero) -> None:
+        """Counts a hero that's just been added to the dungeon, however it
+        was spawned."""
+
+        self._heroes_in_dungeon += 1
+        self._hero_spawner.hero_entered()
+
+################################################################################
+    def hero_left(self, hero: DMHero) -> None:
+        """Counts a hero that's just been taken out of the dungeon, however
+        it died."""
+
+        self._heroes_in_dungeon -= 1
+
+################################################################################
+    def encounter_ended(self, encounter: DMEncounter) -> None:
+        """Counts an encounter that's just disengaged. It's pooled at the end
+        of the update."""
+
+        self._active_encounters -= 1
+        self._ended_encounters += 1
+
+################################################################################
+    def _compact(self) -> None:
+
+        # One pass, building a new list rather than removing while iterating.
+        active = []
+        for encounter in self._encounters:
+            if encounter.in_progress:
+                active.append(encounter)
+            else:
+                self._retire(encounter)
+
+        self._encounters = active
+        self._ended_encounters = 0
+
+################################################################################
+    def _retire(self, encounter: DMEncounter) -> None:
+
+        for ctx in encounter.release_attacks():
+            self.release_context(ctx)
+
+        self._encounter_pool.release(encounter)
+
+################################################################################
+    def ticks_until_next_event(self, dt: float) -> Optional[int]:
+        """Returns how many steps of the given length can pass before the
+        next attack or hero spawn, or None if neither is coming. Errs on the
+        side of fewer, so skipping that many never jumps past an event.
+
+        Parameters:
+        -----------
+        dt: :class:`float`
+            The length of a step, in seconds.
+        """
+
+        ticks = [
+            t for t in (
+                self._scheduler.ticks_until_next(dt),
+                self._kernel.ticks_until_next(dt),
+                self._hero_spawner.ticks_until_spawn(dt)
+            )
+            if t is not None
+        ]
+
+        return min(ticks) if ticks else None
+
+################################################################################
+    def skip(self, ticks: int, dt: float) -> None:
+        """Runs the given number of steps in one go. Only valid when nothing
+        would happen during them, i.e. for at most
+        :meth:`ticks_until_next_event` steps while the dungeon is idle.
+
+        Parameters:
+        -----------
+        ticks: :class:`int`
+            The number of steps to skip.
+
+        dt: :class:`float`
+            The length of a step, in seconds.
+        """
+
+        self._scheduler.skip(ticks, dt)
+        self._kernel.skip(ticks, dt)
+        self._hero_spawner.skip(ticks, dt)
+
+################################################################################
+    def check_battle_over(self) -> None:
 
-        if any(e.in_progress for e in self._encounters):
+        if self._hero_spawner.pending or self._active_encounters or self._heroes_in_dungeon:
             return
 
-        if not any(h.is_alive for h in self.game.heroes):
-            self.end_battle()
+        self.end_battle()
 
 ################################################################################
     def end_battle(self) -> None:
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import time
+
+from typing     import TYPE_CHECKING, Optional, Tuple
+
+from utilities  import *
+
+if TYPE_CHECKING:
+    from dm.core.game.game import DMGame
+################################################################################
+
+__all__ = ("DMSimClock",)
+
+################################################################################
+class DMSimClock:
+    """Turns variable frame times into a whole number of fixed-length
+    simulation steps, so the game plays out the same way at any frame rate.
+
+    Frame time is banked in an accumulator and spent one step at a time.
+    Whatever's left over is less than a step, and is used to interpolate
+    between the last two simulation states when drawing.
+
+    Attributes:
+    -----------
+    _state: :class:`DMGame`
+        The game instance.
+
+    _step: :class:`float`
+        The length of a single simulation step, in seconds.
+
+    _max_steps: :class:`int`
+        The most steps run for a single frame. Time past that is dropped, so
+        a long stall doesn't leave the game trying to catch up forever.
+
+    _accumulator: :class:`float`
+        The frame time that hasn't been simulated yet.
+
+    _ticks: :class:`int`
+        The number of steps simulated so far.
+
+    _speed: Optional[:class:`int`]
+        How many simulated seconds pass per real second, or None to simulate
+        as much as fits in each frame.
+
+    _presenting: :class:`bool`
+        Whether the step being run is the last one before a frame is drawn.
+
+    _frame_start: :class:`float`
+        When the current frame's steps started, for uncapped speed.
+
+    Properties:
+    -----------
+    step: :class:`float`
+        Returns the length of a single simulation step, in seconds.
+
+    ticks: :class:`int`
+        Returns the number of steps simulated so far.
+
+    alpha: :class:`float`
+        Returns how far the current frame is between the last simulation step
+        and the next, from 0 to 1.
+
+    speed: Optional[:class:`int`]
+        Returns the game speed multiplier, or None if it's uncapped.
+
+    presenting: :class:`bool`
+        Returns whether the step being run will be drawn. Purely visual work
+        can be skipped when it won't be.
+
+    Methods:
+    --------
+    advance(dt: :class:`float`) -> :class:`int`
+        Banks a frame's worth of time and returns how many steps to run.
+
+    begin_step(index: :class:`int`, count: :class:`int`) -> :class:`bool`
+        Starts the next step of a frame, returning whether it's the last one.
+
+    tick(count: :class:`int`) -> None
+        Records that one or more steps were simulated.
+
+    set_speed(speed: Optional[:class:`int`]) -> None
+        Sets the game speed multiplier.
+
+    cycle_speed() -> None
+        Switches to the next game speed in `SPEEDS`.
+
+    reset() -> None
+        Drops any banked time.
+    """
+
+    __slots__ = (
+        "_state",
+        "_step",
+        "_max_steps",
+        "_accumulator",
+        "_ticks",
+        "_speed",
+        "_presenting",
+        "_frame_start",
+    )
+
+    STEP = 1 / 60
+    MAX_STEPS = 8  # Per frame, at 1x speed.
+
+    SPEEDS: Tuple[Optional[int], ...] = (1, 4, 16, None)
+    # How long an uncapped frame can spend simulating before it's drawn.
+    UNCAPPED_BUDGET = 0.8 / FPS
+    UNCAPPED_STEPS = 1_000_000
+
+################################################################################
+    def __init__(self, state: DMGame, step: float = STEP, max_steps: int = MAX_STEPS):
+
+        self._state: DMGame = state
+
+        self._step: float = step
+        self._max_steps: int = max_steps
+
+        self._accumulator: float = 0.0
+        self._ticks: int = 0
+
+        self._speed: Optional[int] = 1
+        self._presenting: bool = True
+        self._frame_start: float = 0.0
+
+################################################################################
+    @property
+    def step(self) -> float:
+
+        return self._step
+
+################################################################################
+    @property
+    def ticks(self) -> int:
+
+        return self._ticks
+
+################################################################################
+    @property
+    def alpha(self) -> float:
+
+        # Clamped, since float error can leave the accumulator a hair outside
+        # the range.
+        return min(max(self._accumulator / self._step, 0.0), 1.0)
+
+################################################################################
+    @property
+    def speed(self) -> Optional[int]:
+
+        return self._speed
+
+################################################################################
+    @property
+    def presenting(self) -> bool:
+
+        return self._presenting
+
+################################################################################
+    @presenting.setter
+    def presenting(self, value: bool) -> None:
+
+        self._presenting = value
+
+################################################################################
+    def advance(self, dt: float) -> int:
+        """Banks a frame's worth of time and returns how many simulation steps
+        should be run for it.
+
+        Parameters:
+        -----------
+        dt: :class:`float`
+            The real time since the last frame, in seconds.
+
+        Returns:
+        --------
+        :class:`int`
+            The number of steps to run. Call `begin_step()` before each one
+            and `tick()` after it.
+        """
+
+        self._frame_start = time.perf_counter()
+
+        if self._speed is None:
+            # Run until the frame's time budget is spent, however many that is.
+            self._accumulator = 0.0
+            return self.UNCAPPED_STEPS
+
+        self._accumulator += dt * self._speed
+
+        steps = int(self._accumulator / self._step)
+        max_steps = self._max_steps * self._speed
+        if steps > max_steps:
+            steps = max_steps
+            # Drop whatever we can't catch up on this frame.
+            self._accumulator = steps * self._step
+
+        self._accumulator -= steps * self._step
+
+        return steps
+
+################################################################################
+    def begin_step(self, index: int, count: int) -> bool:
+        """Starts the next simulation step of a frame.
+
+        Parameters:
+        -----------
+        index: :class:`int`
+            The step's index within the frame.
+
+        count: :class:`int`
+            The number of steps `advance()` returned for the frame.
+
+        Returns:
+        --------
+        :class:`bool`
+            Whether this is the last step before the frame is drawn.
+        """
+
+        if self._speed is None:
+            last = time.perf_counter() - self._frame_start >= self.UNCAPPED_BUDGET
+        else:
+            last = index == count - 1
+
+        self._presenting = last
+
+        return last
+
+################################################################################
+    def tick(self, count: int = 1) -> None:
+
+        self._ticks += count
+
+################################################################################
+    def reset(self) -> None:
+
+        self._accumulator = 0.0
+
+################################################################################
+    def set_speed(self, speed: Optional[int]) -> None:
+        """Sets the game speed multiplier.
+
+        Parameters:
+        -----------
+        speed: Optional[:class:`int`]
+            How many simulated seconds pass per real second, or None to run as
+            many steps as fit in each frame.
+        """
+
+        if speed is not None and speed < 1:
+            raise ValueError(f"Game speed must be at least 1, got {speed}.")
+
+        self._speed = speed
+        self.reset()
+
+################################################################################
+    def cycle_speed(self) -> None:
+        """Switches to the next game speed in `SPEEDS`, wrapping around."""
+
+        try:
+            index = self.SPEEDS.index(self._speed)
+        except ValueError:
+            index = -1
+
+        self.set_speed(self.SPEEDS[(index + 1) % len(self.SPEEDS)])
+
+################################################################################
@@ -42,6 +42,16 @@ class DamageComponent:
 
         self._total: int = None  # type: ignore
 
+################################################################################
+    def _reset(self, damage: int) -> None:
+
+        self._base = damage
+        self._scalar = 1.0
+        self.flat_increase = 0
+
+        self._damage_override = None
+        self._total = None  # type: ignore
+
 ################################################################################
     def scale_damage(self, scalar: float) -> None:
 
@@ -98,6 +108,7 @@ class AttackContext(DMContext):
         "_damage",
         "_fail",
         "_running",
+        "_dealt",
     )
 
 ################################################################################
@@ -114,16 +125,54 @@ class AttackContext(DMContext):
         self._source: Union[DMUnit] = attacker
         self._target: DMUnit = defender
 
-        if base_damage is None:
-            try:
-                base_damage = self._source.attack
-            except AttributeError:
-                raise ArgumentMissingError("AttackContext.__init__()", "base_damage", type(int))
-
-        self._damage: DamageComponent = DamageComponent(base_damage)
+        self._damage: DamageComponent = DamageComponent(self._base_damage(base_damage))
         self._fail: bool = False
 
         self._running: bool = True
+        self._dealt: int = 0
+
+################################################################################
+    def _reset(  # type: ignore[override]
+        self,
+        state: DMGame,
+        attacker: Union[DMUnit],
+        defender: DMUnit,
+        base_damage: Optional[int] = None
+    ) -> None:
+        """Readies a pooled context for a new attack, as if it were freshly
+        made with the same arguments."""
+
+        super()._reset(state)
+
+        self._source = attacker
+        self._target = defender
+
+        self._damage._reset(self._base_damage(base_damage))
+        self._fail = False
+
+        self._running = True
+        self._dealt = 0
+
+################################################################################
+    def mark_published(self) -> None:
+
+        super().mark_published()
+
+        # Whoever keeps the context may read its units later, so they can't
+        # be recycled into new spawns.
+        self._source.retain()
+        self._target.retain()
+
+################################################################################
+    def _base_damage(self, base_damage: Optional[int]) -> int:
+
+        if base_damage is not None:
+            return base_damage
+
+        try:
+            return self._source.attack
+        except AttributeError:
+            raise ArgumentMissingError("AttackContext.__init__()", "base_damage", type(int))
 
 ################################################################################
     def __repr__(self) -> str:
@@ -148,6 +197,13 @@ class AttackContext(DMContext):
 
         return self._damage.calculate()
 
+################################################################################
+    @property
+    def dealt(self) -> int:
+        """The damage the attack actually did, once it's been executed."""
+
+        return self._dealt
+
 ################################################################################
     @property
     def room(self) -> DMRoom:
@@ -176,7 +232,8 @@ class AttackContext(DMContext):
 
         if not self.will_fail:
             self.source.play_attack_animation()
-            self.target.damage(self.damage)
+            self._dealt = self.damage
+            self.target.damage(self._dealt)
 
         self._running = False
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+from itertools  import count
 from typing     import TYPE_CHECKING, Any, Callable, List, Optional
-from uuid       import UUID, uuid4
 
 if TYPE_CHECKING:
     from dm.core.game.game    import DMGame
@@ -10,12 +10,18 @@ if TYPE_CHECKING:
 
 __all__ = ("DMContext",)
 
+# A context is made for every attack, so ids are a plain counter. uuid4()
+# reads os.urandom each time. Unique within a process, which is as far as
+# contexts ever go.
+_IDS = count(1)
+
 ################################################################################
 class DMContext:
 
     __slots__ = (
         "_id",
         "_state",
+        "_published",
         "_late_callbacks",
         "_pre_execution_callbacks",
         "_post_execution_callbacks"
@@ -24,17 +30,55 @@ class DMContext:
 ################################################################################
     def __init__(self, state: DMGame):
 
-        self._id: UUID = uuid4()
+        self._id: int = next(_IDS)
         self._state: DMGame = state
 
+        # Set once the context has been dispatched to a subscriber, which
+        # may keep it. Published contexts are never pooled.
+        self._published: bool = False
+
         self._late_callbacks: List[Callable] = []
+        self._pre_execution_callbacks: List[Callable] = []
         self._post_execution_callbacks: List[Callable] = []
 
+################################################################################
+    def _reset(self, state: DMGame) -> None:
+        """Readies a pooled context for reuse, as if it were freshly made."""
+
+        self._id = next(_IDS)
+        self._state = state
+
+        self._published = False
+
+        self._late_callbacks.clear()
+        self._pre_execution_callbacks.clear()
+        self._post_execution_callbacks.clear()
+
 ################################################################################
     def __eq__(self, other: DMContext) -> bool:
 
         return self._id == other._id
 
+################################################################################
+    @property
+    def id(self) -> int:
+
+        return self._id
+
+################################################################################
+    @property
+    def published(self) -> bool:
+        """Whether the context has been handed to an event subscriber."""
+
+        return self._published
+
+################################################################################
+    def mark_published(self) -> None:
+        """Records that the context has been handed to an event subscriber,
+        which may keep it. It's never pooled after this."""
+
+        self._published = True
+
 ################################################################################
     @property
     def game(self) -> DMGame:
@@ -4,6 +4,8 @@ import math
 
 from typing     import TYPE_CHECKING, Optional
 
+from utilities  import MAX_DAY
+
 if TYPE_CHECKING:
     from dm.core.game.game import DMGame
 ################################################################################
@@ -37,6 +39,9 @@ class DMDay:
     -------
     advance() -> None
         Advance the day counter.
+
+    set(day: :class:`int`) -> None
+        Jump straight to the given day.
     """
 
     __slots__ = (
@@ -69,7 +74,7 @@ class DMDay:
     def base_hero_count(self) -> int:
 
         # Calculate the ratio of the current step to the total number of steps
-        ratio = math.sqrt(self.current / 2000)  # "Max" days can be 2000. Anything after that is dumb lol.
+        ratio = math.sqrt(self.current / MAX_DAY)  # Anything after the "max" day is dumb lol.
 
         # Linearly interpolate between the start and end values (8 and 50)
         # They represent how many heroes are invading on day 1 and day 2000,
@@ -78,8 +83,30 @@ class DMDay:
 
 ################################################################################
     def advance(self) -> None:
-        """Advance the day counter."""
+        """Advance the day counter.
+
+        Spawn weights depend on the current day, so the previous day's cached
+        weights, and any weighted-choice tables built from them, are dropped
+        as well.
+        """
+
+        self.set(self._day + 1)
+
+################################################################################
+    def set(self, day: int) -> None:
+        """Jump straight to the given day, e.g. to simulate a battle on it.
+
+        Parameters:
+        -----------
+        day: :class:`int`
+            The day to jump to. Must be at least 1.
+        """
+
+        if day < 1:
+            raise ValueError(f"Invalid day |{day}|.")
 
-        self._day += 1
+        self._day = day
+        self._state.spawn.clear_weight_cache()
+        self._state.random.clear_weight_cache()
 
 ################################################################################
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import random
 
-from pygame         import Surface, Vector2
-from typing         import TYPE_CHECKING, List, Optional, Tuple, Union
+from pygame         import Rect, Surface, Vector2
+from typing         import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from .map           import DMDungeonMap
 from utilities      import *
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from ..objects.monster import DMMonster
     from ..objects.room import DMRoom
     from ..objects.hero import DMHero
+    from ..objects.unit import DMUnit
 ################################################################################
 
 __all__ = ("DMDungeon",)
@@ -25,6 +26,8 @@ class DMDungeon:
         "_state",
         "_map",
         "_heroes",
+        "_fallen",
+        "_drawn",
     )
 
 ################################################################################
@@ -34,6 +37,12 @@ class DMDungeon:
         self._map = DMDungeonMap(game)
 
         self._heroes: List[DMHero] = []
+        # Heroes whose death animation finished this frame. They're cleared
+        # out after the update loop so it doesn't skip anyone.
+        self._fallen: List[DMHero] = []
+
+        # What every unit looked like when it was last drawn, by id().
+        self._drawn: Dict[int, Tuple[DMUnit, Rect, tuple]] = {}
 
 ################################################################################
     def __getitem__(self, index: int) -> DMMapRow:
@@ -63,6 +72,83 @@ class DMDungeon:
         for hero in self.heroes:
             hero.draw(screen)
 
+################################################################################
+    def render(self, screen: Surface) -> None:
+        """Draws the dungeon through the game's renderer, repainting only the
+        parts of the screen where a unit moved, animated or disappeared.
+
+        Rooms come from the map's cached layer, so a changed room only
+        repaints its own area. Falls back to a full repaint when the renderer
+        asks for one.
+
+        Parameters:
+        -----------
+        screen: :class:`Surface`
+            The screen to draw to.
+        """
+
+        renderer = self._state.renderer
+        units: List[DMUnit] = self.deployed_monsters + self.heroes  # type: ignore
+
+        drawn: Dict[int, Tuple[DMUnit, Rect, tuple]] = {}
+        dirty: List[Rect] = self._map.refresh_layer()
+        background = self._map.layer
+
+        for unit in units:
+            state = unit.graphics.draw_state()
+            if state is None:
+                continue
+            rect = state[1]
+            drawn[id(unit)] = (unit, rect, state)
+
+            previous = self._drawn.pop(id(unit), None)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[2] != state:
+                dirty.append(previous[1])
+                dirty.append(rect)
+
+        # Anything left was drawn last frame but is gone or invisible now.
+        dirty.extend(previous[1] for previous in self._drawn.values())
+        self._drawn = drawn
+
+        if renderer.full_redraw:
+            screen.blit(background, (0, 0))
+            for unit in units:
+                unit.draw(screen)
+            return
+
+        if not dirty:
+            return
+
+        # Units overlapping a dirty area get redrawn, so the areas under them
+        # have to be repainted too, or translucent pixels would be blended twice.
+        redraw = set()
+        pending = list(drawn.values())
+        grew = True
+        while grew:
+            grew = False
+            remaining = []
+            for unit, rect, _ in pending:
+                if rect.collidelist(dirty) != -1:
+                    redraw.add(id(unit))
+                    dirty.append(rect)
+                    grew = True
+                else:
+                    remaining.append((unit, rect, _))
+            pending = remaining
+
+        for rect in dirty:
+            screen.blit(background, rect, rect)
+
+        # Keep the usual draw order so overlaps come out the same.
+        for unit in units:
+            if id(unit) in redraw:
+                unit.draw(screen)
+
+        renderer.mark_dirty(*dirty)
+
+
 ################################################################################
     def update(self, dt: float) -> None:
 
@@ -72,6 +158,22 @@ class DMDungeon:
         for hero in self.heroes:
             hero.update(dt)
 
+        if self._fallen:
+            self._clear_fallen()
+
+################################################################################
+    @property
+    def idle(self) -> bool:
+        """Whether every unit is standing still, so updating the dungeon would
+        change nothing but idle animations."""
+
+        # Heroes first, since they're the ones usually on the move and
+        # collecting the deployed monsters isn't free.
+        return (
+            all(h.graphics.idle for h in self._heroes)
+            and all(m.graphics.idle for m in self.deployed_monsters)
+        )
+
 ################################################################################
     def get_room_at(self, pos: Union[Vector2, Tuple[int, int]]) -> Optional[DMRoom]:
 
@@ -128,5 +230,26 @@ class DMDungeon:
     def add_hero(self, hero: DMHero) -> None:
 
         self._heroes.append(hero)
+        self._state.battle_manager.hero_entered(hero)
+
+################################################################################
+    def remove_hero(self, hero: DMHero) -> None:
+        """Marks a hero whose death animation has finished to be taken out of
+        the dungeon and handed back to the object pool for reuse."""
+
+        self._fallen.append(hero)
+
+################################################################################
+    def _clear_fallen(self) -> None:
+
+        for hero in self._fallen:
+            try:
+                self._heroes.remove(hero)
+            except ValueError:
+                continue
+            self._state.battle_manager.hero_left(hero)
+            self._state.spawn.recycle(hero)
+
+        self._fallen.clear()
 
 ################################################################################
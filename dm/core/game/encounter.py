@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from typing     import TYPE_CHECKING, List
-from uuid       import UUID, uuid4
+from itertools  import count
+from typing     import TYPE_CHECKING, List, Tuple
 
 from .contexts.attack  import AttackContext
 
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
 
 __all__ = ("DMEncounter",)
 
+# Plain counter ids, like contexts. A pooled encounter gets a new one each
+# time it's reused, which is how stale references to it are told apart.
+_IDS = count(1)
+
 ################################################################################
 class DMEncounter:
 
@@ -21,16 +25,25 @@ class DMEncounter:
         "_unit1",
         "_unit2",
         "_attacks",
-        "_unit1_action_cd",
-        "_unit2_action_cd",
+        "_keep_attacks",
+        "_attack_count",
+        "_damage_dealt",
         "_final_cd",
         "_in_progress",
     )
 
+    # Cooldowns are in units of dex: a unit with 2 dex acts twice as often.
+    FIRST_ACTION_CD: Tuple[float, float] = (1.0, 0.5)
+    ACTION_CD = 1.0
+    # Dex is read as at least this, so a unit slowed to nothing still acts
+    # now and then and every encounter runs out of attacks eventually.
+    MIN_DEX = 0.1
+    MAX_ATTACKS = 6  # 24 == 12 rounds worth of attacks (1 per unit).
+
 ################################################################################
-    def __init__(self, state: DMGame, unit1: DMUnit, unit2: DMUnit):
+    def __init__(self, state: DMGame, unit1: DMUnit, unit2: DMUnit, keep_attacks: bool = True):
 
-        self._id: UUID = uuid4()
+        self._id: int = next(_IDS)
         self._state: DMGame = state
 
         self._in_progress: bool = True
@@ -38,17 +51,46 @@ class DMEncounter:
         self._unit1: DMUnit = unit1
         self._unit2: DMUnit = unit2
 
-        self._unit1_action_cd: float = 1.0
-        self._unit2_action_cd: float = 0.5
         self._final_cd: float = 1.0
 
+        # With `keep_attacks` off, contexts go back to the pool straight
+        # after use and only the totals are kept.
         self._attacks: List[AttackContext] = []
+        self._keep_attacks: bool = keep_attacks
+        self._attack_count: int = 0
+        self._damage_dealt: List[int] = [0, 0]
+
+################################################################################
+    def _reset(self, state: DMGame, unit1: DMUnit, unit2: DMUnit, keep_attacks: bool = True) -> None:
+        """Readies a pooled encounter for a new fight, as if it were freshly
+        made with the same arguments."""
+
+        self._id = next(_IDS)
+        self._state = state
+
+        self._in_progress = True
+
+        self._unit1 = unit1
+        self._unit2 = unit2
+
+        self._final_cd = 1.0
+
+        self._attacks.clear()
+        self._keep_attacks = keep_attacks
+        self._attack_count = 0
+        self._damage_dealt[0] = self._damage_dealt[1] = 0
 
 ################################################################################
     def __eq__(self, other: DMEncounter) -> bool:
 
         return self._id == other._id
 
+################################################################################
+    @property
+    def id(self) -> int:
+
+        return self._id
+
 ################################################################################
     @property
     def game(self) -> DMGame:
@@ -74,45 +116,112 @@ class DMEncounter:
         return self._in_progress
 
 ################################################################################
-    def update(self, dt: float) -> None:
+    @property
+    def attacks(self) -> List[AttackContext]:
+        """Every attack made so far, if they're being kept."""
 
-        # Decrement cooldown timers
-        self._unit1_action_cd -= dt * self._unit1.dex
-        self._unit2_action_cd -= dt * self._unit2.dex
+        return self._attacks
 
-        if self._unit1_action_cd <= 0:
-            ctx = self.attack(self._unit1, self._unit2)
-            self._unit1_action_cd = 1.0  # Reset cooldown timer
+################################################################################
+    @property
+    def attack_count(self) -> int:
 
-            if not self._unit1.is_alive or not self._unit2.is_alive:
-                self.disengage(ctx)
+        return self._attack_count
 
-        if self._unit2_action_cd <= 0:
+################################################################################
+    @property
+    def damage_dealt(self) -> Tuple[int, int]:
+        """The total damage dealt by unit 1 and by unit 2."""
+
+        return self._damage_dealt[0], self._damage_dealt[1]
+
+################################################################################
+    def action_delay(self, slot: int, first: bool = False) -> float:
+        """Returns how long until one of the units acts, in seconds.
+
+        Dex is read when the action is scheduled, so a change to it takes
+        effect from that unit's next action on.
+
+        Parameters:
+        -----------
+        slot: :class:`int`
+            Which unit, 1 or 2.
+
+        first: :class:`bool`
+            Whether it's the unit's opening action of the encounter.
+        """
+
+        unit = self._unit1 if slot == 1 else self._unit2
+        cooldown = self.FIRST_ACTION_CD[slot - 1] if first else self.ACTION_CD
+
+        return cooldown / max(unit.dex, self.MIN_DEX)
+
+################################################################################
+    def act(self, slot: int) -> None:
+        """Has one of the units attack the other. Called by the battle
+        manager's scheduler when the unit's action comes due.
+
+        Parameters:
+        -----------
+        slot: :class:`int`
+            Which unit attacks, 1 or 2.
+        """
+
+        if slot == 1:
+            ctx = self.attack(self._unit1, self._unit2)
+        else:
             ctx = self.attack(self._unit2, self._unit1)
-            self._unit2_action_cd = 1.0  # Reset cooldown timer
 
-            if not self._unit1.is_alive or not self._unit2.is_alive:
-                self.disengage(ctx)
+        if not self._unit1.is_alive or not self._unit2.is_alive:
+            self.disengage(ctx)
+        elif self._attack_count >= self.MAX_ATTACKS:
+            self.disengage(ctx)
 
-        if len(self._attacks) >= 6:  # 24 == 12 rounds worth of attacks (1 per unit).
-            self.disengage(self._attacks[-1])
-            return
+        if not self._keep_attacks:
+            self.game.battle_manager.release_context(ctx)
+
+################################################################################
+    def record_attacks(self, count: int, dealt: Tuple[int, int] = (0, 0)) -> None:
+        """Counts attacks that were resolved in bulk by a
+        :class:`DMCombatKernel`, without a context for each."""
+
+        self._attack_count += count
+        self._damage_dealt[0] += dealt[0]
+        self._damage_dealt[1] += dealt[1]
 
 ################################################################################
     def attack(self, attacker: DMUnit, defender: DMUnit) -> AttackContext:
 
-        ctx = AttackContext(self.game, attacker, defender)
+        ctx = self.game.battle_manager.attack_context(attacker, defender)
 
         self.game.dispatch_event("on_attack", ctx)
 
         ctx.execute()
-        self._attacks.append(ctx)
+        self._attack_count += 1
+        # Redirects only ever change the target.
+        self._damage_dealt[0 if attacker is self._unit1 else 1] += ctx.dealt
+
+        if self._keep_attacks:
+            self._attacks.append(ctx)
 
         return ctx
 
+################################################################################
+    def release_attacks(self) -> List[AttackContext]:
+        """Hands back every kept attack context, for pooling, and forgets
+        them. Only once the encounter is over."""
+
+        attacks = self._attacks[:]
+        self._attacks.clear()
+
+        return attacks
+
 ################################################################################
     def disengage(self, ctx: AttackContext) -> None:
 
+        if not self._in_progress:
+            return
+
         print("Disengaging encounter")
 
         if not ctx.source.is_alive or not ctx.target.is_alive:
@@ -125,5 +234,6 @@ class DMEncounter:
         self._unit2.disengage()
 
         self._in_progress = False
+        self.game.battle_manager.encounter_ended(self)
 
 ################################################################################
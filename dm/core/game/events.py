@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from typing     import TYPE_CHECKING, Callable, Dict, List
 
+from .contexts  import DMContext
 from utilities  import _EVENT_REFERENCE
 
 if TYPE_CHECKING:
     from .game  import DMGame
-    from .contexts import DMContext
 ################################################################################
 
 __all__ = ("DMEventManager", )
@@ -36,6 +36,9 @@ class DMEventManager:
 
     dispatch(event_type: :class:`str`, *context) -> None:
         Notify all subscribers of an event type.
+
+    has_subscribers(event_type: :class:`str`) -> :class:`bool`
+        Check whether anything is subscribed to an event type.
     """
 
     __slots__ = (
@@ -132,11 +135,31 @@ class DMEventManager:
         if event_type not in self._subscribers:
             raise TypeError(f"Invalid event name `{event_type}` passed to EventManager.dispatch().")
 
-        for callback in self._subscribers[event_type]:
+        callbacks = self._subscribers[event_type]
+        if callbacks:
+            # Subscribers are free to hold on to what they're given.
+            for ctx in context:
+                if isinstance(ctx, DMContext):
+                    ctx.mark_published()
+
+        for callback in callbacks:
             try:
                 callback(*context)
             except Exception as e:
                 print(f"Invalid callback |{callback}| found in EventManager.dispatch() for event {event_type}.")
                 continue
 
+################################################################################
+    def has_subscribers(self, event_type: str) -> bool:
+        """Check whether anything is subscribed to an event type, so work
+        that only exists to be dispatched can be skipped.
+
+        Parameters:
+        -----------
+        event_type: :class:`str`
+            The event type to check.
+        """
+
+        return bool(self._subscribers.get(event_type))
+
 ################################################################################
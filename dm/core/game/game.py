@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import io
 import pygame
 import sys
 
+from contextlib     import nullcontext, redirect_stdout
+
 from pygame         import Surface, Vector2
 from pygame.time    import Clock
-from typing         import TYPE_CHECKING, Callable, List, Optional, Tuple, Union
+from typing         import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
 from dm.core.game.battle_mgr    import DMBattleManager
+from dm.core.game.clock         import DMSimClock
 from dm.core.game.dungeon       import DMDungeon
 from dm.core.game.day           import DMDay
 from dm.core.game.events        import DMEventManager
 from dm.core.game.objpool       import DMObjectPool
+from dm.core.game.renderer      import DMRenderer
+from dm.core.game.result        import DMBattleResult
 from dm.core.game.rng           import DMGenerator
 from dm.core.game.state_mgr     import DMStateMachine
+from dm.core.graphics.assets    import finalize_sprites
 from utilities      import *
 
 if TYPE_CHECKING:
@@ -33,12 +40,19 @@ class DMGame:
 
     Attributes:
     -----------
-    _screen: :class:`Surface`
-        The main screen surface.
+    _screen: Optional[:class:`Surface`]
+        The main screen surface. None when running headless.
+
+    _headless: :class:`bool`
+        Whether the game is running without a display. Nothing is drawn and
+        no sprites are loaded, so only the simulation runs.
 
     _clock: :class:`Clock`
         The main game clock.
 
+    _sim_clock: :class:`DMSimClock`
+        The simulation clock. Splits frame time into fixed-length update steps.
+
     _running: :class:`bool`
         Whether or not the game is running. Setting this to True will immediately
         exit the game loop.
@@ -77,6 +91,9 @@ class DMGame:
         The game's random number generator. Responsible for generating random
         numbers and selections.
 
+    _renderer: :class:`DMRenderer`
+        The game's renderer. Responsible for presenting each frame to the display.
+
     Properties:
     -----------
     spawn: :class:`DMObjectPool`
@@ -85,11 +102,23 @@ class DMGame:
     day: :class:`DMDay`
         The game's day object. Contains the current day and other related data.
 
+    headless: :class:`bool`
+        Whether the game is running without a display.
+
+    random: :class:`DMGenerator`
+        The game's master random number generator.
+
     Methods:
     --------
     run() -> None
         Run the game loop.
 
+    simulate(setup: Optional[Callable], max_time: :class:`float`, quiet: :class:`bool`) -> :class:`DMBattleResult`
+        Run a battle to completion as fast as possible and return the outcome.
+
+    stream(name: :class:`str`) -> :class:`DMGenerator`
+        Return a named substream of the game's random number generator.
+
     quit() -> None
         Quit the game.
 
@@ -104,7 +133,9 @@ class DMGame:
 
     __slots__ = (
         "_screen",
+        "_headless",
         "_clock",
+        "_sim_clock",
         "_running",
         "_dungeon",
         "_state_machine",
@@ -116,23 +147,32 @@ class DMGame:
         "_day",
         "_events",
         "_dark_lord",
-        "_rng"
+        "_rng",
+        "_renderer",
     )
 
 ################################################################################
-    def __init__(self):
+    def __init__(self, headless: bool = False, seed: Optional[int] = None, worker: int = 0):
 
-        pygame.init()
+        self._headless: bool = headless
+
+        # Running headless needs neither a window nor any of pygame's modules.
+        if headless:
+            self._screen: Optional[Surface] = None
+        else:
+            pygame.init()
+            self._screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-        self._screen: Surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self._clock: Clock = Clock()
+        self._sim_clock: DMSimClock = DMSimClock(self)
         self._running: bool = True
 
         self._day: DMDay = DMDay(self)
 
         # Order is important here.
-        self._rng: DMGenerator = DMGenerator(self)
+        self._rng: DMGenerator = DMGenerator(self, seed, worker=worker)
         self._events: DMEventManager = DMEventManager(self)
+        self._renderer: DMRenderer = DMRenderer(self)
         self._state_machine: DMStateMachine = DMStateMachine(self)
         self._objpool: DMObjectPool = DMObjectPool(self)
         self._dungeon: DMDungeon = DMDungeon(self)
@@ -150,6 +190,10 @@ class DMGame:
         states, drawing the game states, and handling pygame events.
         """
 
+        # Start decoding every sprite in the background. The menu is shown
+        # and responsive while they load.
+        self._objpool.preload_sprites()
+
         # We have to call this down here so it doesn't run into conflicts with
         # the object pool.
         self._dungeon._map._init_map()
@@ -164,16 +208,143 @@ class DMGame:
             # Check for events in the event queue.
             self.handle_events()
 
-            # Update and draw the current state.
-            self._state_machine.update(dt)
-            self._state_machine.draw(self._screen)
+            # Finish off any sprites that were decoded in the background.
+            finalize_sprites()
 
-            # Flip the display.
-            pygame.display.flip()
+            # Update the current state in fixed-length steps, however long the
+            # frame took, so the simulation doesn't depend on the frame rate.
+            # Faster game speeds run more steps per frame.
+            self._simulate(dt)
+
+            # Draw the current state. Drawing also presents the frame to the
+            # display.
+            self._state_machine.draw(self._screen)
 
         # If we've exited the game loop, quit the game.
         self.quit()
 
+################################################################################
+    def simulate(
+        self,
+        setup: Optional[Callable[[DMGame], None]] = None,
+        max_time: float = 600.0,
+        quiet: bool = True
+    ) -> DMBattleResult:
+        """Runs a battle to completion as fast as possible, without drawing
+        anything, and returns the outcome.
+
+        Intended for headless games, but works on any game that isn't running
+        its own loop.
+
+        Parameters:
+        -----------
+        setup: Optional[Callable[[:class:`DMGame`], None]]
+            Prepares the dungeon before the battle starts, e.g. by deploying
+            monsters. Defaults to the debug state's three Bats.
+
+        max_time: :class:`float`
+            The most simulated time to run for, in seconds, in case the battle
+            never ends.
+
+        quiet: :class:`bool`
+            Whether to silence the battle log printed to stdout.
+
+        Returns:
+        --------
+        :class:`DMBattleResult`
+            The outcome of the battle.
+        """
+
+        # The map is normally built when the game loop starts.
+        if not self._dungeon._map._rows:
+            self._dungeon._map._init_map()
+
+        (setup or self._default_setup)(self)
+        monsters = list(self._dungeon.deployed_monsters)
+
+        kills_by_room: Dict[str, int] = {}
+
+        def record_kill(ctx: DMContext) -> None:
+            for unit in (ctx.source, ctx.target):
+                if unit.is_hero() and not unit.is_alive:
+                    room = "{0:.0f},{1:.0f}".format(*unit.room.grid_pos)
+                    kills_by_room[room] = kills_by_room.get(room, 0) + 1
+
+        clock = self._sim_clock
+        # Nothing will be drawn, so skip the visual-only work entirely.
+        clock.presenting = False
+
+        start = clock.ticks
+        max_ticks = int(max_time / clock.step)
+
+        self.subscribe_event("on_death", record_kill)
+        try:
+            with redirect_stdout(io.StringIO()) if quiet else nullcontext():
+                self._battle_mgr.start_battle("battle")
+                while self._battle_mgr.running and clock.ticks - start < max_ticks:
+                    # With nobody moving, jump straight to the step before
+                    # the next attack or hero spawn.
+                    if self._dungeon.idle:
+                        skip = self._battle_mgr.ticks_until_next_event(clock.step)
+                        if skip:
+                            skip = min(skip, max_ticks - (clock.ticks - start))
+                            self._battle_mgr.skip(skip, clock.step)
+                            clock.tick(skip)
+                            continue
+
+                    self._dungeon.update(clock.step)
+                    self._battle_mgr.update(clock.step)
+                    clock.tick()
+        finally:
+            self.unsubscribe_event("on_death", record_kill)
+
+        ticks = clock.ticks - start
+        spawned = self._battle_mgr.heroes_spawned
+
+        monster_outcomes: Dict[str, List[int]] = {}
+        for monster in monsters:
+            outcome = monster_outcomes.setdefault(monster.name, [0, 0])
+            outcome[0] += 1
+            outcome[1] += monster.is_alive
+
+        return DMBattleResult(
+            seed=self._rng.seed,
+            worker=self._rng.worker,
+            day=self._day.current,
+            finished=not self._battle_mgr.running,
+            ticks=ticks,
+            sim_time=ticks * clock.step,
+            heroes_spawned=spawned,
+            heroes_defeated=spawned - sum(1 for h in self._dungeon.heroes if h.is_alive),
+            monsters_deployed=len(monsters),
+            monsters_defeated=sum(1 for m in monsters if not m.is_alive),
+            kills_by_room=kills_by_room,
+            monster_outcomes=monster_outcomes
+        )
+
+################################################################################
+    @staticmethod
+    def _default_setup(game: DMGame) -> None:
+
+        battle_room = game.get_room_at(Vector2(4, 1))
+        for _ in range(3):
+            battle_room.deploy(game.spawn.monster("Bat", room=Vector2(4, 1)))
+
+################################################################################
+    def _simulate(self, dt: float) -> None:
+
+        clock = self._sim_clock
+
+        steps = clock.advance(dt)
+        for i in range(steps):
+            last = clock.begin_step(i, steps)
+
+            self._state_machine.update(clock.step)
+            clock.tick()
+
+            if last:
+                break
+
 ################################################################################
     def handle_events(self) -> None:
         """Handle pygame events.
@@ -193,6 +364,9 @@ class DMGame:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self._running = False
+            # The window was uncovered, so whatever's on screen is stale.
+            elif event.type == pygame.VIDEOEXPOSE:
+                self._renderer.invalidate()
 
             self._state_machine.handle_event(event)
 
@@ -209,6 +383,21 @@ class DMGame:
         pygame.quit()
         sys.exit()
 
+################################################################################
+    @property
+    def headless(self) -> bool:
+        """Whether the game is running without a display."""
+
+        return self._headless
+
+################################################################################
+    @property
+    def sim_clock(self) -> DMSimClock:
+        """The simulation clock. Responsible for the fixed update steps and
+        how far between them the current frame is drawn."""
+
+        return self._sim_clock
+
 ################################################################################
     @property
     def spawn(self) -> DMObjectPool:
@@ -220,6 +409,27 @@ class DMGame:
 
         return self._objpool
 
+################################################################################
+    @property
+    def renderer(self) -> DMRenderer:
+        """The game's renderer. Responsible for presenting each frame."""
+
+        return self._renderer
+
+################################################################################
+    @property
+    def random(self) -> DMGenerator:
+        """The game's master random number generator."""
+
+        return self._rng
+
+################################################################################
+    def stream(self, name: str) -> DMGenerator:
+        """Returns the named substream of the game's random number generator.
+        See :meth:`DMGenerator.stream`."""
+
+        return self._rng.stream(name)
+
 ################################################################################
     @property
     def day(self) -> DMDay:
@@ -294,6 +504,11 @@ class DMGame:
 
         self._events.dispatch(event, *context)
 
+################################################################################
+    def has_subscribers(self, event: str) -> bool:
+
+        return self._events.has_subscribers(event)
+
 ################################################################################
     def get_room_at(self, pos: Union[Tuple[int, int], Vector2]) -> Optional[DMRoom]:
         """Get the room at a given position in the dungeon grid.
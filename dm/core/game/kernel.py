@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import math
+import numpy as np
+
+from typing     import TYPE_CHECKING, List, Optional, Tuple
+
+from .encounter import DMEncounter
+
+if TYPE_CHECKING:
+    from dm.core.game.game import DMGame
+################################################################################
+
+__all__ = ("DMCombatKernel",)
+
+################################################################################
+class DMCombatKernel:
+    """Resolves many encounters at once, with every engaged unit's combat
+    state held in NumPy arrays rather than read off the units each action.
+
+    Each encounter is a row, and each row has a column per unit. A step
+    finds every unit whose action is due, works out the damage and applies
+    it for all of them in a couple of array passes, then writes the results
+    back to the units.
+
+    No attack context is built for an ordinary attack, so this can only be
+    used while nothing is subscribed to "on_attack". A context is built for
+    the attack that ends an encounter, which is what "on_death" is
+    dispatched with.
+
+    Dex, attack and life are read when an encounter is added. Anything else
+    that changes them mid-fight needs :meth:`release` and a re-add.
+
+    Attributes:
+    -----------
+    _state: :class:`DMGame`
+        The game instance.
+
+    _encounters: List[:class:`DMEncounter`]
+        The encounters being resolved, in row order.
+
+    _order: List[:class:`int`]
+        The order each row's encounter was added in, to break ties when
+        several end on the same step.
+
+    _added: :class:`int`
+        The number of encounters added so far.
+
+    _due: :class:`np.ndarray`
+        When each unit's next action is due, in simulated seconds.
+
+    _dex: :class:`np.ndarray`
+        Each unit's dex, no lower than :attr:`DMEncounter.MIN_DEX`.
+
+    _atk: :class:`np.ndarray`
+        The damage each unit's attack deals.
+
+    _life: :class:`np.ndarray`
+        Each unit's remaining life.
+
+    _attacks: :class:`np.ndarray`
+        The number of attacks made in each encounter.
+
+    _dealt: :class:`np.ndarray`
+        The total damage each unit has dealt, handed to the encounter when
+        it leaves the kernel.
+
+    _ticks: :class:`int`
+        The number of steps taken so far.
+
+    _time: :class:`float`
+        The simulated time, in seconds, worked out from the step count so
+        skipping ahead lands on exactly the same time as stepping.
+
+    _next_due: :class:`float`
+        When the earliest action is due, so steps with nothing due are free.
+
+    Properties:
+    -----------
+    next_due: Optional[:class:`float`]
+        Returns when the next action is due, if any are pending.
+
+    Methods:
+    --------
+    add(encounter: :class:`DMEncounter`) -> None
+        Starts resolving an encounter.
+
+    advance(dt: :class:`float`) -> :class:`int`
+        Moves time forward and resolves every action that comes due.
+
+    ticks_until_next(dt: :class:`float`) -> Optional[:class:`int`]
+        Returns how many steps of the given length can pass before the next
+        action.
+
+    skip(ticks: :class:`int`, dt: :class:`float`) -> None
+        Moves time forward by the given number of steps, with no actions due.
+
+    release() -> List[Tuple[:class:`DMEncounter`, :class:`int`, :class:`float`]]
+        Stops resolving every encounter and returns when each unit's next
+        action is due.
+    """
+
+    __slots__ = (
+        "_state",
+        "_encounters",
+        "_order",
+        "_added",
+        "_due",
+        "_dex",
+        "_atk",
+        "_life",
+        "_attacks",
+        "_dealt",
+        "_ticks",
+        "_time",
+        "_next_due",
+    )
+
+    INITIAL_CAPACITY = 32
+
+################################################################################
+    def __init__(self, state: DMGame):
+
+        self._state: DMGame = state
+
+        self._encounters: List[DMEncounter] = []
+        self._order: List[int] = []
+        self._added: int = 0
+
+        self._due: np.ndarray = np.empty((self.INITIAL_CAPACITY, 2))
+        self._dex: np.ndarray = np.empty((self.INITIAL_CAPACITY, 2))
+        self._atk: np.ndarray = np.empty((self.INITIAL_CAPACITY, 2))
+        self._life: np.ndarray = np.empty((self.INITIAL_CAPACITY, 2))
+        self._attacks: np.ndarray = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._dealt: np.ndarray = np.empty((self.INITIAL_CAPACITY, 2), dtype=np.int64)
+
+        self._ticks: int = 0
+        self._time: float = 0.0
+        self._next_due: float = math.inf
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._encounters)
+
+################################################################################
+    @property
+    def game(self) -> DMGame:
+
+        return self._state
+
+################################################################################
+    @property
+    def next_due(self) -> Optional[float]:
+
+        return self._next_due if self._encounters else None
+
+################################################################################
+    def add(self, encounter: DMEncounter) -> None:
+        """Starts resolving an encounter. Its units' opening actions are
+        scheduled the same way :class:`DMEncounterScheduler` would.
+
+        Parameters:
+        -----------
+        encounter: :class:`DMEncounter`
+            The encounter to resolve.
+        """
+
+        row = len(self._encounters)
+        if row == len(self._attacks):
+            self._grow()
+
+        self._encounters.append(encounter)
+        self._order.append(self._added)
+        self._added += 1
+
+        for col, unit in enumerate((encounter.unit1, encounter.unit2)):
+            self._due[row, col] = self._time + encounter.action_delay(col + 1, first=True)
+            self._dex[row, col] = max(unit.dex, DMEncounter.MIN_DEX)
+            # Matches `AttackContext.damage`, which never goes below zero.
+            self._atk[row, col] = max(unit.attack, 0)
+            self._life[row, col] = unit.life
+
+        self._attacks[row] = 0
+        self._dealt[row] = 0
+        self._next_due = min(self._next_due, self._due[row].min())
+
+################################################################################
+    def advance(self, dt: float) -> int:
+        """Moves time forward and resolves every action that comes due.
+
+        Within an encounter, the unit that was due first acts first, and
+        only the survivor of a killing blow gets to act afterwards.
+
+        Parameters:
+        -----------
+        dt: :class:`float`
+            The length of a step, in seconds. Always the same length.
+
+        Returns:
+        --------
+        :class:`int`
+            The number of actions that were resolved.
+        """
+
+        self._ticks += 1
+        self._time = self._ticks * dt
+        if self._next_due > self._time:
+            return 0
+
+        now = self._time
+        count = len(self._encounters)
+
+        due = self._due[:count]
+        life = self._life[:count]
+        attacks = self._attacks[:count]
+
+        # Column of the unit that acts first in each row. Ties go to unit 1.
+        first = (due[:, 1] < due[:, 0]).astype(np.intp)
+        ended = np.zeros(count, dtype=bool)
+        ended_at = np.empty(count)
+        last_attacker = np.empty(count, dtype=np.intp)
+
+        actions = 0
+        for attacker in (first, 1 - first):
+            rows = np.flatnonzero((due[np.arange(count), attacker] <= now) & ~ended)
+            if rows.size == 0:
+                continue
+
+            source = attacker[rows]
+            target = 1 - source
+            damage = self._atk[rows, source]
+            acted_at = due[rows, source]
+
+            life[rows, target] = np.maximum(life[rows, target] - damage, 0)
+            attacks[rows] += 1
+            self._dealt[rows, source] += damage.astype(np.int64)
+            # The cooldown restarts from when the action actually happened.
+            due[rows, source] = now + DMEncounter.ACTION_CD / self._dex[rows, source]
+
+            finished = rows[(life[rows, target] <= 0) | (attacks[rows] >= DMEncounter.MAX_ATTACKS)]
+            ended[finished] = True
+            ended_at[rows] = acted_at
+            last_attacker[rows] = source
+
+            self._write_back(rows, source, damage)
+            actions += rows.size
+
+        if ended.any():
+            self._finish(np.flatnonzero(ended), ended_at, last_attacker)
+
+        self._next_due = self._due[:len(self._encounters)].min() if self._encounters else math.inf
+
+        return actions
+
+################################################################################
+    def _write_back(self, rows: np.ndarray, source: np.ndarray, damage: np.ndarray) -> None:
+
+        for row, col, amount in zip(rows.tolist(), source.tolist(), damage.tolist()):
+            # Zero damage attacks fail, same as `AttackContext.execute`.
+            if amount <= 0:
+                continue
+
+            encounter = self._encounters[row]
+            attacker, defender = (encounter.unit1, encounter.unit2) if col == 0 else (encounter.unit2, encounter.unit1)
+
+            attacker.play_attack_animation()
+            defender.damage(int(amount))
+
+################################################################################
+    def _finish(self, rows: np.ndarray, ended_at: np.ndarray, last_attacker: np.ndarray) -> None:
+
+        finished = []
+        for row in rows.tolist():
+            encounter = self._encounters[row]
+            encounter.record_attacks(int(self._attacks[row]), self._totals(row))
+            finished.append((ended_at[row], self._order[row], encounter, int(last_attacker[row])))
+
+        # Highest rows first, so swapping the last row in never moves one
+        # that's still to be removed.
+        for row in sorted(rows.tolist(), reverse=True):
+            self._remove(row)
+
+        # Disengaging can start new encounters, so it happens after the rows
+        # are settled, in the order the encounters ended.
+        battle_mgr = self.game.battle_manager
+        for _, _, encounter, col in sorted(finished, key=lambda f: (f[0], f[1])):
+            attacker, defender = (encounter.unit1, encounter.unit2) if col == 0 else (encounter.unit2, encounter.unit1)
+            ctx = battle_mgr.attack_context(attacker, defender)
+            encounter.disengage(ctx)
+            battle_mgr.release_context(ctx)
+
+################################################################################
+    def _totals(self, row: int) -> Tuple[int, int]:
+
+        return int(self._dealt[row, 0]), int(self._dealt[row, 1])
+
+################################################################################
+    def _remove(self, row: int) -> None:
+
+        last = len(self._encounters) - 1
+        if row != last:
+            self._encounters[row] = self._encounters[last]
+            self._order[row] = self._order[last]
+            for array in (self._due, self._dex, self._atk, self._life, self._attacks, self._dealt):
+                array[row] = array[last]
+
+        self._encounters.pop()
+        self._order.pop()
+
+################################################################################
+    def _grow(self) -> None:
+
+        capacity = len(self._attacks) * 2
+
+        for name in ("_due", "_dex", "_atk", "_life", "_attacks", "_dealt"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+################################################################################
+    def ticks_until_next(self, dt: float) -> Optional[int]:
+        """Returns how many steps of the given length can pass without an
+        action coming due, or None if nothing is scheduled. Errs on the side
+        of fewer, so skipping that many never jumps past an action."""
+
+        if not self._encounters or math.isinf(self._next_due):
+            return None
+
+        return max(math.floor((self._next_due - self._time) / dt) - 1, 0)
+
+################################################################################
+    def skip(self, ticks: int, dt: float) -> None:
+
+        self._ticks += ticks
+        self._time = self._ticks * dt
+
+################################################################################
+    def release(self) -> List[Tuple[DMEncounter, int, float]]:
+        """Stops resolving every encounter, e.g. because something started
+        listening to "on_attack" and needs a context for each attack.
+
+        Returns:
+        --------
+        List[Tuple[:class:`DMEncounter`, :class:`int`, :class:`float`]]
+            Each encounter, which of its units, and how long until that
+            unit's next action, for every unit.
+        """
+
+        released = []
+        for row, encounter in enumerate(self._encounters):
+            encounter.record_attacks(int(self._attacks[row]), self._totals(row))
+            for col in (0, 1):
+                released.append((encounter, col + 1, max(self._due[row, col] - self._time, 0.0)))
+
+        self._encounters.clear()
+        self._order.clear()
+        self._next_due = math.inf
+
+        return released
+
+################################################################################
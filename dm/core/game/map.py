@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pygame import Surface, Vector2
+from pygame import Rect, Surface, Vector2
 from typing import TYPE_CHECKING, List, Optional, Type, Union
 
 from utilities import *
@@ -63,6 +63,8 @@ class DMDungeonMap:
         "_state",
         "_rows",
         "_highlighting",
+        "_layer",
+        "_stale",
     )
 
 ################################################################################
@@ -70,6 +72,10 @@ class DMDungeonMap:
 
         self._state: DMGame = state
         self._rows: List[DMMapRow] = []
+        # Every room drawn onto a cleared screen-sized surface, which is only
+        # redrawn where rooms change, and the areas waiting to be redrawn.
+        self._layer: Optional[Surface] = None
+        self._stale: List[Rect] = []
 
 ################################################################################
     def __getitem__(self, idx: int) -> DMMapRow:
@@ -85,6 +91,14 @@ class DMDungeonMap:
 
         return self._state
 
+################################################################################
+    @property
+    def layer(self) -> Surface:
+        """The cached map layer, brought up to date first."""
+
+        self.refresh_layer()
+        return self._layer  # type: ignore
+
 ################################################################################
     @property
     def deployed_monsters(self) -> List[DMMonster]:
@@ -111,7 +125,23 @@ class DMDungeonMap:
 ################################################################################
     def deploy(self, room: DMRoom, position: Vector2):
 
-        self._rows[int(position.y)]._rooms[int(position.x)] = room
+        row = self._rows[int(position.y)]._rooms
+
+        previous = row[int(position.x)]
+        if previous is not None:
+            self._stale.append(previous._graphics.bounds)
+
+        row[int(position.x)] = room
+        self._stale.append(room._graphics.bounds)
+
+################################################################################
+    def invalidate(self, position: Vector2) -> None:
+        """Marks the room at the given position to be redrawn onto the cached
+        map layer, e.g. after its sprite changes."""
+
+        room = self.get_room(position)
+        if room is not None:
+            self._stale.append(room._graphics.bounds)
 
 ################################################################################
     def get_room(self, position: Vector2) -> Optional[DMRoom]:
@@ -119,16 +149,58 @@ class DMDungeonMap:
         if not isinstance(position, Vector2):
             raise TypeError(f"Invalid position type: {type(position)}")
 
+        x, y = int(position.x), int(position.y)
+        # Negative indices would wrap around to the far side of the map.
+        if x < 0 or y < 0:
+            return None
+
         try:
-            return self._rows[int(position.y)]._rooms[int(position.x)]
+            return self._rows[y]._rooms[x]
         except IndexError:
             return None
 
 ################################################################################
     def draw(self, surface: Surface):
 
-        for row in self._rows:
-            row.draw(surface)
+        surface.blit(self.layer, (0, 0))
+
+################################################################################
+    def refresh_layer(self) -> List[Rect]:
+        """Redraws whatever's changed on the cached map layer.
+
+        Returns:
+        --------
+        List[:class:`Rect`]
+            The areas that were redrawn.
+        """
+
+        if self._layer is None:
+            self._layer = Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self._layer.fill(BLACK)
+            for row in self._rows:
+                row.draw(self._layer)
+
+            self._stale.clear()
+            return [self._layer.get_rect()]
+
+        if not self._stale:
+            return []
+
+        changed = self._stale
+        self._stale = []
+
+        rooms = self.all_rooms
+        for area in changed:
+            # Anything that overlaps the area gets redrawn, clipped to it, so
+            # oversized sprites next door come out whole.
+            self._layer.set_clip(area)
+            self._layer.fill(BLACK)
+            for room in rooms:
+                if room._graphics.bounds.colliderect(area):
+                    room.draw(self._layer)
+        self._layer.set_clip(None)
+
+        return changed
 
 ################################################################################
     @property
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import random
+import numpy as np
 
 from pygame         import Surface, Vector2
 from typing     import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Union
@@ -13,6 +13,12 @@ from ...monsters    import ALL_MONSTERS
 from ...rooms       import ALL_ROOMS
 # from ...statuses    import ALL_STATUSES
 
+from dm.core.game.prototype import DMPrototype
+from dm.core.game.recycler  import DMRecycler
+from dm.core.graphics.assets    import SpriteRequest, preload_sprites, prune_sprite_cache
+from dm.core.graphics.hero      import HeroGraphical
+from dm.core.graphics.monster   import MonsterGraphical
+from dm.core.graphics.room      import DMRoomGraphics
 from utilities      import *
 
 if TYPE_CHECKING:
@@ -21,6 +27,7 @@ if TYPE_CHECKING:
     from dm.core.objects.object import DMObject
     from dm.core.objects.monster import DMMonster
     from dm.core.objects.hero import DMHero
+    from dm.core.objects.unit import DMUnit
 ################################################################################
 
 __all__ = ("DMObjectPool",)
@@ -28,9 +35,25 @@ __all__ = ("DMObjectPool",)
 ################################################################################
 class DMObjectPool:
 
+    # Spawn types that have base weights, in the order they're stored in the
+    # precomputed weight table.
+    _WEIGHTED_TYPES = (
+        SpawnType.Monster,
+        SpawnType.Hero,
+        SpawnType.Relic,
+        SpawnType.Fate,
+        SpawnType.Room,
+    )
+
     __slots__ = (
         "_state",
         "__master",
+        "__by_name",
+        "__by_id",
+        "__by_rank",
+        "__weights",
+        "__weight_table",
+        "__recycler",
         "__monster_types",
         "__hero_types",
         "__room_types",
@@ -46,7 +69,7 @@ class DMObjectPool:
     )
 
 ################################################################################
-    def __init__(self, state: DMGame):
+    def __init__(self, state: DMGame, precompute_weights: bool = False):
 
         self._state: DMGame = state
 
@@ -57,18 +80,20 @@ class DMObjectPool:
         # self.__relic_types: List[Type[DMRelic]] = ALL_RELICS.copy()
         # self.__fate_types: List[Type[DMFateCard]] = SPAWNABLE_FATES.copy()
 
-        self.__monsters: List[DMMonster] = [m(self._state) for m in self.__monster_types]  # type: ignore
-        self.__heroes: List[DMHero] = [h(self._state) for h in self.__hero_types]  # type: ignore
-        self.__rooms: List[DMRoom] = [r(self._state, Vector2()) for r in self.__room_types]  # type: ignore
+        # Only the metadata is read up front. Each object (and its graphics)
+        # is built the first time something is spawned from it.
+        self.__monsters: List[DMPrototype] = [DMPrototype(self._state, m) for m in self.__monster_types]
+        self.__heroes: List[DMPrototype] = [DMPrototype(self._state, h) for h in self.__hero_types]
+        self.__rooms: List[DMPrototype] = [DMPrototype(self._state, r, Vector2()) for r in self.__room_types]
         # self.__statuses: List[DMStatus] = [s(self._state, None) for s in self.__status_types]  # type: ignore
         # self.__relics: List[DMRelic] = [relic(self._state) for relic in self.__relic_types]  # type: ignore
         # self.__fates: List[DMFateCard] = [f(self._state, 0, 0) for f in self.__fate_types]  # type: ignore
 
-        self.__master: List[DMObject] = [  # type: ignore
+        self.__master: List[DMPrototype] = (
             self.__rooms.copy() +
             self.__monsters.copy() +  # type: ignore
             self.__heroes.copy()
-        ]
+        )
         #
         #     self.__heroes.copy() +
         #     self.__relics.copy() +
@@ -76,6 +101,48 @@ class DMObjectPool:
         #     [f(self._state, 0, 0) for f in ALL_FATES].copy()  # type: ignore
         # )
 
+        # Lookup indexes for each spawn type, plus one for the full pool that's
+        # used to suggest alternatives when a spawn isn't found.
+        self.__by_name: Dict[Optional[SpawnType], Dict[str, List[DMPrototype]]] = {}
+        self.__by_id: Dict[Optional[SpawnType], Dict[str, List[DMPrototype]]] = {}
+        self.__by_rank: Dict[SpawnType, Dict[int, List[DMPrototype]]] = {}
+
+        self._build_indexes()
+
+        # Spawn weights only depend on the spawn type and the day, so they're
+        # cached per (type, day) until the day advances.
+        self.__weights: Dict[Tuple[SpawnType, int], Dict[int, float]] = {}
+        self.__weight_table: Optional[np.ndarray] = None
+
+        if precompute_weights:
+            self.precompute_weights()
+
+        # Retired heroes and monsters, reused by later spawns of the same class.
+        self.__recycler: DMRecycler = DMRecycler()
+
+################################################################################
+    def _build_indexes(self) -> None:
+        """Builds the name, ID and rank indexes used to look up spawns."""
+
+        sources = {
+            SpawnType.Room: self.__rooms,
+            SpawnType.Monster: self.__monsters,
+            SpawnType.Hero: self.__heroes,
+            None: self.__master,
+        }
+
+        for spawn_type, source in sources.items():
+            by_name = self.__by_name[spawn_type] = {}
+            by_id = self.__by_id[spawn_type] = {}
+            for proto in source:
+                by_name.setdefault(proto.name, []).append(proto)
+                by_id.setdefault(proto._id, []).append(proto)
+
+            if spawn_type is not None:
+                by_rank = self.__by_rank[spawn_type] = {}
+                for proto in source:
+                    by_rank.setdefault(proto.rank, []).append(proto)
+
 ################################################################################
     def room(
         self,
@@ -172,25 +239,22 @@ class DMObjectPool:
 
         # Try spawning by name or object ID if provided.
         if _n is not None or obj_id is not None:
-            # Get the source list depending on the spawn type.
-            # We only get the source list instead of the full object pool
+            # Look up matches in the indexes for the spawn type.
+            # We only search the spawn type's index instead of the full object pool
             # because some objects have the same basic name. For example,
             # "Panic" is the name of a status as well as a room, so we need
-            # to know which source list to search. That's not to say we won't
+            # to know which index to search. That's not to say we won't
             # have to search the full object pool later, but we can at least
-            # narrow it down to a single list first.
-            source = self._get_source_list(spawn_type)
-            # Get a list of matches for the current source list.
-            matches = [o for o in source if o.name == _n or o._id == obj_id]
+            # narrow it down to a single index first.
+            matches = self._lookup(spawn_type, _n, obj_id)
             # If no matches were found, first search the full object pool to
             # see if the object exists but is not in the current source list.
             # (And raise an error to that extent if it is.)
             if len(matches) == 0:
                 fallback = [
-                    o.__class__.__name__ for o in self.__master
-                    if o.name == _n or o._id == obj_id
+                    p.cls.__name__ for p in self._lookup(None, _n, obj_id)
                 ]
-                raise SpawnNotFound(_n or obj_id, "room", fallback)
+                raise SpawnNotFound(_n or obj_id, spawn_type.name.lower(), fallback)
             elif len(matches) > 1:
                 raise ValueError(
                     f"Multiple objets with name |{_n}| or ID |{obj_id}| "
@@ -200,9 +264,9 @@ class DMObjectPool:
             # If an object was found, return it, initialized or not
             # depending on parameters.
             if init_obj:
-                return matches[0]._copy(**kwargs)
+                return self._spawn_object(matches[0], **kwargs)
             else:
-                return matches[0].__class__
+                return matches[0].cls
 
         # Otherwise, spawn a random room.
         return self._spawn_random(  # type: ignore
@@ -226,41 +290,103 @@ class DMObjectPool:
     ) -> Union[DMObject, Type[DMObject]]:
         """Spawns a random object of the given type."""
 
-        # Get a dict of all objects mapped to their ranks.
-        objs = {}
-        for obj in self._get_source_list(obj_type):
-            try:
-                objs[obj.rank].append(type(obj))
-            except KeyError:
-                objs[obj.rank] = [type(obj)]
-
         # Get the eligible objects based on the provided start and end ranks.
-        eligible_objs = {rank: objs[rank] for rank in range(start_rank, end_rank + 1)}
+        try:
+            objs = self.__by_rank[obj_type]
+        except KeyError:
+            raise ValueError(f"Invalid spawn type |{obj_type}|.")
+
+        eligible_objs = {
+            rank: objs[rank] for rank in range(start_rank, end_rank + 1) if rank in objs
+        }
         if not eligible_objs:
             raise ValueError(
                 f"No eligible objects of type |{obj_type}| found in ObjectPool._spawn_random()."
             )
 
-        # Get weights if weighted is True.
-        eligible_weights = None
+        # Spawning draws from its own substream so that adding rolls elsewhere
+        # doesn't change what gets spawned for a given seed.
+        rng = self._state.stream("spawning")
+        ranks = list(eligible_objs.keys())
+
+        # Pick a rank, weighted if requested, then a type within that rank.
         if weighted:
             weights = self._generate_weights(obj_type)
-            eligible_weights = [weights[rank] for rank in range(start_rank, end_rank + 1)]
-
-        # Going to use Python's random here instead of our own RNG because it
-        # already accepts the weights in this configuration. <_<
-        chosen_idx = random.choices(
-            list(eligible_objs.keys()), weights=eligible_weights, k=1
-        )[0]
-        result = eligible_objs[chosen_idx]
+            # The weights are memoized per type and day, and the ranks follow
+            # from the requested range, so the alias table can be reused too.
+            key = (obj_type, self._state.day.current, start_rank, end_rank)
+            chosen_rank = ranks[rng.weighted_index([weights[rank] for rank in ranks], key=key)]
+        else:
+            chosen_rank = rng.choice(ranks)
+        result = rng.choice(eligible_objs[chosen_rank])
 
         if not init_obj:
-            return result
+            return result.cls
 
-        return result(self._state)._copy(**kwargs)
+        return self._spawn_object(result, **kwargs)
 
 ################################################################################
-    def _get_source_list(self, spawn_type: SpawnType) -> List[DMObject]:
+    def _spawn_object(self, proto: DMPrototype, **kwargs) -> DMObject:
+        """Returns a ready-to-use object from the given prototype, reusing a
+        retired unit of the same class if there is one."""
+
+        if proto.cls.is_monster() or proto.cls.is_hero():
+            unit = self.__recycler.acquire(proto.cls)  # type: ignore
+            if unit is not None:
+                unit._recycle(**kwargs)
+                return unit
+
+        return proto.spawn(**kwargs)
+
+################################################################################
+    @property
+    def recycler(self) -> DMRecycler:
+        """The pool's unit recycler. Exposes the hit, miss and size counters."""
+
+        return self.__recycler
+
+################################################################################
+    def recycle(self, unit: DMUnit) -> None:
+        """Retires a unit so a later spawn of the same class can reuse it.
+
+        Parameters:
+        -----------
+        unit: :class:`DMUnit`
+            The unit to retire. Nothing else in the game should still be
+            holding on to it. Retained units are left alone.
+        """
+
+        if not unit.retained:
+            self.__recycler.release(unit)
+
+################################################################################
+    def _lookup(
+        self,
+        spawn_type: Optional[SpawnType],
+        _n: Optional[str],
+        obj_id: Optional[str]
+    ) -> List[DMPrototype]:
+        """Returns every prototype of the given spawn type that matches either the
+        name or the object ID. A spawn type of None searches the full pool."""
+
+        try:
+            by_name = self.__by_name[spawn_type]
+            by_id = self.__by_id[spawn_type]
+        except KeyError:
+            raise ValueError(f"Invalid spawn type |{spawn_type}|.")
+
+        matches = by_name.get(_n, []) if _n is not None else []
+        if obj_id is not None:
+            id_matches = by_id.get(obj_id, [])
+            if not matches:
+                return id_matches
+            # Searching by both shouldn't count the same object twice.
+            matches = matches + [o for o in id_matches if all(o is not m for m in matches)]
+
+        return matches
+
+################################################################################
+    def _get_source_list(self, spawn_type: SpawnType) -> List[DMPrototype]:
 
         if spawn_type is SpawnType.Room:
             return self.__rooms
@@ -277,6 +403,40 @@ class DMObjectPool:
         else:
             raise ValueError(f"Invalid spawn type |{spawn_type}|.")
 
+################################################################################
+    @staticmethod
+    def sprite_requests() -> List[SpriteRequest]:
+        """Returns every sprite the pool's objects load, without building any
+        of them. Rooms come first, since the map needs them before anything
+        else."""
+
+        requests: List[SpriteRequest] = []
+        for room in ALL_ROOMS:
+            requests.extend(DMRoomGraphics.sprite_requests(room))
+        for monster in ALL_MONSTERS:
+            requests.extend(MonsterGraphical.sprite_requests(monster))
+        for hero in ALL_HEROES:
+            requests.extend(HeroGraphical.sprite_requests(hero))
+
+        return requests
+
+################################################################################
+    def preload_sprites(self) -> int:
+        """Starts decoding the sprites for everything in the pool on a
+        background thread pool, so the game stays responsive while they load.
+
+        The disk cache is trimmed to size first.
+
+        Returns:
+        --------
+        :class:`int`
+            The number of sprites that were queued.
+        """
+
+        prune_sprite_cache()
+
+        return preload_sprites(self.sprite_requests())
+
 ################################################################################
     def _generate_weights(self, spawn_type: SpawnType) -> Dict[int, float]:
         """Generates a weight mapping for the given spawn type based on the current day.
@@ -304,14 +464,39 @@ class DMObjectPool:
         Where `start_weight` and `end_weight` are the weights for the first and last
         ranks respectively, `current_day` is the current day, and `max_day` is the
         maximum day to consider.
+
+        The result is cached for the current day, so the returned mapping is
+        shared and must not be modified.
         """
-        # Define the start and end weights for each rank
+
+        day = self._state.day.current
+        key = (spawn_type, day)
+
+        try:
+            return self.__weights[key]
+        except KeyError:
+            pass
+
         rank_weights = self._base_weights(spawn_type)
 
-        # Calculate the weight for each rank based on the current day
+        if self.__weight_table is not None and 1 <= day <= MAX_DAY:
+            row = self.__weight_table[self._WEIGHTED_TYPES.index(spawn_type), day].tolist()
+            weights = {rank: row[rank] for rank in rank_weights}
+        else:
+            weights = self._calculate_weights(rank_weights, day)
+
+        self.__weights[key] = weights
+        return weights
+
+################################################################################
+    @staticmethod
+    def _calculate_weights(rank_weights: Dict[int, Tuple[int, int]], day: int) -> Dict[int, float]:
+        """Calculates the normalized weight of each rank for the given day."""
+
+        # Calculate the weight for each rank based on the day
         weights = {}
         for rank, (start_weight, end_weight) in rank_weights.items():
-            weight = start_weight + ((end_weight - start_weight) * (self._state.day.current / 2000))  # 2000 is the "max" day
+            weight = start_weight + ((end_weight - start_weight) * (day / MAX_DAY))
             weights[rank] = weight
 
         # Normalize the weights so they sum to 1
@@ -320,6 +505,49 @@ class DMObjectPool:
 
         return normalized_weights
 
+################################################################################
+    def precompute_weights(self) -> None:
+        """Precomputes the spawn weights of every weighted spawn type for every
+        day from 1 to :const:`MAX_DAY` as a single array.
+
+        The array is indexed by `[type, day, rank]`, and holds the same values
+        as :meth:`_generate_weights` would calculate. Days past the end of the
+        table are still calculated on demand.
+        """
+
+        days = np.arange(MAX_DAY + 1, dtype=np.float64) / MAX_DAY
+        max_rank = max(
+            max(self._base_weights(t).keys()) for t in self._WEIGHTED_TYPES
+        )
+
+        table = np.zeros((len(self._WEIGHTED_TYPES), MAX_DAY + 1, max_rank + 1))
+        for i, spawn_type in enumerate(self._WEIGHTED_TYPES):
+            rank_weights = self._base_weights(spawn_type)
+
+            columns = {
+                rank: start_weight + ((end_weight - start_weight) * days)
+                for rank, (start_weight, end_weight) in rank_weights.items()
+            }
+            # Summed in rank order to match `sum()` in `_calculate_weights()`.
+            total_weight = 0
+            for column in columns.values():
+                total_weight = total_weight + column
+
+            for rank, column in columns.items():
+                table[i, :, rank] = column / total_weight
+
+        self.__weight_table = table
+
+        # Anything already cached came from the same formula, but drop it
+        # anyway so every lookup goes through the table from now on.
+        self.__weights.clear()
+
+################################################################################
+    def clear_weight_cache(self) -> None:
+        """Drops the cached spawn weights. Called when the day advances."""
+
+        self.__weights.clear()
+
 ################################################################################
     @staticmethod
     def _base_weights(_type: SpawnType) -> Dict[int, Tuple[int, int]]:
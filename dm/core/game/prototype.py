@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing     import TYPE_CHECKING, Any, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from dm.core.game.game import DMGame
+    from dm.core.objects.object import DMObject
+################################################################################
+
+__all__ = ("DMPrototype",)
+
+################################################################################
+class DMPrototype:
+    """A lightweight stand-in for an object in the object pool.
+
+    Holds only the metadata needed to look up and pick a spawn, read from
+    the class's `OBJ_ID`, `NAME` and `RANK` attributes. The full object,
+    along with its graphics, is only created the first time something is
+    actually spawned from it.
+
+    Attributes:
+    -----------
+    _state: :class:`DMGame`
+        The game state the prototype's instance will belong to.
+
+    _cls: Type[:class:`DMObject`]
+        The class the prototype stands in for.
+
+    _args: Tuple[:class:`Any`, ...]
+        The positional arguments the class is constructed with, after the game state.
+
+    _id: :class:`str`
+        The object ID of the class.
+
+    _name: :class:`str`
+        The name of the class.
+
+    _rank: :class:`int`
+        The rank of the class.
+
+    _instance: Optional[:class:`DMObject`]
+        The materialized instance, once it's been needed.
+
+    Properties:
+    -----------
+    cls: Type[:class:`DMObject`]
+        Returns the class the prototype stands in for.
+
+    name: :class:`str`
+        Returns the name of the class.
+
+    rank: :class:`int`
+        Returns the rank of the class.
+
+    loaded: :class:`bool`
+        Returns whether the instance has been materialized yet.
+
+    instance: :class:`DMObject`
+        Returns the instance, materializing it if needed.
+
+    Methods:
+    --------
+    spawn(**kwargs) -> :class:`DMObject`
+        Returns a fresh copy of the instance with the given kwargs.
+    """
+
+    __slots__ = (
+        "_state",
+        "_cls",
+        "_args",
+        "_id",
+        "_name",
+        "_rank",
+        "_instance",
+    )
+
+################################################################################
+    def __init__(self, state: DMGame, cls: Type[DMObject], *args: Any):
+
+        self._state: DMGame = state
+        self._cls: Type[DMObject] = cls
+        self._args: Tuple[Any, ...] = args
+
+        self._instance: Optional[DMObject] = None
+
+        if cls.OBJ_ID is None:
+            # No metadata declared on the class, so there's no way around
+            # building it up front.
+            self._instance = cls(state, *args)  # type: ignore
+            self._id = self._instance._id
+            self._name = self._instance.name
+            self._rank = self._instance.rank
+        else:
+            self._id = cls.OBJ_ID
+            self._name = cls.NAME
+            self._rank = cls.RANK
+
+################################################################################
+    @property
+    def cls(self) -> Type[DMObject]:
+
+        return self._cls
+
+################################################################################
+    @property
+    def name(self) -> str:
+
+        return self._name
+
+################################################################################
+    @property
+    def rank(self) -> int:
+
+        return self._rank
+
+################################################################################
+    @property
+    def loaded(self) -> bool:
+
+        return self._instance is not None
+
+################################################################################
+    @property
+    def instance(self) -> DMObject:
+        """Returns the instance, building it (and loading its graphics) on
+        first use."""
+
+        if self._instance is None:
+            self._instance = self._cls(self._state, *self._args)  # type: ignore
+
+        return self._instance
+
+################################################################################
+    def spawn(self, **kwargs) -> DMObject:
+        """Returns a fresh copy of the instance with any given kwargs
+        substituted in.
+
+        Parameters:
+        -----------
+        kwargs: :class:`dict`
+            The keyword arguments passed through to the instance's `_copy()`.
+
+        Returns:
+        --------
+        :class:`DMObject`
+            The new object.
+        """
+
+        return self.instance._copy(**kwargs)
+
+################################################################################
+    def __repr__(self) -> str:
+
+        return f"<DMPrototype {self._id} ({self._cls.__name__})>"
+
+################################################################################
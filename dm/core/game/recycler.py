@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing     import Any, Dict, List, Optional, Set, Type, TypeVar
+
+################################################################################
+
+__all__ = ("DMRecycler",)
+
+T = TypeVar("T")
+
+################################################################################
+class DMRecycler:
+    """Per-class free lists of retired objects, so they can be reused
+    instead of built from scratch. Used for units, as well as the battle
+    manager's encounters and attack contexts.
+
+    Attributes:
+    -----------
+    _free: Dict[Type[Any], List[Any]]
+        The retired objects waiting to be reused, by class.
+
+    _held: Set[:class:`int`]
+        The id() of every object in the free lists, so releasing one twice
+        is caught without searching.
+
+    _capacity: :class:`int`
+        The most objects kept for any one class. Anything past that is left
+        for the garbage collector.
+
+    _hits: :class:`int`
+        The number of acquires that reused a retired object.
+
+    _misses: :class:`int`
+        The number of acquires that found nothing to reuse.
+
+    Properties:
+    -----------
+    hits: :class:`int`
+        Returns the number of acquires that reused a retired object.
+
+    misses: :class:`int`
+        Returns the number of acquires that found nothing to reuse.
+
+    size: :class:`int`
+        Returns the number of retired objects currently waiting to be reused.
+
+    Methods:
+    --------
+    acquire(cls: Type[T]) -> Optional[T]
+        Returns a retired object of the given class, if one is available.
+
+    release(obj: Any) -> None
+        Returns an object to its class's free list.
+
+    clear() -> None
+        Drops every retired object and resets the counters.
+    """
+
+    __slots__ = (
+        "_free",
+        "_held",
+        "_capacity",
+        "_hits",
+        "_misses",
+    )
+
+    DEFAULT_CAPACITY = 64  # A full late-game wave of a single hero type.
+
+################################################################################
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+
+        self._free: Dict[Type[Any], List[Any]] = {}
+        self._held: Set[int] = set()
+        self._capacity: int = capacity
+
+        self._hits: int = 0
+        self._misses: int = 0
+
+################################################################################
+    @property
+    def hits(self) -> int:
+
+        return self._hits
+
+################################################################################
+    @property
+    def misses(self) -> int:
+
+        return self._misses
+
+################################################################################
+    @property
+    def size(self) -> int:
+
+        return sum(len(free) for free in self._free.values())
+
+################################################################################
+    def acquire(self, cls: Type[T]) -> Optional[T]:
+        """Returns a retired object of the given class, if one is available.
+
+        The object still needs to be readied before use, e.g. with
+        `_recycle()` for units.
+
+        Parameters:
+        -----------
+        cls: Type[T]
+            The class of object to look for.
+
+        Returns:
+        --------
+        Optional[T]
+            A retired object, or None if the class's free list is empty.
+        """
+
+        free = self._free.get(cls)
+        if not free:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        obj = free.pop()
+        self._held.discard(id(obj))
+
+        return obj
+
+################################################################################
+    def release(self, obj: Any) -> None:
+        """Returns an object to its class's free list.
+
+        Parameters:
+        -----------
+        obj: Any
+            The object to retire. Nothing else may still be using it.
+        """
+
+        free = self._free.setdefault(type(obj), [])
+        if len(free) < self._capacity and id(obj) not in self._held:
+            free.append(obj)
+            self._held.add(id(obj))
+
+################################################################################
+    def clear(self) -> None:
+
+        self._free.clear()
+        self._held.clear()
+
+        self._hits = 0
+        self._misses = 0
+
+################################################################################
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pygame
+
+from pygame     import Rect
+from typing     import TYPE_CHECKING, List
+
+from utilities  import *
+
+if TYPE_CHECKING:
+    from dm.core.game.game import DMGame
+################################################################################
+
+__all__ = ("DMRenderer",)
+
+################################################################################
+class DMRenderer:
+    """Presents each frame to the display exactly once, updating only the
+    parts of the screen that changed when it can.
+
+    States that track their own changes mark dirty rects as they draw, and
+    only those are sent to the display. Anything else, or a frame where the
+    dirty area gets too large to be worth it, falls back to a full flip.
+
+    Attributes:
+    -----------
+    _state: :class:`DMGame`
+        The game instance.
+
+    _dirty: List[:class:`Rect`]
+        The screen areas that changed this frame.
+
+    _full: :class:`bool`
+        Whether the whole screen needs to be redrawn and presented this frame.
+
+    _threshold: :class:`float`
+        The fraction of the screen the dirty rects can cover before a full
+        flip is used instead.
+
+    Properties:
+    -----------
+    full_redraw: :class:`bool`
+        Returns whether the whole screen needs to be redrawn this frame.
+
+    Methods:
+    --------
+    invalidate() -> None
+        Requests a full redraw for the current frame.
+
+    mark_dirty(*rects: :class:`Rect`) -> None
+        Marks areas of the screen as changed this frame.
+
+    present() -> None
+        Sends the frame to the display.
+    """
+
+    __slots__ = (
+        "_state",
+        "_dirty",
+        "_full",
+        "_threshold",
+    )
+
+    FULL_REDRAW_THRESHOLD = 0.35
+
+################################################################################
+    def __init__(self, state: DMGame, threshold: float = FULL_REDRAW_THRESHOLD):
+
+        self._state: DMGame = state
+
+        self._dirty: List[Rect] = []
+        self._full: bool = True
+        self._threshold: float = threshold
+
+################################################################################
+    @property
+    def full_redraw(self) -> bool:
+
+        return self._full
+
+################################################################################
+    def invalidate(self) -> None:
+        """Requests a full redraw for the current frame."""
+
+        self._full = True
+
+################################################################################
+    def mark_dirty(self, *rects: Rect) -> None:
+
+        self._dirty.extend(rects)
+
+################################################################################
+    def present(self) -> None:
+        """Sends the frame to the display, then resets for the next one.
+
+        The dirty rects are sent with `pygame.display.update()` unless a full
+        redraw was requested or they cover more of the screen than the
+        threshold allows, in which case the whole display is flipped.
+        """
+
+        if self._full or self._dirty_area() > self._threshold * SCREEN_WIDTH * SCREEN_HEIGHT:
+            pygame.display.flip()
+        elif self._dirty:
+            pygame.display.update(self._dirty)
+
+        self._dirty.clear()
+        self._full = False
+
+################################################################################
+    def _dirty_area(self) -> int:
+
+        # Overlaps get counted twice, which only errs toward a full flip.
+        return sum(r.w * r.h for r in self._dirty)
+
+################################################################################
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing     import Any, Dict, List, Optional
+
+################################################################################
+
+__all__ = ("DMBattleResult",)
+
+################################################################################
+class DMBattleResult:
+    """The outcome of a headless battle run.
+
+    Attributes:
+    -----------
+    seed: Optional[:class:`int`]
+        The seed the game's random number generator was started with.
+
+    worker: :class:`int`
+        The generator's worker index. Together with the seed, reproduces the run.
+
+    day: :class:`int`
+        The day the battle took place on.
+
+    finished: :class:`bool`
+        Whether the battle ended on its own, rather than running out of time.
+
+    ticks: :class:`int`
+        The number of simulation steps that were run.
+
+    sim_time: :class:`float`
+        The simulated time the battle took, in seconds.
+
+    heroes_spawned: :class:`int`
+        The number of heroes that entered the dungeon.
+
+    heroes_defeated: :class:`int`
+        The number of those heroes that were killed.
+
+    monsters_deployed: :class:`int`
+        The number of monsters deployed in the dungeon.
+
+    monsters_defeated: :class:`int`
+        The number of those monsters that were killed.
+
+    kills_by_room: Dict[:class:`str`, :class:`int`]
+        The number of heroes killed in each room, keyed by "x,y" grid position.
+
+    monster_outcomes: Dict[:class:`str`, List[:class:`int`]]
+        The number of each monster deployed and the number that survived,
+        keyed by monster name.
+
+    Properties:
+    -----------
+    won: :class:`bool`
+        Returns whether the dungeon held, i.e. every hero was defeated.
+
+    Methods:
+    --------
+    to_dict() -> Dict[:class:`str`, Any]
+        Returns the result as a plain dictionary.
+    """
+
+    __slots__ = (
+        "seed",
+        "worker",
+        "day",
+        "finished",
+        "ticks",
+        "sim_time",
+        "heroes_spawned",
+        "heroes_defeated",
+        "monsters_deployed",
+        "monsters_defeated",
+        "kills_by_room",
+        "monster_outcomes",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        seed: Optional[int],
+        worker: int,
+        day: int,
+        finished: bool,
+        ticks: int,
+        sim_time: float,
+        heroes_spawned: int,
+        heroes_defeated: int,
+        monsters_deployed: int,
+        monsters_defeated: int,
+        kills_by_room: Dict[str, int],
+        monster_outcomes: Dict[str, List[int]]
+    ):
+
+        self.seed: Optional[int] = seed
+        self.worker: int = worker
+        self.day: int = day
+        self.finished: bool = finished
+        self.ticks: int = ticks
+        self.sim_time: float = sim_time
+
+        self.heroes_spawned: int = heroes_spawned
+        self.heroes_defeated: int = heroes_defeated
+        self.monsters_deployed: int = monsters_deployed
+        self.monsters_defeated: int = monsters_defeated
+
+        self.kills_by_room: Dict[str, int] = kills_by_room
+        self.monster_outcomes: Dict[str, List[int]] = monster_outcomes
+
+################################################################################
+    @property
+    def won(self) -> bool:
+
+        return self.finished and self.heroes_defeated == self.heroes_spawned
+
+################################################################################
+    def __repr__(self) -> str:
+
+        return (
+            f"<DMBattleResult: finished={self.finished}, ticks={self.ticks}, "
+            f"heroes={self.heroes_defeated}/{self.heroes_spawned} defeated, "
+            f"monsters={self.monsters_defeated}/{self.monsters_deployed} defeated>"
+        )
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        ret = {name: getattr(self, name) for name in self.__slots__}
+        ret["won"] = self.won
+
+        return ret
+
+################################################################################
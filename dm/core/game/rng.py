@@ -1,7 +1,23 @@
 from __future__ import annotations
 
+import math
+import numpy as np
+import struct
+import zlib
+
 from time       import time
-from typing     import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing     import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
 
 if TYPE_CHECKING:
     from .game import DMGame
@@ -9,6 +25,117 @@ if TYPE_CHECKING:
 
 __all__ = ("DMGenerator",)
 
+# Mersenne Twister (MT19937) parameters.
+_N = 624
+_M = 397
+_MATRIX_A = np.uint32(0x9908b0df)
+_UPPER_MASK = np.uint32(0x80000000)
+_LOWER_MASK = np.uint32(0x7fffffff)
+
+# Number of alias tables kept by `DMGenerator.weighted_choice()` before the
+# oldest one is dropped.
+_ALIAS_CACHE_SIZE = 64
+
+# Snapshot layout: the 624 state words as little-endian uint32s, followed by
+# the index and the number of substreams. Each substream follows as its name
+# length, name, snapshot length and snapshot.
+_STATE_WORDS = np.dtype("<u4")
+_STATE_TAIL = struct.Struct("<HH")
+_STREAM_HEADER = struct.Struct("<HI")
+
+################################################################################
+class AliasTable:
+    """A Walker/Vose alias table for O(1) weighted draws.
+
+    Attributes:
+    -----------
+    _prob: :class:`np.ndarray`
+        The probability of keeping each column rather than taking its alias.
+
+    _alias: :class:`np.ndarray`
+        The alias index for each column.
+
+    _prob_list: :class:`List[float]`
+        `_prob` as a plain list for scalar draws.
+
+    _alias_list: :class:`List[int]`
+        `_alias` as a plain list for scalar draws.
+    """
+
+    __slots__ = (
+        "_prob",
+        "_alias",
+        "_prob_list",
+        "_alias_list",
+    )
+
+################################################################################
+    def __init__(self, weights: List[float]):
+
+        assert all(weight >= 0 for weight in weights), "Weights must be non-negative"
+        assert any(weight > 0 for weight in weights), "At least one weight must be positive"
+
+        n = len(weights)
+        total_weight = sum(weights)
+        scaled = [weight * n / total_weight for weight in weights]
+
+        prob = [1.0] * n
+        alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+
+            prob[s] = scaled[s]
+            alias[s] = l
+
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+
+        # Anything left over is only off from 1.0 by rounding error, so it
+        # keeps the default probability of 1.0.
+
+        self._prob_list: List[float] = prob
+        self._alias_list: List[int] = alias
+
+        self._prob: np.ndarray = np.array(prob, dtype=np.float64)
+        self._alias: np.ndarray = np.array(alias, dtype=np.intp)
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._prob_list)
+
+################################################################################
+    def draw(self, r: float) -> int:
+        """Map a single uniform number in [0, 1] to an index.
+
+        The integer part of `r * n` picks the column and the fractional part
+        decides between the column and its alias.
+        """
+
+        n = len(self._prob_list)
+        x = r * n
+        i = min(int(x), n - 1)
+
+        return i if x - i < self._prob_list[i] else self._alias_list[i]
+
+################################################################################
+    def draw_many(self, r: np.ndarray) -> np.ndarray:
+        """Map an array of uniform numbers in [0, 1] to an array of indices."""
+
+        n = len(self._prob_list)
+        x = r * n
+        i = np.minimum(x.astype(np.intp), n - 1)
+
+        return np.where(x - i < self._prob[i], i, self._alias[i])
+
 ################################################################################
 class DMGenerator:
     """A generator for random numbers and other random behavior.
@@ -17,13 +144,18 @@ class DMGenerator:
     is a pseudorandom number generator. It is used to generate random numbers
     for the game, and is seeded with the current time when the game is started.
 
+    Subsystems draw from named substreams (see :meth:`stream`) rather than the
+    master sequence, so adding a roll to one subsystem doesn't shift the
+    results of any other. Separate processes running the same seed can use
+    :meth:`spawn` to get their own, independent generators.
+
     Attributes:
     -----------
     _state: :class:`DMGame`
         The game instance that this generator is attached to.
 
-    _MT: :class:`List[int]`
-        The array of 624 numbers that are used to generate random numbers.
+    _MT: :class:`np.ndarray`
+        The array of 624 uint32 words that are used to generate random numbers.
 
     _seed: :class:`int`
         The seed that was used to generate the initial array of numbers.
@@ -31,32 +163,105 @@ class DMGenerator:
     _index: :class:`int`
         The current index of the array of numbers.
 
+    _worker: :class:`int`
+        The worker index this generator belongs to. 0 for the main process.
+
+    _stream: Optional[:class:`str`]
+        The name of this substream, or None for a master generator.
+
+    _streams: Dict[:class:`str`, :class:`DMGenerator`]
+        The substreams that have been derived from this generator.
+
+    _outputs: :class:`np.ndarray`
+        The tempered outputs of the current block, as floats in [0, 1].
+
+    _block: :class:`List[float]`
+        The same outputs as `_outputs`, as a plain list for fast scalar draws.
+
+    _alias_cache: Dict[Tuple[:class:`int`, :class:`int`], Tuple[List[Any], Dict[:class:`int`, :class:`float`], :class:`AliasTable`]]
+        Alias tables built by `weighted_choice()`, keyed by the identity of the
+        sequence and weight mapping they were built from.
+
+    _index_cache: Dict[Hashable, :class:`AliasTable`]
+        Alias tables built by `weighted_index()`, keyed by the caller's key.
+
+    Properties:
+    -----------
+    seed: :class:`int`
+        Returns the seed the generator was started with.
+
+    worker: :class:`int`
+        Returns the worker index the generator belongs to.
+
     Methods:
     --------
-    _generate_initial_array() -> None:
+    _generate_initial_array(seed: :class:`int`) -> :class:`np.ndarray`:
         Generate the initial array of 624 numbers.
 
+    _generate_keyed_array(key: List[:class:`int`]) -> :class:`np.ndarray`:
+        Generate the initial array of 624 numbers from a multi-word key.
+
     _generate() -> None:
         Generate the next 624 numbers in the array.
 
-    next() -> int:
+    stream(name: :class:`str`) -> :class:`DMGenerator`:
+        Return the named substream derived from this generator.
+
+    spawn(worker: :class:`int`) -> :class:`DMGenerator`:
+        Return an independent master generator for a worker process.
+
+    jump(n: :class:`int`) -> None:
+        Skip the next n random numbers.
+
+    getstate() -> :class:`bytes`:
+        Return a compact snapshot of the generator and its substreams.
+
+    setstate(state: :class:`bytes`) -> None:
+        Restore a snapshot taken with `getstate()`.
+
+    next() -> :class:`float`:
         Return the next random number in the array.
 
+    next_many(n: :class:`int`) -> :class:`np.ndarray`:
+        Return the next n random numbers in the array.
+
     choice(seq: :class:`List[Any]`) -> Any:
         Return a random element from the given sequence.
 
     sample(seq: :class:`List[Any]`, k: :class:`int`) -> List[Any]:
-        Return a list of k random elements from the given sequence.
+        Return a list of k distinct random elements from the given sequence.
+
+    randint(start: :class:`int`, stop: :class:`int`) -> :class:`int`:
+        Return a random integer from the range [start, stop].
+
+    uniform(start: :class:`float`, stop: :class:`float`, step: Optional[:class:`float`]) -> :class:`float`:
+        Return a random float from the range [start, stop], optionally
+        quantized to multiples of step.
+
+    normal(mu: :class:`float`, sigma: :class:`float`) -> :class:`float`:
+        Return a normally distributed random float.
+
+    triangular(low: :class:`float`, high: :class:`float`, mode: Optional[:class:`float`]) -> :class:`float`:
+        Return a random float from a triangular distribution.
 
     weighted_choice(seq: List[Any], _weights: Dict[:class:`int`, :class:`float`], k: :class:`int`) -> List[Any]:
         Return a random element from the given sequence, with weights.
 
+    weighted_index(weights: List[:class:`float`]) -> :class:`int`:
+        Return a random index into the given list of weights.
+
+    clear_weight_cache() -> None:
+        Drop every cached alias table built by `weighted_choice()`.
+
     from_range(start: :class:`float`, stop: :class:`float`) -> :class:`float`:
         Return a random number from the given range. Returns a float with
         precision of 2 decimal places.
 
     chance(percentage: Union[:class:`int`, :class:`float`]) -> :class:`bool`:
         Return True if the given percentage is greater than a random number.
+
+    chance_many(percentage: Union[:class:`int`, :class:`float`], n: :class:`int`) -> :class:`np.ndarray`:
+        Return an array of n chance rolls against the given percentage.
     """
 
     __slots__ = (
@@ -64,122 +269,700 @@ class DMGenerator:
         "_MT",
         "_seed",
         "_index",
+        "_worker",
+        "_stream",
+        "_streams",
+        "_outputs",
+        "_block",
+        "_alias_cache",
+        "_index_cache",
     )
 
 ################################################################################
-    def __init__(self, state: DMGame, seed: int = None):
+    def __init__(
+        self,
+        state: DMGame,
+        seed: int = None,
+        *,
+        worker: int = 0,
+        stream: Optional[str] = None
+    ):
 
         self._state: DMGame = state
 
-        self._MT: List[int] = [0] * 624
         self._seed: int = seed if seed is not None else int(time())
-        self._MT[0] = self._seed
-        self._index: int = 624
+        self._index: int = _N
+
+        self._worker: int = worker
+        self._stream: Optional[str] = stream
+        self._streams: Dict[str, DMGenerator] = {}
+
+        # The main process's master generator keeps the classic seeding so
+        # existing seeds reproduce. Everything else is keyed off the seed,
+        # worker and stream name together.
+        if worker == 0 and stream is None:
+            self._MT: np.ndarray = self._generate_initial_array(self._seed)
+        else:
+            self._MT: np.ndarray = self._generate_keyed_array(
+                self._derive_key(self._seed, worker, stream)
+            )
+        self._outputs: np.ndarray = np.zeros(_N, dtype=np.float64)
+        self._block: List[float] = []
 
-        self._generate_initial_array()
+        self._alias_cache: Dict[Tuple[int, int], Tuple[List[Any], Dict[int, float], AliasTable]] = {}
+        self._index_cache: Dict[Hashable, AliasTable] = {}
 
 ################################################################################
-    def _generate_initial_array(self) -> None:
+    @property
+    def seed(self) -> int:
+
+        return self._seed
+
+################################################################################
+    @property
+    def worker(self) -> int:
+
+        return self._worker
+
+################################################################################
+    @staticmethod
+    def _generate_initial_array(seed: int) -> np.ndarray:
         """Generate the initial array of 624 numbers.
 
         This is done by seeding the first number with the seed, and then
         generating the rest of the array from that number.
+
+        Notes:
+        ------
+        The seeding runs on Python ints so that seeds wider than 32 bits
+        produce the same words they always have. Only the top bit of the
+        first word is ever read by the twist, so masking it down to 32 bits
+        afterwards doesn't change the sequence.
         """
 
-        for i in range(1, 624):
-            self._MT[i] = (
-                (0x6c078965 * (self._MT[i - 1] ^ (self._MT[i - 1] >> 30)) + i) & 0xFFFFFFFF
-            )
+        mt = [0] * _N
+        mt[0] = seed
+        for i in range(1, _N):
+            mt[i] = (0x6c078965 * (mt[i - 1] ^ (mt[i - 1] >> 30)) + i) & 0xFFFFFFFF
+
+        mt[0] &= 0xFFFFFFFF
+
+        return np.array(mt, dtype=np.uint32)
 
 ################################################################################
-    def _generate(self):
-        """Generate the next 624 numbers in the array.
+    @staticmethod
+    def _generate_keyed_array(key: List[int]) -> np.ndarray:
+        """Generate the initial array of 624 numbers from a list of 32-bit
+        words, using the reference `init_by_array` routine.
+
+        Unlike a single 32-bit seed, the key can hold the full seed alongside
+        a worker index and stream id, so every combination gets its own
+        state without any chance of two of them colliding.
+        """
+
+        mt = [0] * _N
+        mt[0] = 19650218
+        for i in range(1, _N):
+            mt[i] = (0x6c078965 * (mt[i - 1] ^ (mt[i - 1] >> 30)) + i) & 0xFFFFFFFF
+
+        i, j = 1, 0
+        for _ in range(max(_N, len(key))):
+            mt[i] = ((mt[i] ^ ((mt[i - 1] ^ (mt[i - 1] >> 30)) * 1664525)) + key[j] + j) & 0xFFFFFFFF
+            i += 1
+            j += 1
+            if i >= _N:
+                mt[0] = mt[_N - 1]
+                i = 1
+            if j >= len(key):
+                j = 0
+
+        for _ in range(_N - 1):
+            mt[i] = ((mt[i] ^ ((mt[i - 1] ^ (mt[i - 1] >> 30)) * 1566083941)) - i) & 0xFFFFFFFF
+            i += 1
+            if i >= _N:
+                mt[0] = mt[_N - 1]
+                i = 1
+
+        # Guarantees a non-zero initial state.
+        mt[0] = 0x80000000
+
+        return np.array(mt, dtype=np.uint32)
 
-        This is done by iterating through the array and generating each number
-        from the previous number.
+################################################################################
+    @staticmethod
+    def _derive_key(seed: int, worker: int, stream: Optional[str]) -> List[int]:
+        """Build the `init_by_array` key for a seed, worker and stream name."""
+
+        seed = abs(seed)
+        key = []
+        while True:
+            key.append(seed & 0xFFFFFFFF)
+            seed >>= 32
+            if not seed:
+                break
+
+        stream_id = zlib.crc32(stream.encode("utf-8")) if stream is not None else 0
+
+        # The word count keeps seeds of different widths from lining up.
+        return key + [len(key), worker & 0xFFFFFFFF, stream_id]
+
+################################################################################
+    def stream(self, name: str) -> DMGenerator:
+        """Return the named substream of this generator, creating it if needed.
+
+        Each substream is seeded from this generator's seed, worker index and
+        the stream name, so its sequence is fixed for a given seed no matter
+        how many numbers have been drawn from the master or from any other
+        stream. Substreams of substreams are named by their full path, e.g.
+        `"combat/traps"`.
+
+        Parameters:
+        -----------
+        name : :class:`str`
+            The name of the substream, such as `"movement"`, `"combat"`,
+            `"spawning"`, `"fate"` or `"loot"`.
+
+        Returns:
+        --------
+        :class:`DMGenerator`
+            The generator for the named substream.
         """
 
-        for i in range(624):
-            y = (self._MT[i] & 0x80000000) + (self._MT[(i+1) % 624] & 0x7fffffff)
-            self._MT[i] = self._MT[(i+397) % 624] ^ (y >> 1)
-            if y % 2 != 0:
-                self._MT[i] ^= 0x9908b0df
+        try:
+            return self._streams[name]
+        except KeyError:
+            pass
+
+        path = name if self._stream is None else f"{self._stream}/{name}"
+        sub = DMGenerator(self._state, self._seed, worker=self._worker, stream=path)
+        self._streams[name] = sub
+
+        return sub
 
 ################################################################################
-    def next(self) -> float:
-        """Return the next random number in the sequence."""
+    def spawn(self, worker: int) -> DMGenerator:
+        """Return a new master generator for the given worker index.
+
+        Every worker shares the seed but is seeded independently, with the
+        worker index mixed into the `init_by_array` key. This isn't a jump
+        ahead, so workers' sequences aren't guaranteed to be disjoint, but
+        overlap between them is astronomically unlikely. The same worker
+        index always reproduces the same results.
+
+        Parameters:
+        -----------
+        worker : :class:`int`
+            The worker index. Must be positive - index 0 is the main process.
 
-        if self._index >= 624:
+        Returns:
+        --------
+        :class:`DMGenerator`
+            The worker's master generator. Its substreams are seeded
+            independently of every other worker's in the same way.
+        """
+
+        if worker <= 0:
+            raise ValueError("Worker indices must be positive.")
+
+        return DMGenerator(self._state, self._seed, worker=worker)
+
+################################################################################
+    def jump(self, n: int) -> None:
+        """Skip ahead `n` numbers in the sequence without tempering them.
+
+        Whole blocks are skipped by twisting the state only, so jumping far
+        ahead costs a fraction of drawing the same amount of numbers.
+
+        Parameters:
+        -----------
+        n : :class:`int`
+            The number of values to skip.
+        """
+
+        if n < 0:
+            raise ValueError("Cannot jump backwards.")
+
+        # Use up what's left of the current block first.
+        take = min(n, _N - self._index)
+        self._index += take
+        n -= take
+
+        if not n:
+            return
+
+        blocks, remainder = divmod(n, _N)
+        for _ in range(blocks):
+            self._twist()
+
+        if remainder:
             self._generate()
-            self._index = 0
+            self._index = remainder
+
+################################################################################
+    def getstate(self) -> bytes:
+        """Return a compact snapshot of the generator's position.
+
+        The snapshot is the 624 state words packed as uint32s plus the index,
+        followed by the snapshots of any substreams that have been created.
+        It's about 2.5KB per generator and cheap enough to take every tick.
+
+        Returns:
+        --------
+        :class:`bytes`
+            The snapshot, to be passed to :meth:`setstate`.
+        """
+
+        parts = [
+            self._MT.astype(_STATE_WORDS, copy=False).tobytes(),
+            _STATE_TAIL.pack(self._index, len(self._streams)),
+        ]
+        for name, sub in self._streams.items():
+            encoded = name.encode("utf-8")
+            sub_state = sub.getstate()
+            parts.append(_STREAM_HEADER.pack(len(encoded), len(sub_state)))
+            parts.append(encoded)
+            parts.append(sub_state)
+
+        return b"".join(parts)
+
+################################################################################
+    def setstate(self, state: bytes) -> None:
+        """Restore the generator, and its substreams, to a snapshot taken with
+        :meth:`getstate`.
+
+        Snapshots only hold positions, so they should be restored onto a
+        generator with the same seed and worker index they were taken from.
+        Substreams created after the snapshot was taken are discarded and will
+        start over from the beginning if they're used again.
+
+        Parameters:
+        -----------
+        state : :class:`bytes`
+            The snapshot to restore.
+
+        Raises:
+        -------
+        :exc:`ValueError`
+            If the snapshot is malformed.
+        """
+
+        view = memoryview(state)
+        try:
+            self._read_state(view)
+        except struct.error as ex:
+            raise ValueError("Invalid DMGenerator snapshot.") from ex
+
+################################################################################
+    def _read_state(self, view: memoryview) -> int:
+        """Restore from the start of `view` and return the number of bytes
+        that were read."""
+
+        offset = _N * _STATE_WORDS.itemsize
+        if len(view) < offset + _STATE_TAIL.size:
+            raise ValueError("Invalid DMGenerator snapshot.")
+
+        mt = np.frombuffer(view[:offset], dtype=_STATE_WORDS).astype(np.uint32)
+        index, stream_count = _STATE_TAIL.unpack_from(view, offset)
+        offset += _STATE_TAIL.size
+
+        if index > _N:
+            raise ValueError("Invalid DMGenerator snapshot.")
+
+        self._MT = mt
+        self._index = index
+        # The output block is derived from the state words, so it's cheaper
+        # to re-temper it than to store it. At index 624 it'll be replaced
+        # before it's read.
+        if index < _N:
+            self._temper()
+
+        streams = {}
+        for _ in range(stream_count):
+            name_len, sub_len = _STREAM_HEADER.unpack_from(view, offset)
+            offset += _STREAM_HEADER.size
+            name = bytes(view[offset:offset + name_len]).decode("utf-8")
+            offset += name_len
+
+            sub = self._streams.get(name) or self.stream(name)
+            sub._read_state(view[offset:offset + sub_len])
+            streams[name] = sub
+            offset += sub_len
+
+        self._streams = streams
+
+        return offset
+
+################################################################################
+    def _generate(self) -> None:
+        """Generate the next 624 numbers in the array and temper them."""
+
+        self._twist()
+        self._temper()
+
+################################################################################
+    def _twist(self) -> None:
+        """Generate the next 624 numbers in the array.
+
+        The twist is done as whole-array operations instead of one word at a
+        time. Word `i` depends on word `i + 397`, which wraps around onto
+        words that have already been twisted once `i` passes 227, so the
+        array is processed in 227-word chunks to respect that ordering. The
+        result is identical to the word-at-a-time algorithm.
+        """
+
+        mt = self._MT
+
+        # `y` for every word but the last only reads words that haven't been
+        # twisted yet, so it can be computed up front.
+        y = (mt[:-1] & _UPPER_MASK) | (mt[1:] & _LOWER_MASK)
+        mag = (y >> 1) ^ ((y & 1) * _MATRIX_A)
+
+        mt[:_N - _M] = mt[_M:] ^ mag[:_N - _M]
+        mt[_N - _M:2 * (_N - _M)] = mt[:_N - _M] ^ mag[_N - _M:2 * (_N - _M)]
+        mt[2 * (_N - _M):_N - 1] = mt[_N - _M:_M - 1] ^ mag[2 * (_N - _M):]
+
+        # The last word wraps around onto the freshly twisted first word.
+        y = (mt[_N - 1] & _UPPER_MASK) | (mt[0] & _LOWER_MASK)
+        mt[_N - 1] = mt[_M - 1] ^ (y >> 1) ^ ((y & 1) * _MATRIX_A)
+
+################################################################################
+    def _temper(self) -> None:
+        """Temper the current array into the output block."""
 
-        y = self._MT[self._index]
+        y = self._MT.copy()
         y ^= (y >> 11)
         y ^= ((y << 7) & 0x9d2c5680)
         y ^= ((y << 15) & 0xefc60000)
         y ^= (y >> 18)
 
+        self._outputs = y / 0xFFFFFFFF
+        self._block = self._outputs.tolist()
+
+################################################################################
+    def next(self) -> float:
+        """Return the next random number in the sequence."""
+
+        if self._index >= _N:
+            self._generate()
+            self._index = 0
+
         self._index += 1
-        return y / 0xFFFFFFFF
+        return self._block[self._index - 1]
 
 ################################################################################
-    def choice(self, seq: List[Any], *, exclude: Optional[Any] = None) -> Optional[Any]:
+    def next_many(self, n: int) -> np.ndarray:
+        """Return the next `n` random numbers in the sequence.
+
+        The values are exactly the ones `n` calls to :meth:`next` would have
+        returned, and the generator is left in the same position.
+
+        Parameters:
+        -----------
+        n : :class:`int`
+            The number of values to draw.
+
+        Returns:
+        --------
+        :class:`np.ndarray`
+            A float64 array of `n` values in the range [0, 1].
+        """
+
+        if n < 0:
+            raise ValueError("Cannot draw a negative number of values.")
+
+        ret = np.empty(n, dtype=np.float64)
+
+        filled = 0
+        while filled < n:
+            if self._index >= _N:
+                self._generate()
+                self._index = 0
+
+            take = min(n - filled, _N - self._index)
+            ret[filled:filled + take] = self._outputs[self._index:self._index + take]
+
+            self._index += take
+            filled += take
+
+        return ret
+
+################################################################################
+    def choice(
+        self,
+        seq: Sequence[Any],
+        *,
+        exclude: Optional[Union[Any, AbstractSet[Any]]] = None
+    ) -> Optional[Any]:
         """Return a random element from the sequence `seq`. If seq is empty, it
         will return nothing.
          
-        You may optionally exclude a specific element from the sequence.
+        You may optionally exclude a specific element, or a set of elements,
+        from the sequence.
          
         Parameters:
         -----------
-        seq : List[Any]
+        seq : Sequence[Any]
             The sequence to choose from.
 
-        exclude : Optional[Any]
-            An element to exclude from the sequence. Defaults to None.
+        exclude : Optional[Union[Any, AbstractSet[Any]]]
+            An element, or set of elements, to exclude from the sequence.
+            Defaults to None.
             
         Returns:
         --------
         Optional[Any]
-            A random element from the sequence, or None if the sequence was empty.
+            A random element from the sequence, or None if there was nothing
+            left to choose from.
          """
 
-        if exclude is not None:
-            seq = [item for item in seq if item != exclude]
+        skipped = self._excluded_indices(seq, exclude)
 
-        try:
-            return seq[int(self.next() * len(seq))]
-        except IndexError:
+        n = len(seq) - len(skipped)
+        if n <= 0:
             return None
 
+        return seq[self._skip_excluded(self._below(n), skipped)]
+
 ################################################################################
-    def sample(self, seq: List[Any], k: int = 1, *, exclude: Optional[Any] = None) -> List[Any]:
-        """Return a list of k elements from the sequence `seq`. If seq is empty,
-        it will return an empty list.
+    def sample(
+        self,
+        seq: Sequence[Any],
+        k: int = 1,
+        *,
+        exclude: Optional[Union[Any, AbstractSet[Any]]] = None
+    ) -> List[Any]:
+        """Return a list of k distinct elements from the sequence `seq`. If seq
+        is empty, it will return an empty list.
         
-        You may optionally exclude a specific element from the sequence.
+        You may optionally exclude a specific element, or a set of elements,
+        from the sequence.
         
         Parameters:
         -----------
-        seq : List[Any]
+        seq : Sequence[Any]
             The sequence to choose from.
 
         k : :class:`int`
             The number of elements to choose. Defaults to 1.
 
-        exclude : Optional[Any]
-            An element to exclude from the sequence. Defaults to None.
+        exclude : Optional[Union[Any, AbstractSet[Any]]]
+            An element, or set of elements, to exclude from the sequence.
+            Defaults to None.
             
         Returns:
         --------
         List[Any]
-            A list of k elements from the sequence, or an empty list if the
-            sequence was empty.
+            A list of k elements from the sequence. If fewer than k elements
+            are available, all of them are returned.
+
+        Notes:
+        ------
+        Elements are chosen without replacement using Floyd's algorithm, which
+        needs k random numbers and a set of k indices, without ever copying or
+        filtering `seq`. Every subset is equally likely, but the order of the
+        returned elements isn't shuffled.
         """
 
-        if exclude is not None:
-            seq = [item for item in seq if item != exclude]
+        skipped = self._excluded_indices(seq, exclude)
+
+        n = len(seq) - len(skipped)
+        k = min(k, n)
+        if k <= 0:
+            return []
+
+        chosen = set()
+        ret = []
+        for j in range(n - k, n):
+            t = self._below(j + 1)
+            if t in chosen:
+                t = j
+            chosen.add(t)
+            ret.append(seq[self._skip_excluded(t, skipped)])
 
-        return [self.choice(seq, exclude=exclude) for _ in range(k)]
+        return ret
+
+################################################################################
+    def _below(self, n: int) -> int:
+        """Return a random integer from the range [0, n)."""
+
+        return min(int(self.next() * n), n - 1)
+
+################################################################################
+    @staticmethod
+    def _excluded_indices(
+        seq: Sequence[Any],
+        exclude: Optional[Union[Any, AbstractSet[Any]]]
+    ) -> List[int]:
+        """Return the sorted indices of the excluded elements in `seq`."""
+
+        if exclude is None:
+            return []
+
+        if isinstance(exclude, (set, frozenset)):
+            return [i for i, item in enumerate(seq) if item in exclude]
+
+        return [i for i, item in enumerate(seq) if item == exclude]
+
+################################################################################
+    @staticmethod
+    def _skip_excluded(n: int, skipped: List[int]) -> int:
+        """Map the nth non-excluded element to its index in the sequence."""
+
+        for i in skipped:
+            if i > n:
+                break
+            n += 1
+
+        return n
+
+################################################################################
+    def randint(self, start: int, stop: int) -> int:
+        """Return a random integer from the range [start, stop].
+
+        Parameters:
+        -----------
+        start : :class:`int`
+            The start of the range.
+
+        stop : :class:`int`
+            The end of the range.
+
+        Returns:
+        --------
+        :class:`int`
+            A random integer from the range [start, stop].
+
+        Raises:
+        -------
+        :exc:`ValueError`
+            If start is greater than stop.
+        """
+
+        if start > stop:
+            raise ValueError("Start of range must not be greater than stop.")
+
+        return start + self._below(stop - start + 1)
+
+################################################################################
+    def uniform(self, start: float, stop: float, step: Optional[float] = None) -> float:
+        """Return a random float from the range [start, stop].
+
+        Parameters:
+        -----------
+        start : :class:`float`
+            The start of the range.
+
+        stop : :class:`float`
+            The end of the range.
+
+        step : Optional[:class:`float`]
+            If provided, the result is quantized to `start + n * step`, with
+            every step in the range equally likely. Defaults to None.
+
+        Returns:
+        --------
+        :class:`float`
+            A random float from the range [start, stop].
+
+        Raises:
+        -------
+        :exc:`ValueError`
+            If start is greater than stop, or step isn't positive.
+        """
+
+        if start > stop:
+            raise ValueError("Start of range must not be greater than stop.")
+
+        if step is None:
+            return start + self.next() * (stop - start)
+
+        if step <= 0:
+            raise ValueError("Step must be positive.")
+
+        # The small tolerance keeps float noise from dropping the last step.
+        steps = int((stop - start) / step + 1e-9) + 1
+
+        return round(start + self._below(steps) * step, 10)
+
+################################################################################
+    def normal(
+        self,
+        mu: float = 0.0,
+        sigma: float = 1.0,
+        *,
+        low: Optional[float] = None,
+        high: Optional[float] = None
+    ) -> float:
+        """Return a normally distributed random float, using the Box-Muller
+        transform.
+
+        Parameters:
+        -----------
+        mu : :class:`float`
+            The mean of the distribution. Defaults to 0.0.
+
+        sigma : :class:`float`
+            The standard deviation of the distribution. Defaults to 1.0.
+
+        low : Optional[:class:`float`]
+            If provided, results are clamped to be no lower than this.
+
+        high : Optional[:class:`float`]
+            If provided, results are clamped to be no higher than this.
+
+        Returns:
+        --------
+        :class:`float`
+            A random float from the distribution.
+        """
+
+        # log(0) is undefined, so redraw in the one-in-four-billion case.
+        u1 = self.next()
+        while u1 <= 0.0:
+            u1 = self.next()
+        u2 = self.next()
+
+        ret = mu + sigma * math.sqrt(-2.0 * math.log(u1)) * math.cos(2.0 * math.pi * u2)
+
+        if low is not None:
+            ret = max(ret, low)
+        if high is not None:
+            ret = min(ret, high)
+
+        return ret
+
+################################################################################
+    def triangular(self, low: float, high: float, mode: Optional[float] = None) -> float:
+        """Return a random float from a triangular distribution, which is
+        weighted towards `mode` and falls off linearly to `low` and `high`.
+
+        Parameters:
+        -----------
+        low : :class:`float`
+            The lower bound of the distribution.
+
+        high : :class:`float`
+            The upper bound of the distribution.
+
+        mode : Optional[:class:`float`]
+            The peak of the distribution. Defaults to the midpoint.
+
+        Returns:
+        --------
+        :class:`float`
+            A random float from the range [low, high].
+        """
+
+        if high == low:
+            return low
+
+        c = 0.5 if mode is None else (mode - low) / (high - low)
+        u = self.next()
+
+        if u < c:
+            return low + (high - low) * math.sqrt(u * c)
+
+        return high - (high - low) * math.sqrt((1.0 - u) * (1.0 - c))
 
 ################################################################################
     def weighted_choice(self, seq: List[Any], _weights: Dict[int, float], k: int) -> List[Any]:
@@ -206,41 +989,103 @@ class DMGenerator:
         Raises:
         -------
         :exc:`AssertionError`
-            If the array and weights do not have the same length, if any of the
-            weights are negative, or if none of the weights are positive.
+            If any of the weights are negative, or if none of the weights are
+            positive.
 
         Notes:
         ------
         The weights do not need to add up to 1.0, but they must be non-negative
         and at least one of them must be positive.
 
-        The weights are scaled so that they add up to 1.0, and then a random
-        number is chosen between 0 and 1.0. The first element is chosen if the
-        random number is less than the weight of the first element. Otherwise,
-        the random number is subtracted from the weight of the first element,
-        and the second element is chosen if the random number is less than the
-        weight of the second element. This continues until an element is chosen.
+        An alias table is built the first time a given sequence and weight
+        mapping are seen, after which every draw costs one random number and
+        a lookup, regardless of the size of the sequence. Tables are cached
+        against the identity of `seq` and `_weights`, so both should be
+        treated as read-only once they've been passed in; pass new objects
+        when the pool or weights change, or call :meth:`clear_weight_cache`.
         """
 
-        weights = [_weights.get(item.rank, 0) for item in seq]
+        table = self._get_alias_table(seq, _weights)
 
-        assert len(seq) == len(weights), "Array and weights must have the same length"
-        assert all(weight >= 0 for weight in weights), "Weights must be non-negative"
-        assert any(weight > 0 for weight in weights), "At least one weight must be positive"
+        if k == 1:
+            return [seq[table.draw(self.next())]]
 
-        total_weight = sum(weights)
-        scaled_weights = [weight / total_weight for weight in weights]
+        return [seq[i] for i in table.draw_many(self.next_many(k)).tolist()]
+
+################################################################################
+    def _get_alias_table(self, seq: List[Any], _weights: Dict[int, float]) -> AliasTable:
+        """Return the cached alias table for the given sequence and weights,
+        building it if necessary."""
+
+        key = (id(seq), id(_weights))
 
-        choices = []
-        for _ in range(k):
-            r = self.next()
-            for i, weight in enumerate(scaled_weights):
-                if r < weight:
-                    choices.append(seq[i])
-                    break
-                r -= weight
+        try:
+            cached_seq, _, table = self._alias_cache[key]
+        except KeyError:
+            pass
+        else:
+            # The cache holds a reference to both objects, so the ids can't
+            # have been reused. A length change means the list was mutated.
+            if len(cached_seq) == len(table):
+                return table
+            del self._alias_cache[key]
+
+        table = AliasTable([_weights.get(item.rank, 0) for item in seq])
+
+        if len(self._alias_cache) >= _ALIAS_CACHE_SIZE:
+            del self._alias_cache[next(iter(self._alias_cache))]
+        self._alias_cache[key] = (seq, _weights, table)
+
+        return table
+
+################################################################################
+    def weighted_index(self, weights: List[float], key: Optional[Hashable] = None) -> int:
+        """Return a random index into `weights`, where each index has a chance
+        of being chosen proportional to its weight.
+
+        Parameters:
+        -----------
+        weights : List[:class:`float`]
+            The weights to choose between. They don't need to add up to 1.0,
+            but must be non-negative and at least one must be positive.
+
+        key : Optional[Hashable]
+            Identifies the weights, so the alias table built from them is kept
+            and reused by later calls with the same key. The caller promises
+            the same key always comes with the same weights, until
+            :meth:`clear_weight_cache` is called. Without a key, a table is
+            built for this draw alone.
+
+        Returns:
+        --------
+        :class:`int`
+            The chosen index.
+        """
+
+        if key is None:
+            return AliasTable(weights).draw(self.next())
+
+        try:
+            table = self._index_cache[key]
+        except KeyError:
+            table = AliasTable(weights)
+            if len(self._index_cache) >= _ALIAS_CACHE_SIZE:
+                del self._index_cache[next(iter(self._index_cache))]
+            self._index_cache[key] = table
+
+        return table.draw(self.next())
+
+################################################################################
+    def clear_weight_cache(self) -> None:
+        """Drop every cached alias table, this generator's and its
+        substreams'. Should be called whenever the weight mappings in use
+        change, such as when the day advances."""
+
+        self._alias_cache.clear()
+        self._index_cache.clear()
 
-        return choices
+        for stream in self._streams.values():
+            stream.clear_weight_cache()
 
 ################################################################################
     # def scaling_damage(self, room: DMRoom) -> int:
@@ -259,8 +1104,8 @@ class DMGenerator:
 
 ################################################################################
     def from_range(self, start: float, stop: float) -> float:
-        """Return a random integer from the range [start, stop]. Returns
-        precision to 2 decimal places.
+        """Return a random float from the range [start, stop], with a
+        precision of 2 decimal places.
 
         Parameters:
         -----------
@@ -273,30 +1118,20 @@ class DMGenerator:
         Returns:
         --------
         :class:`float`
-            A random integer from the range [start, stop].
+            A random float from the range [start, stop].
 
         Raises:
         -------
-        :exc:`AssertionError`
+        :exc:`ValueError`
             If start is greater than stop.
 
         Notes:
         ------
-        The range is inclusive of both start and stop.
-
-        This method is intended to be used for generating random floats from
-        within a range, rather than random integers. For example, if you want
-        to generate a random float between 0.0 and 1.0, you would use
-        `from_range(0.0, 1.0)`.
+        The range is inclusive of both start and stop. This is a shortcut for
+        `uniform(start, stop, 0.01)`.
         """
 
-        def frange(begin, end):
-            i = begin
-            while i < end:
-                yield i
-                i += 0.01
-
-        return self.choice([i for i in frange(start, stop + 1)])
+        return self.uniform(start, stop, 0.01)
 
 ################################################################################
 #     def hero(self, room: Optional[DMRoom] = None, *, exclude: Optional[DMHero] = None) -> Optional[DMHero]:
@@ -382,6 +1217,33 @@ class DMGenerator:
             True with a probability of n/100.
         """
 
+        return self.next() <= self._normalize_chance(n)
+
+################################################################################
+    def chance_many(self, n: Union[int, float], k: int) -> np.ndarray:
+        """Roll :meth:`chance` `k` times at once.
+
+        Parameters:
+        -----------
+        n : Union[:class:`int`, :class:`float`]
+            The probability of each roll returning True, with the same rules
+            as :meth:`chance`.
+
+        k : :class:`int`
+            The number of rolls to make.
+
+        Returns:
+        --------
+        :class:`np.ndarray`
+            A boolean array of `k` rolls, matching `k` calls to :meth:`chance`.
+        """
+
+        return self.next_many(k) <= self._normalize_chance(n)
+
+################################################################################
+    @staticmethod
+    def _normalize_chance(n: Union[int, float]) -> float:
+
         if n not in range(0, 101):
             raise ValueError("Chance must be between 0 and 100")
 
@@ -390,6 +1252,6 @@ class DMGenerator:
         elif n < 0:
             n = 0
 
-        return self.next() <= n
+        return n
 
 ################################################################################
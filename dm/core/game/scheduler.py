@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import heapq
+import math
+
+from itertools  import count
+from typing     import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from dm.core.game.encounter import DMEncounter
+################################################################################
+
+__all__ = ("DMEncounterScheduler",)
+
+################################################################################
+class DMEncounterScheduler:
+    """A priority queue of the next action time of every unit in every
+    encounter, so each update only touches the encounters that have an
+    action due.
+
+    Actions are keyed by simulated time. Encounters that end are left in the
+    queue and skipped when their entries come up, rather than searched for.
+    Entries remember the encounter's id, since a finished encounter may
+    already have been pooled and reused for another fight by then.
+
+    Attributes:
+    -----------
+    _queue: List[Tuple[:class:`float`, :class:`int`, :class:`DMEncounter`, :class:`int`, :class:`int`]]
+        The heap of pending actions: due time, insertion order, encounter,
+        which of its units acts and the encounter's id when it was scheduled.
+
+    _ticks: :class:`int`
+        The number of steps taken since the scheduler was created.
+
+    _time: :class:`float`
+        The simulated time, in seconds, since the scheduler was created.
+        Worked out from the step count rather than summed, so skipping
+        ahead lands on exactly the same time as stepping.
+
+    _order: Iterator[:class:`int`]
+        Breaks ties between actions due at the same time, first come first
+        served.
+
+    Properties:
+    -----------
+    time: :class:`float`
+        Returns the current simulated time.
+
+    next_due: Optional[:class:`float`]
+        Returns when the next action is due, if any are pending.
+
+    Methods:
+    --------
+    add(encounter: :class:`DMEncounter`) -> None
+        Schedules the opening actions of a new encounter.
+
+    schedule(encounter: :class:`DMEncounter`, slot: :class:`int`, delay: :class:`float`) -> None
+        Schedules an action the given number of seconds from now.
+
+    advance(dt: :class:`float`) -> :class:`int`
+        Moves time forward and runs every action that comes due.
+
+    ticks_until_next(dt: :class:`float`) -> Optional[:class:`int`]
+        Returns how many steps of the given length can pass before the next
+        action.
+
+    skip(ticks: :class:`int`, dt: :class:`float`) -> None
+        Moves time forward by the given number of steps, with no actions due.
+
+    clear() -> None
+        Drops every pending action.
+    """
+
+    __slots__ = (
+        "_queue",
+        "_ticks",
+        "_time",
+        "_order",
+    )
+
+################################################################################
+    def __init__(self):
+
+        self._queue: List[Tuple[float, int, DMEncounter, int, int]] = []
+        self._ticks: int = 0
+        self._time: float = 0.0
+        self._order: Iterator[int] = count()
+
+################################################################################
+    @property
+    def time(self) -> float:
+
+        return self._time
+
+################################################################################
+    @property
+    def next_due(self) -> Optional[float]:
+
+        # Finished encounters' entries don't count.
+        while self._queue and self._stale(self._queue[0]):
+            heapq.heappop(self._queue)
+
+        return self._queue[0][0] if self._queue else None
+
+################################################################################
+    def add(self, encounter: DMEncounter) -> None:
+        """Schedules the opening actions of a new encounter.
+
+        Parameters:
+        -----------
+        encounter: :class:`DMEncounter`
+            The encounter to start scheduling.
+        """
+
+        for slot in (1, 2):
+            self.schedule(encounter, slot, encounter.action_delay(slot, first=True))
+
+################################################################################
+    def schedule(self, encounter: DMEncounter, slot: int, delay: float) -> None:
+
+        heapq.heappush(self._queue, (self._time + delay, next(self._order), encounter, slot, encounter.id))
+
+################################################################################
+    @staticmethod
+    def _stale(entry: Tuple[float, int, DMEncounter, int, int]) -> bool:
+
+        encounter = entry[2]
+        return encounter.id != entry[4] or not encounter.in_progress
+
+################################################################################
+    def advance(self, dt: float) -> int:
+        """Moves time forward and runs every action that comes due, in the
+        order they were due.
+
+        Parameters:
+        -----------
+        dt: :class:`float`
+            The length of a step, in seconds. Always the same length.
+
+        Returns:
+        --------
+        :class:`int`
+            The number of actions that were run.
+        """
+
+        self._ticks += 1
+        self._time = self._ticks * dt
+
+        queue = self._queue
+        actions = 0
+
+        while queue and queue[0][0] <= self._time:
+            entry = heapq.heappop(queue)
+            if self._stale(entry):
+                continue
+
+            encounter, slot = entry[2], entry[3]
+
+            encounter.act(slot)
+            actions += 1
+
+            # The cooldown restarts from when the action actually happened.
+            if encounter.in_progress:
+                self.schedule(encounter, slot, encounter.action_delay(slot))
+
+        return actions
+
+################################################################################
+    def ticks_until_next(self, dt: float) -> Optional[int]:
+        """Returns how many steps of the given length can pass without an
+        action coming due, or None if nothing is scheduled. Errs on the side
+        of fewer, so skipping that many never jumps past an action.
+
+        Parameters:
+        -----------
+        dt: :class:`float`
+            The length of a step, in seconds.
+        """
+
+        due = self.next_due
+        if due is None:
+            return None
+
+        return max(math.floor((due - self._time) / dt) - 1, 0)
+
+################################################################################
+    def skip(self, ticks: int, dt: float) -> None:
+        """Moves time forward by the given number of steps, in which no
+        action may come due."""
+
+        self._ticks += ticks
+        self._time = self._ticks * dt
+
+################################################################################
+    def clear(self) -> None:
+
+        self._queue.clear()
+
+################################################################################
@@ -52,6 +52,10 @@ class DMState:
         "next_state",
     )
 
+    # Whether the state marks its own dirty rects with the game's renderer.
+    # If not, the whole screen is presented every frame.
+    PARTIAL_REDRAW = False
+
 ################################################################################
     def __init__(self, game: DMGame):
 
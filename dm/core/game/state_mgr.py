@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import pygame
-
 from typing import TYPE_CHECKING, List, Optional, Union
 
 from dm.core.game.state     import DMState
@@ -78,7 +76,8 @@ class DMStateMachine:
     __slots__ = (
         "_game",
         "_states",
-        "_previous_state"
+        "_previous_state",
+        "_drawn_state",
     )
 
 ################################################################################
@@ -88,6 +87,8 @@ class DMStateMachine:
 
         self._states: List[DMState] = []
         self._previous_state: Optional[DMState] = None
+        # The state drawn last frame, so we know when the screen changes hands.
+        self._drawn_state: Optional[DMState] = None
 
 ################################################################################
     def __repr__(self) -> str:
@@ -249,7 +250,10 @@ class DMStateMachine:
 
 ################################################################################
     def draw(self, screen: Surface):
-        """Draws the current state.
+        """Draws the current state and presents the frame.
+
+        States that don't track their own dirty rects get a full redraw every
+        frame, as does any state on its first frame.
 
         Parameters:
         -----------
@@ -258,9 +262,15 @@ class DMStateMachine:
         """
 
         if self._states:
-            # screen.fill(BLACK)
-            self.current_state.draw(screen)
+            state = self.current_state
+            renderer = self.game.renderer
+
+            if not state.PARTIAL_REDRAW or state is not self._drawn_state:
+                renderer.invalidate()
+            self._drawn_state = state
 
-            pygame.display.flip()
+            # screen.fill(BLACK)
+            state.draw(screen)
+            renderer.present()
 
 ################################################################################
@@ -37,6 +37,15 @@ class StatComponent:
 
         return StatComponent(self.__base, self._type)
 
+################################################################################
+    def _recycle(self) -> None:
+        """Puts the component back to its base value, as if freshly copied."""
+
+        self._current = self.__base
+        self._max = self.__base
+
+        self.reset()
+
 ################################################################################
     def scale(self, scalar: Union[int, float]) -> None:
 
@@ -215,7 +224,19 @@ class UnitStats:
         copy._dex = self._dex._copy()
         copy._combat = self._combat._copy()
         copy._num_attacks = self._num_attacks._copy()
+        copy._move_speed = self._move_speed._copy()
 
         return copy
 
+################################################################################
+    def _recycle(self) -> None:
+
+        self._life._recycle()
+        self._attack._recycle()
+        self._defense._recycle()
+        self._dex._recycle()
+        self._combat._recycle()
+        self._num_attacks._recycle()
+        self._move_speed._recycle()
+
 ################################################################################
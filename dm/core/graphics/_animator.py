@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from pygame     import Surface
-from typing    import TYPE_CHECKING, List, Type, TypeVar
+from typing    import TYPE_CHECKING, Sequence, Type, TypeVar
 
 if TYPE_CHECKING:
+    from .atlas import AtlasRegion
     from .unit import UnitGraphical
 ################################################################################
 
@@ -29,13 +30,13 @@ class AnimatorComponent:
         self._parent: UnitGraphical = parent
 
         self._current_frame: int = 0
-        self._frames: List[Surface] = []
+        self._frames: Sequence[AtlasRegion] = ()
 
         self._cooldown: float = 0
 
 ################################################################################
     @property
-    def frames(self) -> List[Surface]:
+    def frames(self) -> Sequence[AtlasRegion]:
 
         return self._frames
 
@@ -44,23 +45,33 @@ class AnimatorComponent:
 
         self._cooldown += dt
 
+        # Nobody sees the frames of steps that won't be drawn, so the time is
+        # banked and caught up on the next step that will be.
+        if not self._parent.game.sim_clock.presenting:
+            return
+
         if self._cooldown >= 0.1:  # Assuming 10 FPS
+            frames = int(self._cooldown / 0.1)
             self._cooldown = 0
-            self._current_frame += 1
+            self._current_frame = (self._current_frame + frames) % len(self._frames)
 
-            if self._current_frame >= len(self._frames):
-                self._current_frame = 0
+################################################################################
+    @property
+    def current_region(self) -> AtlasRegion:
+
+        return self._frames[self._current_frame]
 
 ################################################################################
     @property
     def current_frame(self) -> Surface:
 
-        return self._frames[self._current_frame]
+        return self._frames[self._current_frame].surface
 
 ################################################################################
     def draw(self, screen: Surface) -> None:
 
-        screen.blit(self.current_frame, self._parent.rect)
+        region = self.current_region
+        screen.blit(region.page, self._parent.rect, region.rect)
 
 ################################################################################
     def _copy(self, parent: UnitGraphical) -> AnimatorComponent:
@@ -71,10 +82,17 @@ class AnimatorComponent:
         new_obj._parent = parent
 
         new_obj._current_frame = 0
-        new_obj._frames = [f.copy() for f in self._frames]
+        # The frames belong to the unit type's shared sprites.
+        new_obj._frames = self._frames
 
         new_obj._cooldown = 0
 
         return new_obj
 
+################################################################################
+    def _recycle(self) -> None:
+
+        self._current_frame = 0
+        self._cooldown = 0
+
 ################################################################################
@@ -33,6 +33,9 @@ class GraphicalComponent:
     game : :class:`DMGame`
         The game instance.
 
+    headless : :class:`bool`
+        Whether the game has no display, so nothing is ever drawn.
+
     static : Optional[:class:`Surface`]
         The base static sprite for the object.
 
@@ -78,6 +81,14 @@ class GraphicalComponent:
 
         return self._parent.game
 
+################################################################################
+    @property
+    def headless(self) -> bool:
+        """Whether the game has no display. Components skip loading sprites
+        and only keep what they need for their geometry."""
+
+        return self._parent.game.headless
+
 ################################################################################
     @property
     def parent(self) -> DMObject:
@@ -181,8 +192,9 @@ class GraphicalComponent:
 
         new_obj._screen_pos = None
 
-        new_obj._static = self._static.copy() if self._static is not None else None
-        new_obj._zoom = self._zoom.copy() if self._zoom is not None else None
+        # Sprites are never drawn onto, so copies can share them.
+        new_obj._static = self._static
+        new_obj._zoom = self._zoom
 
         return new_obj
 
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pygame
+import struct
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools  import lru_cache
+from pygame     import Surface
+from threading  import Lock
+from typing     import Collection, Dict, Iterable, NamedTuple, Optional, Tuple
+
+################################################################################
+
+__all__ = (
+    "SpriteRequest",
+    "load_sprite",
+    "preload_sprites",
+    "finalize_sprites",
+    "loading_progress",
+    "blank_sprite",
+    "clear_sprite_cache",
+    "prune_sprite_cache",
+    "build_sprite_cache",
+)
+
+################################################################################
+# Transformed sprites are cached here as raw RGBA, so later runs can skip the
+# PNG decode and the transforms.
+CACHE_DIR = "assets/.cache"
+# Entries are keyed by the source's modification time, so edited art leaves
+# old ones behind. Past this size, the least recently used are deleted.
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_HEADER = struct.Struct("<4sII")  # Magic, width, height
+_MAGIC = b"DMSC"
+
+# Decoding is mostly file reads and zlib, both of which release the GIL.
+LOADER_THREADS = min(4, os.cpu_count() or 1)
+
+_SpriteKey = Tuple[str, bool, Optional[Tuple[int, int]]]
+
+################################################################################
+class SpriteRequest(NamedTuple):
+    """A sprite to load, along with the transforms to apply to it."""
+
+    path: str
+    flip_x: bool = False
+    size: Optional[Tuple[int, int]] = None
+
+################################################################################
+# Preloaded sprites are decoded on a thread pool and wait in `_PENDING` until
+# the main thread finalizes them into `_READY`.
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PENDING: Dict[_SpriteKey, Future] = {}
+_READY: Dict[_SpriteKey, Surface] = {}
+_LOCK = Lock()
+
+_requested: int = 0
+_finished: int = 0
+
+################################################################################
+def load_sprite(
+    path: str,
+    *,
+    flip_x: bool = False,
+    size: Optional[Tuple[int, int]] = None
+) -> Surface:
+    """Loads a sprite with the given transforms applied, converted to the
+    display's pixel format if there is a display.
+
+    The transformed image is cached on disk, keyed by the source path, its
+    modification time and the transforms, so it's only rebuilt when the art
+    changes.
+
+    Parameters:
+    -----------
+    path: :class:`str`
+        The path of the source image.
+
+    flip_x: :class:`bool`
+        Whether to flip the image horizontally.
+
+    size: Optional[Tuple[:class:`int`, :class:`int`]]
+        The size to scale the image to, if any. Scaling happens before flipping.
+
+    Returns:
+    --------
+    :class:`Surface`
+        The loaded sprite.
+
+    Notes:
+    ------
+    Sprites that were preloaded are returned from memory. If one is still
+    being decoded, this waits for it instead of decoding it again.
+    """
+
+    key = (path, flip_x, size)
+
+    try:
+        return _READY[key]
+    except KeyError:
+        pass
+
+    with _LOCK:
+        future = _PENDING.pop(key, None)
+
+    if future is None:
+        return _finalize(_decode_sprite(path, flip_x, size))
+
+    try:
+        # Let a failed decode raise here, from whatever needed the sprite.
+        sprite = _READY[key] = _finalize(future.result())
+    finally:
+        _mark_finished()
+
+    return sprite
+
+################################################################################
+def preload_sprites(requests: Iterable[SpriteRequest]) -> int:
+    """Starts decoding the given sprites on a background thread pool.
+
+    Decoding happens off the main thread, but the sprites are only converted
+    to the display's format by :func:`finalize_sprites` or :func:`load_sprite`,
+    which must be called from the main thread.
+
+    Parameters:
+    -----------
+    requests: Iterable[:class:`SpriteRequest`]
+        The sprites to load. Anything already loaded or loading is skipped.
+
+    Returns:
+    --------
+    :class:`int`
+        The number of sprites that were queued.
+    """
+
+    global _EXECUTOR, _requested
+
+    queued = 0
+    with _LOCK:
+        for path, flip_x, size in requests:
+            key = (path, flip_x, size)
+            if key in _READY or key in _PENDING:
+                continue
+
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(LOADER_THREADS, thread_name_prefix="DMAssetLoader")
+
+            _PENDING[key] = _EXECUTOR.submit(_decode_sprite, path, flip_x, size)
+            queued += 1
+
+        _requested += queued
+
+    return queued
+
+################################################################################
+def finalize_sprites(budget: float = 0.004) -> int:
+    """Converts preloaded sprites that have finished decoding, so they're
+    ready for :func:`load_sprite`. Must be called from the main thread.
+
+    Parameters:
+    -----------
+    budget: :class:`float`
+        Roughly how long to spend, in seconds, so it can be called every frame.
+
+    Returns:
+    --------
+    :class:`int`
+        The number of sprites that were finalized.
+    """
+
+    if not _PENDING:
+        return 0
+
+    deadline = time.perf_counter() + budget
+    finalized = 0
+
+    with _LOCK:
+        done = [(k, f) for k, f in _PENDING.items() if f.done()]
+
+    for key, future in done:
+        with _LOCK:
+            # `load_sprite` may have claimed it in the meantime.
+            if _PENDING.pop(key, None) is None:
+                continue
+
+        if future.exception() is None:
+            _READY[key] = _finalize(future.result())
+        # Failed decodes are dropped, so `load_sprite` retries and reports them.
+        _mark_finished()
+        finalized += 1
+
+        if time.perf_counter() >= deadline:
+            break
+
+    return finalized
+
+################################################################################
+def loading_progress() -> Tuple[int, int]:
+    """Returns how many preloaded sprites have been finalized, and how many
+    were requested in total."""
+
+    return _finished, _requested
+
+################################################################################
+def _decode_sprite(path: str, flip_x: bool, size: Optional[Tuple[int, int]]) -> Surface:
+
+    cache_path = _cache_path(path, flip_x, size)
+
+    sprite = _read_cached(cache_path) if cache_path is not None else None
+    if sprite is None:
+        sprite = pygame.image.load(path)
+        if size is not None:
+            sprite = pygame.transform.scale(sprite, size)
+        if flip_x:
+            sprite = pygame.transform.flip(sprite, True, False)
+
+        if cache_path is not None:
+            _write_cached(cache_path, sprite)
+
+    return sprite
+
+################################################################################
+def _finalize(sprite: Surface) -> Surface:
+
+    # Converting needs a display mode to have been set.
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert_alpha()
+
+    return sprite
+
+################################################################################
+def _mark_finished() -> None:
+
+    global _finished
+
+    with _LOCK:
+        _finished += 1
+
+################################################################################
+@lru_cache(maxsize=None)
+def blank_sprite(size: Tuple[int, int]) -> Surface:
+    """Returns a blank stand-in sprite of the given size, for running without
+    a display where only the geometry matters. Shared, so it must not be
+    modified."""
+
+    return Surface(size)
+
+################################################################################
+def clear_sprite_cache() -> None:
+    """Deletes every cached sprite from disk."""
+
+    if not os.path.isdir(CACHE_DIR):
+        return
+
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".raw"):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+################################################################################
+def prune_sprite_cache(max_bytes: Optional[int] = CACHE_MAX_BYTES, keep: Optional[Collection[str]] = None) -> int:
+    """Deletes cached sprites until the cache fits in the given size, least
+    recently used first. Reading a cached sprite counts as using it.
+
+    Parameters:
+    -----------
+    max_bytes: Optional[:class:`int`]
+        The most the cache may take up on disk, or None for no limit.
+
+    keep: Optional[Collection[:class:`str`]]
+        The cache paths still in use, if known. Everything else is deleted
+        regardless of size.
+
+    Returns:
+    --------
+    :class:`int`
+        The number of cached sprites that were deleted.
+    """
+
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return 0
+
+    keep = None if keep is None else {os.path.normpath(p) for p in keep}
+    entries = []
+    removed = 0
+
+    for name in names:
+        if not name.endswith(".raw"):
+            continue
+
+        cache_path = os.path.join(CACHE_DIR, name)
+        try:
+            if keep is not None and os.path.normpath(cache_path) not in keep:
+                os.remove(cache_path)
+                removed += 1
+                continue
+            stat = os.stat(cache_path)
+        except OSError:
+            continue
+
+        entries.append((stat.st_mtime_ns, stat.st_size, cache_path))
+
+    if max_bytes is None:
+        return removed
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, cache_path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(cache_path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+
+    return removed
+
+################################################################################
+def build_sprite_cache(requests: Iterable[SpriteRequest]) -> Tuple[int, int]:
+    """Fills the disk cache with the given sprites ahead of time, so the game
+    never has to, and deletes every cached sprite that isn't one of them.
+
+    Meant to be run by the asset pipeline once the art is converted, not by
+    the game.
+
+    Parameters:
+    -----------
+    requests: Iterable[:class:`SpriteRequest`]
+        Every sprite the game loads.
+
+    Returns:
+    --------
+    Tuple[:class:`int`, :class:`int`]
+        The number of sprites that were cached, and the number deleted.
+    """
+
+    keep = set()
+    work = []
+
+    for path, flip_x, size in requests:
+        cache_path = _cache_path(path, flip_x, size)
+        # No source to cache from, or listed twice.
+        if cache_path is None or cache_path in keep:
+            continue
+
+        keep.add(cache_path)
+        if not os.path.exists(cache_path):
+            work.append((path, flip_x, size))
+
+    if work:
+        with ThreadPoolExecutor(LOADER_THREADS, thread_name_prefix="DMCacheBuilder") as pool:
+            # Decoding writes the cache entry as it goes.
+            list(pool.map(lambda request: _decode_sprite(*request), work))
+
+    return len(work), prune_sprite_cache(None, keep)
+
+################################################################################
+def _cache_path(path: str, flip_x: bool, size: Optional[Tuple[int, int]]) -> Optional[str]:
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        # Let the image loader report the missing file.
+        return None
+
+    key = f"{os.path.normpath(path)}|{mtime}|flip_x={flip_x}|size={size}"
+
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".raw")
+
+################################################################################
+def _read_cached(cache_path: str) -> Optional[Surface]:
+
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    # Marks the entry as recently used, for pruning.
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+    if len(data) < _HEADER.size:
+        return None
+
+    magic, width, height = _HEADER.unpack_from(data)
+    if magic != _MAGIC or len(data) != _HEADER.size + width * height * 4:
+        return None
+
+    return pygame.image.frombytes(data[_HEADER.size:], (width, height), "RGBA")
+
+################################################################################
+def _write_cached(cache_path: str, sprite: Surface) -> None:
+
+    width, height = sprite.get_size()
+    data = _HEADER.pack(_MAGIC, width, height) + pygame.image.tobytes(sprite, "RGBA")
+
+    # Written to a temporary file first so a half-written cache entry is never
+    # read, even with sprites loading on a background thread.
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.{id(sprite)}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # The cache is only an optimization.
+        pass
+
+################################################################################
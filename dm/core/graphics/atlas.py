@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import pygame
+
+from pygame     import Rect, Surface
+from threading  import Lock
+from typing     import List, Optional, Tuple
+
+################################################################################
+
+__all__ = ("AtlasRegion", "TextureAtlas")
+
+################################################################################
+class AtlasRegion:
+    """A single sprite packed into a :class:`TextureAtlas` page.
+
+    Attributes:
+    -----------
+    page: :class:`Surface`
+        The atlas page the sprite lives on.
+
+    rect: :class:`Rect`
+        The sprite's area on the page.
+
+    surface: :class:`Surface`
+        A subsurface view of the sprite's area. Shares the page's pixels, for
+        anything that needs the sprite as a standalone surface.
+    """
+
+    __slots__ = (
+        "page",
+        "rect",
+        "surface",
+    )
+
+################################################################################
+    def __init__(self, page: Surface, rect: Rect):
+
+        self.page: Surface = page
+        self.rect: Rect = rect
+        self.surface: Surface = page.subsurface(rect)
+
+################################################################################
+    def get_size(self) -> Tuple[int, int]:
+
+        return self.rect.size
+
+################################################################################
+    def get_rect(self, **kwargs) -> Rect:
+
+        return self.surface.get_rect(**kwargs)
+
+################################################################################
+class TextureAtlas:
+    """Packs sprites onto a handful of large page surfaces, so drawing many
+    units area-blits from a few source surfaces instead of one per sprite.
+
+    Sprites are packed left to right in shelves, with a new shelf started
+    whenever the current one runs out of room and a new page started when
+    the current page does. Anything larger than a page gets a page of its own.
+
+    Attributes:
+    -----------
+    _pages: List[:class:`Surface`]
+        The atlas pages, in the order they were created.
+
+    _page_size: :class:`int`
+        The width and height of each page.
+
+    _current: Optional[:class:`Surface`]
+        The page currently being packed.
+
+    _x: :class:`int`
+        Where the next sprite goes on the current shelf.
+
+    _y: :class:`int`
+        The top of the current shelf.
+
+    _shelf_height: :class:`int`
+        The height of the tallest sprite on the current shelf.
+
+    _lock: :class:`Lock`
+        Guards packing, since sprites can be loaded from a background thread.
+    """
+
+    __slots__ = (
+        "_pages",
+        "_page_size",
+        "_current",
+        "_x",
+        "_y",
+        "_shelf_height",
+        "_lock",
+    )
+
+    PAGE_SIZE = 2048
+    PADDING = 1  # Keeps neighbouring sprites from bleeding into each other.
+
+################################################################################
+    def __init__(self, page_size: int = PAGE_SIZE):
+
+        self._page_size: int = page_size
+        self._pages: List[Surface] = []
+        self._current: Optional[Surface] = None
+
+        self._x: int = 0
+        self._y: int = 0
+        self._shelf_height: int = 0
+
+        self._lock: Lock = Lock()
+
+################################################################################
+    @property
+    def pages(self) -> List[Surface]:
+
+        return self._pages
+
+################################################################################
+    def add(self, sprite: Surface) -> AtlasRegion:
+        """Copies the given sprite onto the atlas.
+
+        Parameters:
+        -----------
+        sprite: :class:`Surface`
+            The sprite to pack. Can be thrown away afterward.
+
+        Returns:
+        --------
+        :class:`AtlasRegion`
+            Where the sprite ended up.
+        """
+
+        width, height = sprite.get_size()
+
+        with self._lock:
+            page, position = self._allocate(width, height)
+            # Pages start fully transparent, so this copies the pixels as-is.
+            page.blit(sprite, position)
+
+        return AtlasRegion(page, Rect(position, (width, height)))
+
+################################################################################
+    def _allocate(self, width: int, height: int) -> Tuple[Surface, Tuple[int, int]]:
+
+        size = self._page_size
+        if width > size or height > size:
+            page = self._make_page((width, height))
+            self._pages.append(page)
+            return page, (0, 0)
+
+        if self._current is None:
+            self._new_page()
+
+        # Start a new shelf if the sprite doesn't fit on the current one.
+        if self._x + width > size:
+            self._x = 0
+            self._y += self._shelf_height + self.PADDING
+            self._shelf_height = 0
+
+        # Start a new page if the sprite doesn't fit below the current shelf.
+        if self._y + height > size:
+            self._new_page()
+
+        position = (self._x, self._y)
+
+        self._x += width + self.PADDING
+        self._shelf_height = max(self._shelf_height, height)
+
+        return self._current, position
+
+################################################################################
+    def _new_page(self) -> None:
+
+        self._current = self._make_page((self._page_size, self._page_size))
+        self._pages.append(self._current)
+
+        self._x = 0
+        self._y = 0
+        self._shelf_height = 0
+
+################################################################################
+    @staticmethod
+    def _make_page(size: Tuple[int, int]) -> Surface:
+
+        page = Surface(size, pygame.SRCALPHA)
+        # Match the display's pixel format so blits from the page don't need
+        # converting, if there's a display to match yet.
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        # Make sure the page starts fully transparent after converting.
+        page.fill((0, 0, 0, 0))
+
+        return page
+
+################################################################################
+    def clear(self) -> None:
+
+        with self._lock:
+            self._pages.clear()
+            self._current = None
+
+            self._x = 0
+            self._y = 0
+            self._shelf_height = 0
+
+################################################################################
@@ -3,9 +3,12 @@ from __future__ import annotations
 import pygame
 
 from pygame     import Rect, Surface, Vector2
-from typing     import TYPE_CHECKING, Optional, Tuple, Type, TypeVar
+from typing     import TYPE_CHECKING, List, Optional, Tuple, Type, TypeVar
 
 from ._animator  import AnimatorComponent
+from .assets    import SpriteRequest, load_sprite
+from .atlas     import AtlasRegion
+from .sprites   import SpriteCache, UnitSprites
 from .unit    import UnitGraphical
 from utilities      import *
 
@@ -31,19 +34,38 @@ class HeroGraphical(UnitGraphical):
     def __init__(self, parent: DMHero, frame_count: int = 5):
 
         # Instantiate this first so it's present when we call `_load_sprites` in the parent.
-        self._death: Optional[Surface] = None
+        self._death: Optional[AtlasRegion] = None
 
         super().__init__(parent, frame_count)
 
 ################################################################################
-    def _load_sprites(self) -> None:
+    @classmethod
+    def sprite_requests(cls, unit_type: Type[DMHero]) -> List[SpriteRequest]:
 
-        super()._load_sprites()
+        return super().sprite_requests(unit_type) + [cls._death_request(unit_type)]
 
-        if self._death is None:
-            self._death = pygame.image.load(
-                f"assets/sprites/heroes/{class_to_file_name(self._parent)}/death.png"
-            )
+################################################################################
+    @staticmethod
+    def _death_request(unit_type: Type[DMHero]) -> SpriteRequest:
+
+        return SpriteRequest(f"assets/sprites/heroes/{class_to_file_name(unit_type)}/death.png")
+
+################################################################################
+    def _build_sprites(self) -> UnitSprites:
+
+        death = self._death_request(type(self._parent))
+
+        sprites = super()._build_sprites()
+        sprites.death = SpriteCache.atlas().add(load_sprite(death.path))
+
+        return sprites
+
+################################################################################
+    def _apply_sprites(self, sprites: UnitSprites) -> None:
+
+        super()._apply_sprites(sprites)
+
+        self._death = sprites.death
 
 ################################################################################
     def _init_screen_pos(self) -> None:
@@ -52,12 +74,12 @@ class HeroGraphical(UnitGraphical):
 
 ################################################################################
     @property
-    def current_frame(self) -> Surface:
+    def current_region(self) -> AtlasRegion:
 
         if self.dying:
             return self._death
 
-        return super().current_frame
+        return super().current_region
 
 ################################################################################
     @property
@@ -78,7 +100,7 @@ class HeroGraphical(UnitGraphical):
 
         new_obj: Type[HG] = super()._copy(parent)  # type: ignore
 
-        new_obj._death = self._death.copy()
+        new_obj._death = self._death
 
         return new_obj
 
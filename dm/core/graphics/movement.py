@@ -123,18 +123,26 @@ class MovementComponent:
         if self._target_pos is None:
             self.set_target_pos()
 
-        if self._direction.x != 0:
-            self.screen_pos.x += self._direction.x * HERO_SPEED * dt
+        distance = HERO_SPEED * dt
+
+        # Land on the target rather than stepping past it, which could leave
+        # it out of reach of the arrival check.
+        if self._target_pos is not None and self.screen_pos.distance_to(self._target_pos) <= distance:
+            self.screen_pos = Vector2(self._target_pos)
+        elif self._direction.x != 0:
+            self.screen_pos.x += self._direction.x * distance
         elif self._direction.y != 0:
-            self.screen_pos.y += self._direction.y * HERO_SPEED * dt
+            self.screen_pos.y += self._direction.y * distance
 
         current_grid_pos = pixel_to_grid(self.screen_pos)
         if self.room != self.game.get_room_at(current_grid_pos):
             self.parent.set_room(current_grid_pos)
 
         if self.arrived_at_target():
+            # Arrival counts from a few pixels out, so land exactly on the
+            # target or the shortfall builds up with every room crossed.
+            self.screen_pos = Vector2(self._target_pos)
             self.stop_movement()
-            # self.sync_screen_pos()
             self.check_for_encounter()
 
 ################################################################################
@@ -152,7 +160,11 @@ class MovementComponent:
         else:
             self.screen_pos = self.room.center
 
-        self._target_pos = None
+        # A hero can already be on its way to the next room by the time its
+        # last attack finishes. Back on the room's centre, it's still lined up
+        # with that target, so keep it rather than leaving it heading nowhere.
+        if not self._moving:
+            self._target_pos = None
 
 ################################################################################
     def start_movement(self) -> None:
@@ -192,6 +204,10 @@ class MovementComponent:
 
         self._moving = False
 
+        # Dead heroes leave the dungeon once they're off screen.
+        if self.parent.is_hero():
+            self.game.dungeon.remove_hero(self.parent)  # type: ignore
+
 ################################################################################
     def set_target_pos(self) -> None:
 
@@ -207,7 +223,7 @@ class MovementComponent:
 ################################################################################
     def choose_direction(self) -> None:
 
-        self._direction = self.parent.random.choice(self.DIRECTIONS)
+        self._direction = self.parent.random.stream("movement").choice(self.DIRECTIONS)
         target_room = self.game.get_room_at(self.room.grid_pos + self._direction)
         if target_room is None or target_room.is_entrance:
             self.choose_direction()
@@ -239,4 +255,16 @@ class MovementComponent:
 
         return new_obj
 
+################################################################################
+    def _recycle(self) -> None:
+
+        self._direction = Vector2(-1, 0)
+        self._moving = True if self.parent.is_hero() else False
+        self._target_pos = None
+        self._move_cooldown = 0
+
+        self._death_timer = None
+        self._death_start = None
+        self._death_end = None
+
 ################################################################################
@@ -4,9 +4,10 @@ import asyncio
 import pygame.image
 
 from pygame     import Rect, Surface, Vector2
-from typing     import TYPE_CHECKING, Optional, Type, TypeVar
+from typing     import TYPE_CHECKING, List, Optional, Type, TypeVar
 
 from ._graphical import GraphicalComponent
+from .assets     import SpriteRequest, blank_sprite, load_sprite
 from utilities   import *
 
 if TYPE_CHECKING:
@@ -43,21 +44,35 @@ class DMRoomGraphics(GraphicalComponent):
         if self._static is not None:
             return
 
-        self._static = pygame.image.load(
-            f"assets/sprites/rooms/{class_to_file_name(self._parent)}.png"
-        )
+        sprite, = self.sprite_requests(type(self._parent))
+        if self.headless:
+            # Only the size is needed without a display.
+            self._static = blank_sprite(sprite.size)
+        else:
+            self._static = load_sprite(sprite.path, flip_x=sprite.flip_x, size=sprite.size)
+
+        self._surface.fill(ROOM_BG if type(self.parent).__name__ != "EntranceRoom" else BLACK)
+
+################################################################################
+    @staticmethod
+    def sprite_requests(room_type: Type[DMRoom]) -> List[SpriteRequest]:
+        """Returns the sprites a room type needs, so they can be preloaded
+        before any room of that type is created."""
 
         # Scale the image to fit the room.
-        if type(self.parent).__name__ != "BossRoom":
-            self._static = pygame.transform.scale(self._static, (ROOM_SIZE - 30, ROOM_SIZE - 30))
+        if room_type.__name__ != "BossRoom":
+            size = (ROOM_SIZE - 30, ROOM_SIZE - 30)
         else:
-            self._static = pygame.transform.scale(self._static, (ROOM_SIZE + 40, ROOM_SIZE + 25))
-
-        # Flip the entry symbol. Looks better.
-        if type(self._parent).__name__ == "EntranceRoom":
-            self._static = pygame.transform.flip(self._static, True, False)
+            size = (ROOM_SIZE + 40, ROOM_SIZE + 25)
 
-        self._surface.fill(ROOM_BG if type(self.parent).__name__ != "EntranceRoom" else BLACK)
+        return [
+            SpriteRequest(
+                f"assets/sprites/rooms/{class_to_file_name(room_type)}.png",
+                # Flip the entry symbol. Looks better.
+                flip_x=room_type.__name__ == "EntranceRoom",
+                size=size
+            )
+        ]
 
 ################################################################################
     @property
@@ -78,8 +93,23 @@ class DMRoomGraphics(GraphicalComponent):
     @property
     def center(self) -> Vector2:
 
+        if self._rect is None:
+            self.calculate_rect()
+
         return Vector2(self._rect.center)
 
+################################################################################
+    @property
+    def bounds(self) -> Rect:
+        """The full area the room draws to. The boss room's sprite is bigger
+        than its tile, so this can spill over into its neighbours."""
+
+        if self._rect is None:
+            self.calculate_rect()
+
+        idle_rect = self.static.get_rect(center=self._rect.center)
+        return self._rect.union(idle_rect)
+
 ################################################################################
     def calculate_rect(self) -> None:
 
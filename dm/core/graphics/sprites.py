@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from pygame     import Rect, Surface
+from typing     import Callable, Dict, Optional, Tuple
+
+from .assets    import blank_sprite
+from .atlas     import AtlasRegion, TextureAtlas
+
+################################################################################
+
+__all__ = ("UnitSprites", "SpriteCache")
+
+################################################################################
+class UnitSprites:
+    """The sprites for a single unit type, shared by every instance of it.
+
+    The sprites drawn in the dungeon are packed into the shared
+    :class:`TextureAtlas`. None of them should be modified after they're
+    built. Anything that varies per instance, like the death fade, is applied
+    when the sprite is drawn.
+
+    Attributes:
+    -----------
+    attack: :class:`AtlasRegion`
+        The attack sprite.
+
+    zoom: :class:`Surface`
+        The zoomed sprite. Only shown in menus, so it isn't packed.
+
+    frames: Tuple[:class:`AtlasRegion`, ...]
+        The idle animation frames, split from the spritesheet.
+
+    death: Optional[:class:`AtlasRegion`]
+        The death sprite, if the unit type has one.
+    """
+
+    __slots__ = (
+        "attack",
+        "zoom",
+        "frames",
+        "death",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        attack: AtlasRegion,
+        zoom: Surface,
+        frames: Tuple[AtlasRegion, ...],
+        death: Optional[AtlasRegion] = None
+    ):
+
+        self.attack: AtlasRegion = attack
+        self.zoom: Surface = zoom
+        self.frames: Tuple[AtlasRegion, ...] = frames
+        self.death: Optional[AtlasRegion] = death
+
+################################################################################
+class SpriteCache:
+    """A class-keyed cache of :class:`UnitSprites`, so each unit type's
+    images are only loaded, split and packed once."""
+
+    _SPRITES: Dict[type, UnitSprites] = {}
+    _NULL: Dict[int, UnitSprites] = {}
+    _ATLAS: TextureAtlas = TextureAtlas()
+
+    NULL_SPRITE_SIZE = (48, 48)  # Roughly the size of most unit sprites.
+
+################################################################################
+    @classmethod
+    def atlas(cls) -> TextureAtlas:
+        """Returns the atlas every unit sprite is packed into."""
+
+        return cls._ATLAS
+
+################################################################################
+    @classmethod
+    def get(cls, unit_type: type, build: Callable[[], UnitSprites]) -> UnitSprites:
+        """Returns the sprites for the given unit type, building them first
+        if they haven't been yet.
+
+        Parameters:
+        -----------
+        unit_type: :class:`type`
+            The unit class the sprites belong to.
+
+        build: Callable[[], :class:`UnitSprites`]
+            Loads the sprites if they aren't cached.
+
+        Returns:
+        --------
+        :class:`UnitSprites`
+            The shared sprites for the unit type.
+        """
+
+        try:
+            return cls._SPRITES[unit_type]
+        except KeyError:
+            sprites = cls._SPRITES[unit_type] = build()
+            return sprites
+
+################################################################################
+    @classmethod
+    def null(cls, frame_count: int) -> UnitSprites:
+        """Returns blank stand-in sprites for headless runs, where units need a
+        size to position themselves but nothing is ever drawn.
+
+        Parameters:
+        -----------
+        frame_count: :class:`int`
+            The number of idle animation frames the unit expects.
+
+        Returns:
+        --------
+        :class:`UnitSprites`
+            Sprites whose every region is the same blank square.
+        """
+
+        try:
+            return cls._NULL[frame_count]
+        except KeyError:
+            pass
+
+        page = blank_sprite(cls.NULL_SPRITE_SIZE)
+        region = AtlasRegion(page, Rect((0, 0), cls.NULL_SPRITE_SIZE))
+
+        sprites = cls._NULL[frame_count] = UnitSprites(region, page, (region,) * frame_count, region)
+        return sprites
+
+################################################################################
+    @classmethod
+    def clear(cls) -> None:
+
+        cls._SPRITES.clear()
+        cls._ATLAS.clear()
+
+################################################################################
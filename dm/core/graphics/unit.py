@@ -7,7 +7,10 @@ from typing     import TYPE_CHECKING, List, Optional, Tuple, Type, TypeVar
 
 from ._animator  import AnimatorComponent
 from ._graphical    import GraphicalComponent
+from .assets    import SpriteRequest, load_sprite
+from .atlas     import AtlasRegion
 from .movement import MovementComponent
+from .sprites   import SpriteCache, UnitSprites
 from utilities      import *
 
 if TYPE_CHECKING:
@@ -26,13 +29,13 @@ class UnitGraphical(GraphicalComponent):
         "_mover",
         "_attack",
         "_animator",
-        "_spritesheet",
         "_frame_count",
         "_frame_size",
         "_attack_timer",
         "_attacking",
         "_final_attack",
         "_death_alpha",
+        "_prev_screen_pos",
     )
 
     DEATH_FADE_SPEED = 127.5  # Fading the alpha 255 to 0 in 2 seconds.
@@ -43,8 +46,7 @@ class UnitGraphical(GraphicalComponent):
 
         super().__init__(parent)
 
-        self._attack: Optional[Surface] = None
-        self._spritesheet: Optional[Surface] = None
+        self._attack: Optional[AtlasRegion] = None
 
         self._frame_count: int = frame_count
         self._frame_size: Optional[Tuple[int, int]] = None
@@ -58,33 +60,81 @@ class UnitGraphical(GraphicalComponent):
 
         self._death_alpha: float = 255.0
 
-        self._load_sprites()
+        # Where the unit was before the last update, for drawing in between.
+        self._prev_screen_pos: Optional[Vector2] = None
+
+        # Sprites are loaded by the unit once it knows which game it's in.
 
 ################################################################################
     def _load_sprites(self) -> None:
 
-        if self._attack is None:
-            self._attack = pygame.image.load(
-                f"assets/sprites/{self.subdir}/{class_to_file_name(self._parent)}/attack.png"
-            )
-            # Flip the attack sprite for monsters because it's the wrong way. Pfft.
-            if self.subdir == "monsters":
-                self._attack = pygame.transform.flip(self._attack, True, False)
-
-        if self._zoom is None:
-            self._zoom = pygame.image.load(
-                f"assets/sprites/{self.subdir}/{class_to_file_name(self._parent)}/zoom.png"
-            )
-        if self._spritesheet is None:
-            self._spritesheet = pygame.image.load(
-                f"assets/sprites/{self.subdir}/{class_to_file_name(self._parent)}/idle.png"
-            )
-            # Flip the idle sprites for monsters because they're the wrong way. Pfft.
-            if self.subdir == "monsters":
-                self._spritesheet = pygame.transform.flip(self._spritesheet, True, False)
-
-            self._assert_frame_size()
-            self._split_spritesheet()
+        # If we're copying a pre-existing graphical component, we already
+        # have the shared sprites.
+        if self._attack is not None:
+            return
+
+        # Without a display, units only need a size to position themselves by.
+        if self.headless:
+            self._apply_sprites(SpriteCache.null(self._frame_count))
+            return
+
+        # Every instance of a unit type shares the same surfaces.
+        self._apply_sprites(SpriteCache.get(type(self._parent), self._build_sprites))
+
+################################################################################
+    @classmethod
+    def sprite_requests(cls, unit_type: Type[DMUnit]) -> List[SpriteRequest]:
+        """Returns the sprites a unit type needs, so they can be preloaded
+        before any unit of that type is created.
+
+        Parameters:
+        -----------
+        unit_type: Type[:class:`DMUnit`]
+            The unit class to list the sprites of.
+
+        Returns:
+        --------
+        List[:class:`SpriteRequest`]
+            The attack, zoom and idle sprites, in that order.
+        """
+
+        subdir = "monsters" if unit_type.is_monster() else "heroes"
+        path = f"assets/sprites/{subdir}/{class_to_file_name(unit_type)}"
+
+        # Flip the attack and idle sprites for monsters because they're the wrong way. Pfft.
+        flip = unit_type.is_monster()
+
+        return [
+            SpriteRequest(f"{path}/attack.png", flip_x=flip),
+            SpriteRequest(f"{path}/zoom.png"),
+            SpriteRequest(f"{path}/idle.png", flip_x=flip),
+        ]
+
+################################################################################
+    def _build_sprites(self) -> UnitSprites:
+        """Loads the sprites for the parent's unit type. Only called the first
+        time a unit of that type is created."""
+
+        attack, zoom, spritesheet = (
+            load_sprite(r.path, flip_x=r.flip_x, size=r.size)
+            for r in UnitGraphical.sprite_requests(type(self._parent))
+        )
+
+        # Everything drawn in the dungeon goes into the shared atlas, after
+        # which the loaded surfaces can be dropped.
+        atlas = SpriteCache.atlas()
+        frames = tuple(atlas.add(f) for f in self._split_spritesheet(spritesheet))
+
+        return UnitSprites(atlas.add(attack), zoom, frames)
+
+################################################################################
+    def _apply_sprites(self, sprites: UnitSprites) -> None:
+
+        self._attack = sprites.attack
+        self._zoom = sprites.zoom
+
+        self._frame_size = sprites.frames[0].get_size()
+        self._animator._frames = sprites.frames
 
 ################################################################################
     @property
@@ -116,31 +166,79 @@ class UnitGraphical(GraphicalComponent):
 
         return self._attack_timer > 0 and self._attacking
 
+################################################################################
+    @property
+    def idle(self) -> bool:
+        """Whether updating this unit would change nothing that matters to
+        the simulation: it isn't moving, attacking or dying."""
+
+        if self._death_alpha <= 0:
+            return True
+
+        return not (self._attacking or self.moving or self.dying)
+
 ################################################################################
     def draw(self, screen: Surface) -> None:
 
         if self._death_alpha <= 0:
             return
 
-        pos_rect = self.current_frame.get_rect(center=self.screen_pos)
-        screen.blit(self.current_frame, pos_rect)
+        region = self.current_region
+        pos_rect = self.screen_rect
+
+        if self._death_alpha >= 255:
+            screen.blit(region.page, pos_rect, region.rect)
+            return
+
+        # The atlas page is shared by every unit, so the fade is only applied
+        # for the length of this blit.
+        page = region.page
+        alpha = page.get_alpha()
+        page.set_alpha(int(self._death_alpha))
+        screen.blit(page, pos_rect, region.rect)
+        page.set_alpha(alpha)
+
+################################################################################
+    @property
+    def draw_pos(self) -> Vector2:
+        """Where the unit is drawn. Interpolated between its last two positions
+        by how far the frame is between simulation steps."""
+
+        if self._prev_screen_pos is None:
+            return self.screen_pos
+
+        return self._prev_screen_pos.lerp(self.screen_pos, self.game.sim_clock.alpha)
 
 ################################################################################
-    def _assert_frame_size(self) -> None:
+    @property
+    def screen_rect(self) -> Rect:
+        """The area of the screen the unit is drawn to."""
 
-        if self._frame_size is None:
-            sheet_width, sheet_height = self._spritesheet.get_size()
-            self._frame_size = sheet_width // self._frame_count, sheet_height
+        return self.current_region.get_rect(center=self.draw_pos)
 
 ################################################################################
-    def _split_spritesheet(self) -> None:
+    def draw_state(self) -> Optional[Tuple[AtlasRegion, Rect, int]]:
+        """Returns everything that decides how the unit looks on screen, so the
+        renderer can tell whether it needs redrawing, or None if the unit
+        isn't visible."""
+
+        if self._death_alpha <= 0:
+            return None
+
+        return self.current_region, self.screen_rect, int(self._death_alpha)
+
+################################################################################
+    def _split_spritesheet(self, spritesheet: Surface) -> Tuple[Surface, ...]:
+
+        sheet_width, sheet_height = spritesheet.get_size()
+        frame_size = sheet_width // self._frame_count, sheet_height
 
         frames = []
         for i in range(self._frame_count):
-            frame_location = (i * self._frame_size[0], 0)
-            frames.append(self._spritesheet.subsurface(Rect(frame_location, self._frame_size)))
+            frame_location = (i * frame_size[0], 0)
+            frames.append(spritesheet.subsurface(Rect(frame_location, frame_size)))
 
-        self._animator._frames = frames
+        return tuple(frames)
 
 ################################################################################
     def update(self, dt: float) -> None:
@@ -148,6 +246,11 @@ class UnitGraphical(GraphicalComponent):
         if self._death_alpha <= 0:
             return
 
+        # Only the step right before a frame is drawn is interpolated from.
+        # A copy, since movement changes the position in place.
+        if self.game.sim_clock.presenting:
+            self._prev_screen_pos = Vector2(self.screen_pos)
+
         if self.parent._opponent is None and self._attack_timer <= 0:
             self._attacking = False
 
@@ -157,6 +260,10 @@ class UnitGraphical(GraphicalComponent):
         if self.dying:
             self.death_fade(dt)
             self._mover.update_death(dt)
+            # The fade can run out a frame before the death arc does, and
+            # nothing gets updated after that, so wrap the death up here.
+            if self._death_alpha <= 0 and self._mover._death_timer is not None:
+                self._mover.finish_death()
         elif self.moving:
             self._mover.update_movement(dt)
 
@@ -170,12 +277,19 @@ class UnitGraphical(GraphicalComponent):
 
 ################################################################################
     @property
-    def current_frame(self) -> Surface:
+    def current_region(self) -> AtlasRegion:
+        """The atlas region of the sprite currently being shown."""
 
         if self.attacking:
             return self._attack
 
-        return self._animator.current_frame
+        return self._animator.current_region
+
+################################################################################
+    @property
+    def current_frame(self) -> Surface:
+
+        return self.current_region.surface
 
 ################################################################################
     @property
@@ -191,8 +305,8 @@ class UnitGraphical(GraphicalComponent):
         new_obj._animator = self._animator._copy(new_obj)
         new_obj._mover = self._mover._copy(new_obj)
 
-        new_obj._attack = self._attack.copy()
-        new_obj._spritesheet = self._spritesheet.copy()
+        # Sprites are shared, not copied.
+        new_obj._attack = self._attack
 
         new_obj._frame_count = self._frame_count
         new_obj._frame_size = self._frame_size
@@ -202,9 +316,25 @@ class UnitGraphical(GraphicalComponent):
         new_obj._final_attack = False
 
         new_obj._death_alpha = 255.0
+        new_obj._prev_screen_pos = None
 
         return new_obj
 
+################################################################################
+    def _recycle(self) -> None:
+
+        self._screen_pos = None
+
+        self._animator._recycle()
+        self._mover._recycle()
+
+        self._attack_timer = self.ATTACK_COOLDOWN
+        self._attacking = False
+        self._final_attack = False
+
+        self._death_alpha = 255.0
+        self._prev_screen_pos = None
+
 ################################################################################
     def play_attack(self, final: bool) -> None:
 
@@ -227,12 +357,10 @@ class UnitGraphical(GraphicalComponent):
 
         self._death_alpha -= dt * self.DEATH_FADE_SPEED
         self._death_alpha = max(self._death_alpha, 0)
-        self.current_frame.set_alpha(self._death_alpha)  # type: ignore
 
 ################################################################################
     def reset_alpha(self) -> None:
 
         self._death_alpha = 255.0
-        self.current_frame.set_alpha(self._death_alpha)  # type: ignore
 
 ################################################################################
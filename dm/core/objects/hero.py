@@ -81,6 +81,11 @@ class DMHero(DMUnit):
 
         return new_obj
 
+################################################################################
+    def _recycle(self, **kwargs) -> None:
+
+        super()._recycle(room=self.game.dungeon.entrance_tile.grid_pos)
+
 ################################################################################
     @staticmethod
     def is_hero() -> bool:
@@ -19,6 +19,10 @@ DMObj = TypeVar("DMObj", bound="DMObject")
 class DMObject:
     """The base class for most objects in the game.
 
+    Concrete objects declare their object ID, name and rank as the class
+    attributes `OBJ_ID`, `NAME` and `RANK`, so the object pool can read
+    them without building the object.
+
     Attributes:
     -----------
     _uuid: :class:`UUID`
@@ -70,6 +74,9 @@ class DMObject:
     _copy(**kwargs) -> :class:`DMObject`
         Returns a copy of the object. Should be augmented by subclasses.
 
+    _recycle(**kwargs) -> None
+        Readies a retired object for reuse. Should be augmented by subclasses.
+
     is_room() -> :class:`bool`
         Returns whether or not the object is a room.
 
@@ -98,6 +105,10 @@ class DMObject:
         "_rank",
     )
 
+    OBJ_ID: Optional[str] = None
+    NAME: Optional[str] = None
+    RANK: int = 0
+
 ################################################################################
     def __init__(
         self,
@@ -183,7 +194,7 @@ class DMObject:
     def random(self) -> DMGenerator:
         """Returns the game's random number generator."""
 
-        return self._state._rng
+        return self._state.random
 
 ################################################################################
     def listen(self, event: str, callback: Optional[Callable] = None) -> None:
@@ -233,6 +244,16 @@ class DMObject:
 
         return new_obj
 
+################################################################################
+    def _recycle(self, **kwargs) -> None:
+        """Readies a retired object to be spawned again, leaving it in the
+        same state as a fresh `_copy()` with the given kwargs. The UUID **is**
+        regenerated, so the recycled object doesn't compare equal to its
+        previous life.
+        """
+
+        self._uuid = uuid4()
+
 ################################################################################
     @staticmethod
     def is_room() -> bool:
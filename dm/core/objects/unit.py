@@ -36,6 +36,7 @@ class DMUnit(DMObject):
         "_graphics",
         "_room",
         "_opponent",
+        "_retained",
     )
 
 ################################################################################
@@ -57,8 +58,14 @@ class DMUnit(DMObject):
         self._stats: UnitStats = stats
 
         self._graphics: Union[HeroGraphical, MonsterGraphical] = graphics
+        # The graphics are made before the unit has a game, and whether
+        # there's anything to draw on depends on the game.
+        self._graphics._load_sprites()
 
         self._opponent: Optional[DMUnit] = None
+        # Set once something outside the game may be holding on to the unit,
+        # after which it's never recycled.
+        self._retained: bool = False
 
 ################################################################################
     @property
@@ -119,9 +126,35 @@ class DMUnit(DMObject):
         new_obj._stats = self._stats._copy()
 
         new_obj._opponent = None
+        new_obj._retained = False
 
         return new_obj
 
+################################################################################
+    def _recycle(self, **kwargs) -> None:
+
+        super()._recycle()
+
+        self._room = kwargs.pop("room")
+        self._graphics._recycle()
+        self._stats._recycle()
+        self._opponent = None
+
+################################################################################
+    @property
+    def retained(self) -> bool:
+        """Whether something outside the game may still be holding on to the
+        unit, so it mustn't be recycled."""
+
+        return self._retained
+
+################################################################################
+    def retain(self) -> None:
+        """Keeps the unit from ever being recycled, e.g. because an event
+        subscriber was handed a context that refers to it."""
+
+        self._retained = True
+
 ################################################################################
     @staticmethod
     def is_monster() -> bool:
@@ -231,7 +264,7 @@ class DMUnit(DMObject):
         self.play_attack_animation(True)
 
         if self.is_hero() and self.is_alive:
-            if self.random.chance(20):
+            if self.random.stream("combat").chance(20):
                 self.check_for_encounter()
             else:
                 self.start_movement()
@@ -13,13 +13,17 @@ __all__ = ("Farmer",)
 ################################################################################
 class Farmer(DMHero):
 
+    OBJ_ID = "HRO-101"
+    NAME = "Farmer"
+    RANK = 1
+
     def __init__(self, game: DMGame):
 
         super().__init__(
             state=game,
-            _id="HRO-101",
-            name="Farmer",
-            rank=1,
+            _id=self.OBJ_ID,
+            name=self.NAME,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -13,13 +13,17 @@ __all__ = ("Villager",)
 ################################################################################
 class Villager(DMHero):
 
+    OBJ_ID = "HRO-102"
+    NAME = "Villager"
+    RANK = 1
+
     def __init__(self, game: DMGame):
 
         super().__init__(
             state=game,
-            _id="HRO-102",
-            name="Villager",
-            rank=1,
+            _id=self.OBJ_ID,
+            name=self.NAME,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,13 +14,17 @@ __all__ = ("Bat",)
 ################################################################################
 class Bat(DMMonster):
 
+    OBJ_ID = "MON-104"
+    NAME = "Bat"
+    RANK = 1
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-104",
-            name="Bat",
-            rank=1,
+            _id=self.OBJ_ID,
+            name=self.NAME,
+            rank=self.RANK,
             anim_frames=6,
             life=3,
             atk=6,
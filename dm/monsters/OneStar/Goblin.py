@@ -14,13 +14,17 @@ __all__ = ("Goblin",)
 ################################################################################
 class Goblin(DMMonster):
 
+    OBJ_ID = "MON-103"
+    NAME = "Goblin"
+    RANK = 1
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-103",
-            name="Goblin",
-            rank=1,
+            _id=self.OBJ_ID,
+            name=self.NAME,
+            rank=self.RANK,
             life=50,
             atk=4,
             defense=1.0
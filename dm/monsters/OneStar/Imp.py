@@ -14,13 +14,17 @@ __all__ = ("Imp",)
 ################################################################################
 class Imp(DMMonster):
 
+    OBJ_ID = "MON-102"
+    NAME = "Imp"
+    RANK = 1
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-102",
-            name="Imp",
-            rank=1,
+            _id=self.OBJ_ID,
+            name=self.NAME,
+            rank=self.RANK,
             life=40,
             atk=6,
             defense=2.0
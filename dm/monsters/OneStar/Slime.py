@@ -14,13 +14,17 @@ __all__ = ("Slime",)
 ################################################################################
 class Slime(DMMonster):
 
+    OBJ_ID = "MON-101"
+    NAME = "Slime"
+    RANK = 1
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-101",
-            name="Slime",
-            rank=1,
+            _id=self.OBJ_ID,
+            name=self.NAME,
+            rank=self.RANK,
             life=50,
             atk=5,
             defense=2.0
@@ -14,15 +14,19 @@ __all__ = ("Cerberus",)
 ################################################################################
 class Cerberus(DMMonster):
 
+    OBJ_ID = "MON-131"
+    NAME = "Cerberus"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-131",
-            name="Cerberus",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=130,
             atk=14,
             defense=5.5,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,15 +14,19 @@ __all__ = ("DireWolf",)
 ################################################################################
 class DireWolf(DMMonster):
 
+    OBJ_ID = "MON-132"
+    NAME = "Dire Wolf"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-132",
-            name="Dire Wolf",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=100,
             atk=16,
             defense=5.5,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
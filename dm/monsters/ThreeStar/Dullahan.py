@@ -14,15 +14,19 @@ __all__ = ("Dullahan",)
 ################################################################################
 class Dullahan(DMMonster):
 
+    OBJ_ID = "MON-137"
+    NAME = "Dullahan"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-137",
-            name="Dullahan",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=130,
             atk=14,
             defense=7,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
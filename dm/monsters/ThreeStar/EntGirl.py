@@ -14,15 +14,19 @@ __all__ = ("EntGirl",)
 ################################################################################
 class EntGirl(DMMonster):
 
+    OBJ_ID = "MON-119"
+    NAME = "Ent Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-119",
-            name="Ent Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=100,
             atk=16,
             defense=8,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
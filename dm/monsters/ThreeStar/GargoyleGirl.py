@@ -14,15 +14,19 @@ __all__ = ("GargoyleGirl",)
 ################################################################################
 class GargoyleGirl(DMMonster):
 
+    OBJ_ID = "MON-126"
+    NAME = "Gargoyle Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-126",
-            name="Gargoyle Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=130,
             atk=14,
             defense=7,
-            rank=3,
+            rank=self.RANK,
             anim_frames=6
         )
 
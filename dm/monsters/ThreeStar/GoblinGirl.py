@@ -14,15 +14,19 @@ __all__ = ("GoblinGirl",)
 ################################################################################
 class GoblinGirl(DMMonster):
 
+    OBJ_ID = "MON-118"
+    NAME = "Goblin Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-118",
-            name="Goblin Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=80,
             atk=17,
             defense=7,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
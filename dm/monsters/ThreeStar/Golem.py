@@ -14,15 +14,19 @@ __all__ = ("Golem",)
 ################################################################################
 class Golem(DMMonster):
 
+    OBJ_ID = "MON-133"
+    NAME = "Golem"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-133",
-            name="Golem",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=130,
             atk=14,
             defense=8,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,15 +14,19 @@ __all__ = ("HellHoundGirl",)
 ################################################################################
 class HellHoundGirl(DMMonster):
 
+    OBJ_ID = "MON-122"
+    NAME = "Hell Hound Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-122",
-            name="Hell Hound Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=85,
             atk=16,
             defense=6.5,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
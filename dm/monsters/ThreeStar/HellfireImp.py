@@ -14,15 +14,19 @@ __all__ = ("HellfireImp",)
 ################################################################################
 class HellfireImp(DMMonster):
 
+    OBJ_ID = "MON-138"
+    NAME = "Hellfire Imp"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
         super().__init__(
             game, start_cell,
-            _id="MON-138",
-            name="Hellfire Imp",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=110,
             atk=20,
             defense=9,
-            rank=3,
+            rank=self.RANK,
             anim_frames=6
         )
 
@@ -14,16 +14,20 @@ __all__ = ("HighOrc",)
 ################################################################################
 class HighOrc(DMMonster):
 
+    OBJ_ID = "MON-130"
+    NAME = "High Orc"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-130",
-            name="High Orc",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=120,
             atk=15,
             defense=6,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
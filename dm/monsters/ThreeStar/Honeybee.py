@@ -14,16 +14,20 @@ __all__ = ("Honeybee",)
 ################################################################################
 class Honeybee(DMMonster):
 
+    OBJ_ID = "MON-140"
+    NAME = "Honeybee"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-140",
-            name="Honeybee",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=130,
             atk=15,
             defense=12,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
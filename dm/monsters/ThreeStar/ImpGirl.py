@@ -14,16 +14,20 @@ __all__ = ("ImpGirl",)
 ################################################################################
 class ImpGirl(DMMonster):
 
+    OBJ_ID = "MON-121"
+    NAME = "Imp Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-121",
-            name="Imp Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=75,
             atk=17,
             defense=8.75,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,16 +14,20 @@ __all__ = ("KingSlime",)
 ################################################################################
 class KingSlime(DMMonster):
 
+    OBJ_ID = "MON-127"
+    NAME = "King Slime"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-127",
-            name="King Slime",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=130,
             atk=14,
             defense=8,
-            rank=3,
+            rank=self.RANK,
             anim_frames=6
         )
 
@@ -14,16 +14,20 @@ __all__ = ("LizardmanGirl",)
 ################################################################################
 class LizardmanGirl(DMMonster):
 
+    OBJ_ID = "MON-125"
+    NAME = "Lizardman Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-125",
-            name="Lizardman Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=110,
             atk=15,
             defense=6.5,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
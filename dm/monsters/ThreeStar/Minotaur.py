@@ -14,16 +14,20 @@ __all__ = ("Minotaur",)
 ################################################################################
 class Minotaur(DMMonster):
 
+    OBJ_ID = "MON-135"
+    NAME = "Minotaur"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-135",
-            name="Minotaur",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=120,
             atk=15,
             defense=5.5,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,16 +14,20 @@ __all__ = ("MinotaurGirl",)
 ################################################################################
 class MinotaurGirl(DMMonster):
 
+    OBJ_ID = "MON-116"
+    NAME = "Minotaur Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-116",
-            name="Minotaur Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=100,
             atk=16,
             defense=6.0,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
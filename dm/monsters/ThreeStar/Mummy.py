@@ -14,16 +14,20 @@ __all__ = ("Mummy",)
 ################################################################################
 class Mummy(DMMonster):
 
+    OBJ_ID = "MON-129"
+    NAME = "Mummy"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-129",
-            name="Mummy",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=110,
             atk=15,
             defense=9,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
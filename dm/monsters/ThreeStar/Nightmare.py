@@ -14,16 +14,20 @@ __all__ = ("Nightmare",)
 ################################################################################
 class Nightmare(DMMonster):
 
+    OBJ_ID = "MON-134"
+    NAME = "Nightmare"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-134",
-            name="Nightmare",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=100,
             atk=16,
             defense=7,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
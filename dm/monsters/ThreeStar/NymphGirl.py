@@ -14,16 +14,20 @@ __all__ = ("NymphGirl",)
 ################################################################################
 class NymphGirl(DMMonster):
 
+    OBJ_ID = "MON-120"
+    NAME = "Nymph Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-120",
-            name="Nymph Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=90,
             atk=16,
             defense=7,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
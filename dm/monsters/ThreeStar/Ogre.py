@@ -14,16 +14,20 @@ __all__ = ("Ogre",)
 ################################################################################
 class Ogre(DMMonster):
 
+    OBJ_ID = "MON-136"
+    NAME = "Ogre"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-136",
-            name="Ogre",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=150,
             atk=13,
             defense=5,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
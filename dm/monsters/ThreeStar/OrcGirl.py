@@ -14,16 +14,20 @@ __all__ = ("OrcGirl",)
 ################################################################################
 class OrcGirl(DMMonster):
 
+    OBJ_ID = "MON-117"
+    NAME = "Orc Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-117",
-            name="Orc Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=90,
             atk=16,
             defense=7,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
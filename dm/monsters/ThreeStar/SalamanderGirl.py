@@ -14,16 +14,20 @@ __all__ = ("SalamanderGirl",)
 ################################################################################
 class SalamanderGirl(DMMonster):
 
+    OBJ_ID = "MON-123"
+    NAME = "Salamander Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-123",
-            name="Salamander Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=95,
             atk=16,
             defense=6.75,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
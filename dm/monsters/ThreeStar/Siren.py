@@ -14,16 +14,20 @@ __all__ = ("Siren",)
 ################################################################################
 class Siren(DMMonster):
 
+    OBJ_ID = "MON-141"
+    NAME = "Siren"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-141",
-            name="Siren",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=100,
             atk=14,
             defense=16,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
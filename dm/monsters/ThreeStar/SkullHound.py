@@ -14,16 +14,20 @@ __all__ = ("SkullHound",)
 ################################################################################
 class SkullHound(DMMonster):
 
+    OBJ_ID = "MON-139"
+    NAME = "Skull Hound"
+    RANK = 3
+
     def __init__(self, game: DMGame,start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-139",
-            name="Skull Hound",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=120,
             atk=16,
             defense=12,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,16 +14,20 @@ __all__ = ("SkullKnight",)
 ################################################################################
 class SkullKnight(DMMonster):
 
+    OBJ_ID = "MON-128"
+    NAME = "Skull Knight"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-128",
-            name="Skull Knight",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=100,
             atk=16,
             defense=6,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
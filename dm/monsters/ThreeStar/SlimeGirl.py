@@ -14,16 +14,20 @@ __all__ = ("SlimeGirl",)
 ################################################################################
 class SlimeGirl(DMMonster):
 
+    OBJ_ID = "MON-124"
+    NAME = "Slime Girl"
+    RANK = 3
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-124",
-            name="Slime Girl",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=130,
             atk=14,
             defense=6.5,
-            rank=3,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,16 +14,20 @@ __all__ = ("DarkSlime",)
 ################################################################################
 class DarkSlime(DMMonster):
 
+    OBJ_ID = "MON-105"
+    NAME = "Dark Slime"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-105",
-            name="Dark Slime",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=90,
             atk=11,
             defense=4.0,
-            rank=2,
+            rank=self.RANK,
             anim_frames=6
         )
 
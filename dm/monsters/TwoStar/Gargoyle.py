@@ -14,16 +14,20 @@ __all__ = ("Gargoyle",)
 ################################################################################
 class Gargoyle(DMMonster):
 
+    OBJ_ID = "MON-113"
+    NAME = "Gargoyle"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-113",
-            name="Gargoyle",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=90,
             atk=9,
             defense=5.5,
-            rank=2
+            rank=self.RANK
         )
 
 ################################################################################
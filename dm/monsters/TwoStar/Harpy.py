@@ -14,16 +14,20 @@ __all__ = ("Harpy",)
 ################################################################################
 class Harpy(DMMonster):
 
+    OBJ_ID = "MON-110"
+    NAME = "Harpy"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-110",
-            name="Harpy",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=70,
             atk=10,
             defense=4.5,
-            rank=2,
+            rank=self.RANK,
             anim_frames=6
         )
 
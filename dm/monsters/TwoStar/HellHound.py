@@ -14,16 +14,20 @@ __all__ = ("HellHound",)
 ################################################################################
 class HellHound(DMMonster):
 
+    OBJ_ID = "MON-112"
+    NAME = "Hell Hound"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-112",
-            name="Hell Hound",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=80,
             atk=10,
             defense=4.0,
-            rank=2,
+            rank=self.RANK,
             anim_frames=4
         )
 
@@ -14,16 +14,20 @@ __all__ = ("Lizardman",)
 ################################################################################
 class Lizardman(DMMonster):
 
+    OBJ_ID = "MON-109"
+    NAME = "Lizardman"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-109",
-            name="Lizardman",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=95,
             atk=9,
             defense=3.75,
-            rank=2,
+            rank=self.RANK,
         )
 
 ################################################################################
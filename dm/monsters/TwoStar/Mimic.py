@@ -14,16 +14,20 @@ __all__ = ("Mimic",)
 ################################################################################
 class Mimic(DMMonster):
 
+    OBJ_ID = "MON-115"
+    NAME = "Mimic"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-115",
-            name="Mimic",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=110,
             atk=8,
             defense=3.5,
-            rank=2,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,16 +14,20 @@ __all__ = ("Orc",)
 ################################################################################
 class Orc(DMMonster):
 
+    OBJ_ID = "MON-111"
+    NAME = "Orc"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-111",
-            name="Orc",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=85,
             atk=10,
             defense=3.75,
-            rank=2,
+            rank=self.RANK,
         )
 
 ################################################################################
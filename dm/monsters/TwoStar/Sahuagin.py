@@ -14,16 +14,20 @@ __all__ = ("Sahuagin",)
 ################################################################################
 class Sahuagin(DMMonster):
 
+    OBJ_ID = "MON-114"
+    NAME = "Sahuagin"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-114",
-            name="Sahuagin",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=60,
             atk=11,
             defense=4.5,
-            rank=2,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,16 +14,20 @@ __all__ = ("Salamander",)
 ################################################################################
 class Salamander(DMMonster):
 
+    OBJ_ID = "MON-108"
+    NAME = "Salamander"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-108",
-            name="Salamander",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=80,
             atk=10,
             defense=3.5,
-            rank=2,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,16 +14,20 @@ __all__ = ("Skull",)
 ################################################################################
 class Skull(DMMonster):
 
+    OBJ_ID = "MON-106"
+    NAME = "Skull"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-106",
-            name="Skull",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=70,
             atk=10,
             defense=4.0,
-            rank=2,
+            rank=self.RANK,
         )
 
 ################################################################################
@@ -14,16 +14,20 @@ __all__ = ("Zombie",)
 ################################################################################
 class Zombie(DMMonster):
 
+    OBJ_ID = "MON-107"
+    NAME = "Zombie"
+    RANK = 2
+
     def __init__(self, game: DMGame, start_cell: Optional[Vector2] = None):
 
         super().__init__(
             game, start_cell,
-            _id="MON-107",
-            name="Zombie",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             life=90,
             atk=9,
             defense=5.0,
-            rank=2,
+            rank=self.RANK,
             anim_frames=6
         )
 
@@ -14,16 +14,20 @@ __all__ = ("Battle",)
 ################################################################################
 class Battle(DMBattleRoom):
 
+    OBJ_ID = "ROOM-101"
+    NAME = "Battle"
+    RANK = 1
+
     def __init__(self, game: DMGame, position: Vector2):
 
         super().__init__(
             game, position,
-            _id="ROOM-101",
-            name="Battle",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             description=(
                 "Deployed monsters' maximum LIFE is increased by {value}."
             ),
-            rank=1
+            rank=self.RANK
         )
 
 ################################################################################
@@ -17,17 +17,21 @@ __all__ = ("Template",)
 ################################################################################
 class Template(DMTrapRoom):
 
+    OBJ_ID = "ROOM-000"
+    NAME = "UrMom"
+    RANK = 9
+
     def __init__(self, game: DMGame, position: Optional[Vector2] = None, level: int = 1):
 
         super().__init__(
             game, position,
-            _id="ROOM-000",
-            name="UrMom",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             description=(
                 "UrMom"
             ),
             level=level,
-            rank=9,
+            rank=self.RANK,
             unlock=UnlockPack.Myth
         )
 
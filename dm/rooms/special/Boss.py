@@ -15,6 +15,10 @@ __all__ = ("BossRoom",)
 ################################################################################
 class BossRoom(DMBattleRoom):
 
+    OBJ_ID = "BOSS-000"
+    NAME = "Boss Chamber"
+    RANK = 0
+
     __slots__ = (
     )
 
@@ -23,10 +27,10 @@ class BossRoom(DMBattleRoom):
 
         super().__init__(
             game, position,
-            _id="BOSS-000",
-            name="Boss Chamber",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             description="The Dungeon Boss awaits the intruders...",
-            rank=0
+            rank=self.RANK
         )
 
 ################################################################################
@@ -15,14 +15,18 @@ __all__ = ("EmptyRoom",)
 ################################################################################
 class EmptyRoom(DMRoom):
 
+    OBJ_ID = "ROOM-000"
+    NAME = "Empty"
+    RANK = 0
+
     def __init__(self, game: DMGame, position: Vector2):
 
         super().__init__(
             game, position,
-            _id="ROOM-000",
-            name="Empty",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             description="There's... nothing here...",
-            rank=0
+            rank=self.RANK
         )
 
 ################################################################################
@@ -15,14 +15,18 @@ __all__ = ("EntranceRoom",)
 ################################################################################
 class EntranceRoom(DMRoom):
 
+    OBJ_ID = "ENTR-000"
+    NAME = "Entrance"
+    RANK = 0
+
     def __init__(self, game: DMGame, position: Vector2):
 
         super().__init__(
             game, position,
-            _id="ENTR-000",
-            name="Entrance",
+            _id=self.OBJ_ID,
+            name=self.NAME,
             description="An entryway into to the dungeon.",
-            rank=0
+            rank=self.RANK
         )
 
 ################################################################################
@@ -0,0 +1,2 @@
+from .layout    import *
+from .runner    import *
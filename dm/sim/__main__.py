@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from typing     import List, Optional
+
+from .layout    import DMDungeonLayout
+from .runner    import run_trials, summarize, write_report
+
+################################################################################
+def main(argv: Optional[List[str]] = None) -> None:
+
+    parser = argparse.ArgumentParser(
+        prog="python -m dm.sim",
+        description="Runs headless battles across a process pool and reports the results."
+    )
+    parser.add_argument("--layout", help="A JSON dungeon layout. Defaults to the debug state's three Bats.")
+    parser.add_argument("--days", type=int, nargs=2, default=(1, 1), metavar=("FIRST", "LAST"),
+                        help="The range of days to spread the trials over, inclusive.")
+    parser.add_argument("--trials", type=int, default=1000, help="The number of battles to run.")
+    parser.add_argument("--seed", type=int, default=None, help="The seed shared by every trial. Defaults to the time.")
+    parser.add_argument("--jobs", type=int, default=None, help="The number of worker processes.")
+    parser.add_argument("--max-time", type=float, default=600.0,
+                        help="The most simulated seconds a battle can run for.")
+    parser.add_argument("--batch", action="store_true",
+                        help="Resolve each battle's encounters together in NumPy arrays. Faster for big waves.")
+    parser.add_argument("--out", help="Where to write the report. .csv for one row per trial, otherwise JSON.")
+    args = parser.parse_args(argv)
+
+    layout = DMDungeonLayout.load(args.layout) if args.layout else DMDungeonLayout.default()
+    seed = args.seed if args.seed is not None else int(time.time())
+
+    start = time.perf_counter()
+    results = run_trials(layout, tuple(args.days), args.trials, seed, args.jobs, args.max_time, args.batch)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    summary["seed"] = seed
+    summary["layout"] = layout.to_dict()
+
+    if args.out:
+        write_report(args.out, summary, results)
+
+    print(json.dumps(summary, indent=2))
+    print(f"Ran {len(results)} battle(s) in {elapsed:.1f}s.")
+
+################################################################################
+if __name__ == "__main__":
+    main()
+
+################################################################################
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+
+from pygame     import Vector2
+from typing     import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from dm.core.game.game import DMGame
+################################################################################
+
+__all__ = ("DMDungeonLayout",)
+
+################################################################################
+class DMDungeonLayout:
+    """A dungeon to simulate battles in: which rooms go where, and which
+    monsters are deployed in each of them.
+
+    Layouts are plain data so they can be sent to worker processes. They're
+    read from JSON shaped like:
+
+        {
+            "rooms": [
+                {"room": "Battle", "position": [4, 1], "monsters": ["Bat", "Bat", "Bat"]}
+            ]
+        }
+
+    Rooms and monsters are looked up by name or ID in the object pool. The
+    boss and entrance tiles are always placed as usual.
+
+    Attributes:
+    -----------
+    _rooms: List[Tuple[:class:`str`, Tuple[:class:`int`, :class:`int`], List[:class:`str`]]]
+        The room, grid position and monsters of each placed room.
+
+    Properties:
+    -----------
+    rooms: List[Tuple[:class:`str`, Tuple[:class:`int`, :class:`int`], List[:class:`str`]]]
+        Returns the room, grid position and monsters of each placed room.
+
+    Methods:
+    --------
+    default() -> :class:`DMDungeonLayout`
+        Returns the debug state's layout.
+
+    load(path: :class:`str`) -> :class:`DMDungeonLayout`
+        Reads a layout from a JSON file.
+
+    from_dict(data: Dict[:class:`str`, Any]) -> :class:`DMDungeonLayout`
+        Builds a layout from already-parsed JSON.
+
+    to_dict() -> Dict[:class:`str`, Any]
+        Returns the layout in the same shape it's read from.
+
+    apply(game: :class:`DMGame`) -> None
+        Builds the layout in the given game's dungeon.
+    """
+
+    __slots__ = (
+        "_rooms",
+    )
+
+################################################################################
+    def __init__(self, rooms: List[Tuple[str, Tuple[int, int], List[str]]]):
+
+        self._rooms: List[Tuple[str, Tuple[int, int], List[str]]] = rooms
+
+################################################################################
+    @property
+    def rooms(self) -> List[Tuple[str, Tuple[int, int], List[str]]]:
+
+        return self._rooms
+
+################################################################################
+    @classmethod
+    def default(cls) -> DMDungeonLayout:
+        """Returns the debug state's layout: three Bats in the Battle room."""
+
+        return cls([("Battle", (4, 1), ["Bat", "Bat", "Bat"])])
+
+################################################################################
+    @classmethod
+    def load(cls, path: str) -> DMDungeonLayout:
+
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+################################################################################
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> DMDungeonLayout:
+
+        rooms = []
+        for entry in data.get("rooms", []):
+            try:
+                x, y = entry["position"]
+                rooms.append((str(entry["room"]), (int(x), int(y)), [str(m) for m in entry.get("monsters", [])]))
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Invalid room entry in layout: {entry!r}")
+
+        return cls(rooms)
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "rooms": [
+                {"room": room, "position": list(position), "monsters": list(monsters)}
+                for room, position, monsters in self._rooms
+            ]
+        }
+
+################################################################################
+    def apply(self, game: DMGame) -> None:
+        """Builds the layout in the given game's dungeon. Passed to
+        :meth:`DMGame.simulate` as its setup.
+
+        Parameters:
+        -----------
+        game: :class:`DMGame`
+            The game to build the layout in. Its map must already exist.
+        """
+
+        dungeon_map = game.dungeon._map
+
+        for room_name, (x, y), monsters in self._rooms:
+            position = Vector2(x, y)
+
+            # Names and IDs are both accepted, so search by both.
+            room = game.spawn.room(room_name, obj_id=room_name, position=position)
+            dungeon_map.deploy(room, position)
+
+            for monster_name in monsters:
+                room.deploy(game.spawn.monster(monster_name, obj_id=monster_name, room=position))
+
+################################################################################
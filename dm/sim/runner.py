@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from typing     import Any, Dict, Iterator, List, Optional, Tuple
+
+from dm.core.game.game  import DMGame
+from .layout    import DMDungeonLayout
+
+################################################################################
+
+__all__ = ("run_trials", "summarize", "write_report")
+
+################################################################################
+
+_Trial = Tuple[DMDungeonLayout, int, int, int, float, bool]
+
+_CSV_FIELDS = (
+    "seed",
+    "worker",
+    "day",
+    "won",
+    "finished",
+    "ticks",
+    "sim_time",
+    "heroes_spawned",
+    "heroes_defeated",
+    "monsters_deployed",
+    "monsters_defeated",
+    "kills_by_room",
+)
+
+################################################################################
+def run_trials(
+    layout: DMDungeonLayout,
+    days: Tuple[int, int],
+    trials: int,
+    seed: int,
+    jobs: Optional[int] = None,
+    max_time: float = 600.0,
+    batch_combat: bool = False
+) -> List[Dict[str, Any]]:
+    """Runs independent headless battles across a process pool.
+
+    Every trial shares the seed but gets its own worker index, so each has a
+    distinct random stream and any single trial can be reproduced on its own.
+    Trials are spread evenly over the day range.
+
+    Parameters:
+    -----------
+    layout: :class:`DMDungeonLayout`
+        The dungeon to defend in every trial.
+
+    days: Tuple[:class:`int`, :class:`int`]
+        The first and last day to simulate, inclusive.
+
+    trials: :class:`int`
+        The number of battles to run.
+
+    seed: :class:`int`
+        The seed shared by every trial.
+
+    jobs: Optional[:class:`int`]
+        The number of worker processes. Defaults to one per core.
+
+    max_time: :class:`float`
+        The most simulated time a single battle can run for, in seconds.
+
+    batch_combat: :class:`bool`
+        Whether to resolve each battle's encounters together with the
+        :class:`DMCombatKernel`. Worth it for big waves.
+
+    Returns:
+    --------
+    List[Dict[:class:`str`, Any]]
+        Each trial's :class:`DMBattleResult`, as a dictionary, in trial order.
+    """
+
+    first, last = days
+    if first < 1 or last < first:
+        raise ValueError(f"Invalid day range |{first}-{last}|.")
+
+    span = last - first + 1
+    work = [(layout, first + (i % span), seed, i + 1, max_time, batch_combat) for i in range(trials)]
+
+    # Batches keep the per-task overhead down when there are lots of short trials.
+    chunksize = max(1, trials // ((jobs or os.cpu_count() or 1) * 4))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_run_trial, work, chunksize=chunksize))
+
+################################################################################
+def _run_trial(trial: _Trial) -> Dict[str, Any]:
+
+    layout, day, seed, worker, max_time, batch_combat = trial
+
+    game = DMGame(headless=True, seed=seed, worker=worker)
+    game.day.set(day)
+    game.battle_manager.batch_combat = batch_combat
+
+    return game.simulate(layout.apply, max_time).to_dict()
+
+################################################################################
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregates trial results into a report.
+
+    Parameters:
+    -----------
+    results: List[Dict[:class:`str`, Any]]
+        The results returned by :func:`run_trials`.
+
+    Returns:
+    --------
+    Dict[:class:`str`, Any]
+        Overall and per-day win rates and durations, the average number of
+        heroes killed in each room per battle, and each monster's survival rate.
+    """
+
+    count = len(results)
+    if count == 0:
+        return {"trials": 0}
+
+    kills: Dict[str, int] = {}
+    outcomes: Dict[str, List[int]] = {}
+    by_day: Dict[int, List[Dict[str, Any]]] = {}
+
+    for result in results:
+        for room, n in result["kills_by_room"].items():
+            kills[room] = kills.get(room, 0) + n
+        for name, (deployed, survived) in result["monster_outcomes"].items():
+            outcome = outcomes.setdefault(name, [0, 0])
+            outcome[0] += deployed
+            outcome[1] += survived
+        by_day.setdefault(result["day"], []).append(result)
+
+    return {
+        "trials": count,
+        **_rates(results),
+        "avg_heroes_spawned": _mean(r["heroes_spawned"] for r in results),
+        "avg_heroes_defeated": _mean(r["heroes_defeated"] for r in results),
+        "hero_kills_per_room": {room: n / count for room, n in sorted(kills.items())},
+        "monster_survival": {
+            name: survived / deployed
+            for name, (deployed, survived) in sorted(outcomes.items())
+        },
+        "by_day": {day: _rates(day_results) for day, day_results in sorted(by_day.items())},
+    }
+
+################################################################################
+def _rates(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+
+    count = len(results)
+
+    return {
+        "win_rate": sum(r["won"] for r in results) / count,
+        "timeout_rate": sum(not r["finished"] for r in results) / count,
+        "avg_duration": _mean(r["sim_time"] for r in results),
+    }
+
+################################################################################
+def _mean(values: Iterator[float]) -> float:
+
+    total = 0.0
+    count = 0
+    for value in values:
+        total += value
+        count += 1
+
+    return total / count if count else 0.0
+
+################################################################################
+def write_report(path: str, summary: Dict[str, Any], results: List[Dict[str, Any]]) -> None:
+    """Writes a report to disk.
+
+    A `.csv` path gets one row per trial. Anything else gets JSON with the
+    summary and every trial's result.
+
+    Parameters:
+    -----------
+    path: :class:`str`
+        Where to write the report.
+
+    summary: Dict[:class:`str`, Any]
+        The summary returned by :func:`summarize`.
+
+    results: List[Dict[:class:`str`, Any]]
+        The results returned by :func:`run_trials`.
+    """
+
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=_CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for result in results:
+                row = dict(result)
+                row["kills_by_room"] = ";".join(f"{room}:{n}" for room, n in sorted(result["kills_by_room"].items()))
+                writer.writerow(row)
+    else:
+        with open(path, "w") as f:
+            json.dump({"summary": summary, "trials": results}, f, indent=2)
+
+################################################################################
@@ -71,7 +71,7 @@ class MenuState(DMState):
         screen.fill(self.background_fill)
 
         if self.title is not None:
-            title = self.title_font.render(self.title, True, WHITE)
+            title = render_text(self.title_font, self.title, WHITE)
             title_rect = title.get_rect()
             title_rect.center = (
                 SCREEN_WIDTH // 2 + self.x_offset,
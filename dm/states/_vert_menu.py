@@ -56,7 +56,7 @@ class VerticalMenuState(MenuState):
 
         for i, option in enumerate(self.options):
             color = RED if i == self.selection else WHITE
-            text = self.option_font.render(option, True, color)
+            text = render_text(self.option_font, option, color)
 
             text_rect = text.get_rect()
             text_rect.center = (
@@ -19,6 +19,9 @@ __all__ = ("BattleState",)
 ################################################################################
 class BattleState(DMState):
 
+    PARTIAL_REDRAW = True
+
+################################################################################
     def __init__(self, game: DMGame):
 
         super().__init__(game)
@@ -36,12 +39,13 @@ class BattleState(DMState):
         if event.type == KEYDOWN:
             if event.key == K_TAB:
                 self.game.spawn_hero()
+            elif event.key == K_f:
+                self.game.sim_clock.cycle_speed()
 
 ################################################################################
     def draw(self, screen: Surface) -> None:
 
-        screen.fill(BLACK)
-        self.game.dungeon.draw(screen)
+        self.game.dungeon.render(screen)
 
 ################################################################################
     def update(self, dt: float) -> None:
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing     import TYPE_CHECKING, Optional
 
+from dm.core.graphics.assets import loading_progress
 from dm.states._vert_menu import VerticalMenuState
 from utilities      import *
 
 if TYPE_CHECKING:
+    from pygame         import Surface
     from pygame.event   import Event
 
     from dm.core  .game import DMGame
@@ -28,7 +30,6 @@ class MainMenuState(VerticalMenuState):
         if event.type == KEYDOWN:
             if event.key == K_RETURN:
                 if self.selection == 0:
-                    convert_all_webp()
                     self.next_state = "debug"
                 elif self.selection == 1:
                     self.next_state = "new_game"
@@ -37,4 +38,15 @@ class MainMenuState(VerticalMenuState):
 
         return
 
+################################################################################
+    def draw(self, screen: Surface) -> None:
+
+        super().draw(screen)
+
+        # Sprites keep loading in the background while the menu is up.
+        finished, requested = loading_progress()
+        if finished < requested:
+            text = render_text(self.option_font, f"Loading assets... {finished} / {requested}", WHITE)
+            screen.blit(text, text.get_rect(midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 25)))
+
 ################################################################################
@@ -0,0 +1,5 @@
+import os
+
+# The game is only ever run headless here, but pygame still wants a driver.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -0,0 +1,60 @@
+import os
+import pygame
+
+from pygame     import Surface
+
+from dm.core.graphics.assets    import (
+    CACHE_DIR,
+    SpriteRequest,
+    build_sprite_cache,
+    prune_sprite_cache,
+)
+
+################################################################################
+def _cached() -> list:
+
+    return sorted(n for n in os.listdir(CACHE_DIR) if n.endswith(".raw"))
+
+################################################################################
+def test_build_sprite_cache_removes_stale_entries(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("art")
+    for name in ("a", "b"):
+        pygame.image.save(Surface((8, 4)), f"art/{name}.png")
+
+    requests = [
+        SpriteRequest("art/a.png"),
+        SpriteRequest("art/a.png", flip_x=True),
+        SpriteRequest("art/b.png", size=(16, 8)),
+    ]
+    assert build_sprite_cache(requests) == (3, 0)
+    assert len(_cached()) == 3
+
+    # Already cached, so nothing to do.
+    assert build_sprite_cache(requests) == (0, 0)
+
+    # Dropped sprites lose their entries.
+    assert build_sprite_cache(requests[:1]) == (0, 2)
+    assert len(_cached()) == 1
+
+################################################################################
+def test_prune_sprite_cache_drops_least_recently_used(tmp_path, monkeypatch):
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(CACHE_DIR)
+
+    for age, name in enumerate(("new", "mid", "old")):
+        path = os.path.join(CACHE_DIR, f"{name}.raw")
+        with open(path, "wb") as f:
+            f.write(bytes(100))
+        stamp = 1_000_000 - age * 1000
+        os.utime(path, (stamp, stamp))
+
+    assert prune_sprite_cache(250) == 1
+    assert _cached() == ["mid.raw", "new.raw"]
+
+    assert prune_sprite_cache(None) == 0
+    assert prune_sprite_cache(0) == 2
+
+################################################################################
@@ -0,0 +1,162 @@
+import pytest
+
+from pygame     import Vector2
+
+from dm.core.game.dungeon    import DMDungeon
+from dm.core.game.encounter  import DMEncounter
+from dm.core.game.game  import DMGame
+from dm.core.objects.monster    import DMMonster
+from dm.sim     import DMDungeonLayout
+
+################################################################################
+def _fight(game: DMGame, monster: DMMonster, hero_life: int = 1) -> None:
+
+    hero = game.spawn.hero("Farmer", room=Vector2(4, 1))
+    hero._stats._life._current = hero_life
+
+    game.battle_manager.engage(hero, monster)
+    for _ in range(60 * 10):
+        game.battle_manager.update(1 / 60)
+
+################################################################################
+@pytest.mark.parametrize("batch_combat", [False, True])
+def test_encounter_without_dex_still_ends(batch_combat):
+
+    game = DMGame(headless=True, seed=1, worker=1)
+    game.dungeon._map._init_map()
+    game.battle_manager.batch_combat = batch_combat
+
+    monster = game.spawn.monster("Bat", room=Vector2(4, 1))
+    monster._stats._life._current = 10_000
+    game.get_room_at(Vector2(4, 1)).deploy(monster)
+    hero = game.spawn.hero("Farmer", room=Vector2(4, 1))
+    hero._stats._life._current = 10_000
+
+    monster._stats._dex._current = 0.0
+    hero._stats._dex._current = -1.0
+
+    game.battle_manager.engage(hero, monster)
+    encounter = game.battle_manager._encounters[0]
+
+    for _ in range(60 * 120):
+        game.battle_manager.update(1 / 60)
+        if not encounter.in_progress:
+            break
+
+    assert not encounter.in_progress
+    assert encounter.attack_count == DMEncounter.MAX_ATTACKS
+
+################################################################################
+@pytest.mark.parametrize("batch_combat", [False, True])
+def test_dispatched_context_survives_pool_reuse(batch_combat):
+
+    game = DMGame(headless=True, seed=1, worker=1)
+    game.dungeon._map._init_map()
+
+    monster = game.spawn.monster("Bat", room=Vector2(4, 1))
+    monster._stats._life._current = 10_000
+    game.get_room_at(Vector2(4, 1)).deploy(monster)
+
+    battle_mgr = game.battle_manager
+    battle_mgr.keep_attack_log = False
+    battle_mgr.batch_combat = batch_combat
+
+    held = []
+    game.subscribe_event("on_death", held.append)
+
+    _fight(game, monster)
+    assert len(held) == 1
+
+    ctx = held[0]
+    snapshot = (ctx.id, ctx.source, ctx.target)
+
+    # Plenty of fights' worth of contexts going through the pool.
+    hits = battle_mgr._context_pool.hits
+    for _ in range(5):
+        _fight(game, monster, hero_life=10_000)
+
+    assert battle_mgr._context_pool.hits > hits
+    assert (ctx.id, ctx.source, ctx.target) == snapshot
+    assert ctx.published
+
+################################################################################
+def test_skipping_idle_steps_matches_stepping(monkeypatch):
+
+    layout = DMDungeonLayout.default()
+
+    def run(day: int) -> dict:
+        game = DMGame(headless=True, seed=7, worker=1)
+        game.day.set(day)
+        return game.simulate(layout.apply, 600).to_dict()
+
+    skipped = [run(day) for day in (1, 3)]
+
+    monkeypatch.setattr(DMDungeon, "idle", property(lambda self: False))
+    stepped = [run(day) for day in (1, 3)]
+
+    assert skipped == stepped
+
+################################################################################
+def test_battle_ends_when_heroes_die_outside_encounters():
+
+    game = DMGame(headless=True, seed=1, worker=1)
+    game.dungeon._map._init_map()
+
+    battle_mgr = game.battle_manager
+    battle_mgr.start_battle("battle")
+
+    # Nothing is deployed, so every hero dies the way a trap would kill it.
+    for _ in range(60 * 60):
+        for hero in game.dungeon.heroes:
+            if hero.is_alive:
+                hero.damage(hero.life)
+
+        game.dungeon.update(1 / 60)
+        battle_mgr.update(1 / 60)
+        if not battle_mgr.running:
+            break
+
+    assert not battle_mgr.running
+    assert battle_mgr.heroes_spawned == 3
+    assert battle_mgr.heroes_in_dungeon == 0
+    assert not game.dungeon.heroes
+
+################################################################################
+def test_kept_death_context_keeps_its_hero():
+
+    game = DMGame(headless=True, seed=7, worker=1)
+    game.battle_manager._hero_spawner.increase(20)
+
+    held = []
+    game.subscribe_event("on_death", held.append)
+
+    # Long enough for later heroes to spawn after the first ones die.
+    game.simulate(DMDungeonLayout.default().apply, 30)
+
+    heroes = [ctx.target for ctx in held if ctx.target.is_hero()]
+    assert len(heroes) > 1
+    # Each death is a different hero, and none came back for a later spawn.
+    assert len({id(hero) for hero in heroes}) == len(heroes)
+    assert not any(hero.is_alive for hero in heroes)
+
+################################################################################
+def test_hand_spawned_heroes_count_toward_the_wave():
+
+    game = DMGame(headless=True, seed=1, worker=1)
+    game.dungeon._map._init_map()
+
+    battle_mgr = game.battle_manager
+    battle_mgr.start_battle("battle")
+
+    # As pressing TAB in battle does.
+    game.spawn_hero()
+    assert battle_mgr.heroes_spawned == 1
+
+    for _ in range(60 * 30):
+        game.dungeon.update(1 / 60)
+        battle_mgr.update(1 / 60)
+
+    assert battle_mgr.heroes_spawned == 3
+    assert len(game.dungeon.heroes) == 3
+
+################################################################################
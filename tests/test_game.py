@@ -0,0 +1,34 @@
+from dm.core.game.game  import DMGame
+
+################################################################################
+def test_headless_is_per_game():
+
+    headless = DMGame(headless=True, seed=1, worker=1)
+    headless.dungeon._map._init_map()
+    # Only the dummy video driver here, but the game doesn't know that.
+    windowed = DMGame(headless=False, seed=1, worker=1)
+
+    assert headless.headless and not windowed.headless
+
+    # Made after the windowed game, so a process-wide flag would have had
+    # the hero try to load its sprites from disk.
+    hero = headless.spawn.hero("Farmer")
+    assert hero.graphics.headless
+
+    room = headless.spawn.room(obj_id="ROOM-101")
+    assert room._graphics.headless
+
+################################################################################
+def test_dispatch_accepts_any_payload():
+
+    game = DMGame(headless=True, seed=1, worker=1)
+
+    received = []
+    game.subscribe_event("on_attack", received.append)
+
+    payload = object()
+    game.dispatch_event("on_attack", payload)
+
+    assert received == [payload]
+
+################################################################################
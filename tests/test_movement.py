@@ -0,0 +1,32 @@
+from pygame     import Vector2
+
+from dm.core.game.game  import DMGame
+from dm.core.graphics.movement  import MovementComponent
+
+################################################################################
+def test_hero_lands_on_room_centres(monkeypatch):
+
+    arrivals = []
+    stop_movement = MovementComponent.stop_movement
+
+    def record_arrival(mover: MovementComponent) -> None:
+        arrivals.append((Vector2(mover.screen_pos), mover.room))
+        stop_movement(mover)
+
+    monkeypatch.setattr(MovementComponent, "stop_movement", record_arrival)
+
+    game = DMGame(headless=True, seed=3, worker=1)
+    game.dungeon._map._init_map()
+    game.spawn_hero()
+    hero = game.dungeon.heroes[0]
+
+    # An empty dungeon, so the hero wanders from room to room.
+    for _ in range(60 * 120):
+        hero.update(1 / 60)
+
+    assert len(arrivals) >= 20
+    for position, room in arrivals:
+        assert room is not None
+        assert position == room.center
+
+    assert game.get_room_at(hero.room.grid_pos) is hero.room
@@ -44,6 +44,8 @@ ROOM_SIZE = 150
 HERO_SPEED = 75
 SCROLL_SPEED = 10
 
+MAX_DAY = 2000  # The "max" day that spawn weights and hero counts scale to.
+
 ################################################################################
 # Visual
 
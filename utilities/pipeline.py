@@ -0,0 +1,204 @@
+"""Converts the source art in `assets/sprites` into the formats the game loads.
+
+Run it whenever new art is dropped in:
+
+    python -m utilities.pipeline [--root assets/sprites] [--jobs N] [--force] [--no-cache]
+
+Conversions run across a process pool, and a manifest of processed assets is
+kept next to the sprites, so only new or changed files are converted again.
+Afterwards, the game's sprite cache is filled with every sprite it loads and
+cleared of anything it no longer does.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing     import Any, Dict, List, Optional, Tuple
+
+from PIL    import Image
+################################################################################
+
+__all__ = ("convert_assets", "cache_sprites")
+
+################################################################################
+
+SPRITE_ROOT = "assets/sprites"
+MANIFEST_NAME = ".pipeline.json"
+
+_SOURCE_EXTENSION = ".webp"
+_OUTPUT_EXTENSION = ".png"
+
+################################################################################
+def convert_assets(
+    root: str = SPRITE_ROOT,
+    jobs: Optional[int] = None,
+    force: bool = False
+) -> Tuple[int, int]:
+    """Converts every source image under the given root that's new or has
+    changed since it was last converted.
+
+    A source is skipped without being read when its size and modification
+    time match the manifest and its output is still there. If only the
+    timestamp changed, its hash is checked before anything is re-encoded.
+
+    Parameters:
+    -----------
+    root: :class:`str`
+        The directory to search for source images.
+
+    jobs: Optional[:class:`int`]
+        The number of worker processes. Defaults to one per core.
+
+    force: :class:`bool`
+        Whether to convert everything, ignoring the manifest.
+
+    Returns:
+    --------
+    Tuple[:class:`int`, :class:`int`]
+        The number of files converted, and the number found to be up to date.
+    """
+
+    manifest_path = os.path.join(root, MANIFEST_NAME)
+    manifest = {} if force else _read_manifest(manifest_path)
+
+    work: List[Tuple[str, str, Optional[str]]] = []
+    skipped = 0
+
+    for source in glob.glob(os.path.join(root, "**", "*" + _SOURCE_EXTENSION), recursive=True):
+        key = os.path.relpath(source, root).replace(os.sep, "/")
+        output = os.path.splitext(source)[0] + _OUTPUT_EXTENSION
+
+        entry = manifest.get(key)
+        if entry is not None and _up_to_date(source, output, entry):
+            skipped += 1
+            continue
+
+        work.append((source, output, entry["sha1"] if entry is not None else None))
+
+    converted = 0
+    if work:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_convert, *item) for item in work]
+            for future in as_completed(futures):
+                source, entry, changed = future.result()
+                manifest[os.path.relpath(source, root).replace(os.sep, "/")] = entry
+                if changed:
+                    converted += 1
+                else:
+                    skipped += 1
+
+    # Forget anything whose source has been removed.
+    for key in [k for k in manifest if not os.path.exists(os.path.join(root, k))]:
+        del manifest[key]
+
+    _write_manifest(manifest_path, manifest)
+
+    return converted, skipped
+
+################################################################################
+def cache_sprites() -> Tuple[int, int]:
+    """Fills the game's sprite cache with every sprite the game loads, and
+    deletes the entries for anything it no longer loads. Run from the
+    project root, since sprite paths are relative to it.
+
+    Returns:
+    --------
+    Tuple[:class:`int`, :class:`int`]
+        The number of sprites that were cached, and the number deleted.
+    """
+
+    # Imported here, since the game's modules import `utilities` themselves.
+    from dm.core.game.objpool import DMObjectPool
+    from dm.core.graphics.assets import build_sprite_cache
+
+    return build_sprite_cache(DMObjectPool.sprite_requests())
+
+################################################################################
+def _up_to_date(source: str, output: str, entry: Dict[str, Any]) -> bool:
+
+    try:
+        source_stat = os.stat(source)
+        output_stat = os.stat(output)
+    except OSError:
+        return False
+
+    return (
+        source_stat.st_size == entry["size"]
+        and source_stat.st_mtime_ns == entry["mtime_ns"]
+        and output_stat.st_mtime_ns == entry["output_mtime_ns"]
+    )
+
+################################################################################
+def _convert(source: str, output: str, known_hash: Optional[str]) -> Tuple[str, Dict[str, Any], bool]:
+    """Runs in a worker process. Converts a single source image unless its
+    contents match what was converted last time."""
+
+    with open(source, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+
+    changed = digest != known_hash or not os.path.exists(output)
+    if changed:
+        # Written to a temporary file first so the game never loads a
+        # half-written sprite.
+        temp_path = f"{output}.{os.getpid()}.tmp"
+        with Image.open(source) as img:
+            img.save(temp_path, "PNG")
+        os.replace(temp_path, output)
+
+    source_stat = os.stat(source)
+    entry = {
+        "sha1": digest,
+        "size": source_stat.st_size,
+        "mtime_ns": source_stat.st_mtime_ns,
+        "output_mtime_ns": os.stat(output).st_mtime_ns,
+    }
+
+    return source, entry, changed
+
+################################################################################
+def _read_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # A missing or corrupt manifest just means converting everything again.
+        return {}
+
+################################################################################
+def _write_manifest(path: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+################################################################################
+def main(argv: Optional[List[str]] = None) -> None:
+
+    parser = argparse.ArgumentParser(description="Converts the source art into the formats the game loads.")
+    parser.add_argument("--root", default=SPRITE_ROOT, help="The directory to search for source images.")
+    parser.add_argument("--jobs", type=int, default=None, help="The number of worker processes.")
+    parser.add_argument("--force", action="store_true", help="Convert everything, ignoring the manifest.")
+    parser.add_argument("--no-cache", action="store_true", help="Don't update the game's sprite cache.")
+    args = parser.parse_args(argv)
+
+    converted, skipped = convert_assets(args.root, args.jobs, args.force)
+    print(f"Converted {converted} file(s), {skipped} already up to date.")
+
+    if not args.no_cache:
+        cached, removed = cache_sprites()
+        print(f"Cached {cached} sprite(s), removed {removed} stale.")
+
+################################################################################
+if __name__ == "__main__":
+    main()
+
+################################################################################
@@ -1,21 +1,21 @@
-import glob
-import os
 import pygame
 import re
 
+from collections    import OrderedDict
 from dataclasses    import dataclass
+from functools      import lru_cache
 from pygame         import Rect, Surface, Vector2
 from pygame.font    import Font
 from typing         import Any, Dict, List, Tuple, Union
 
 from utilities.constants import GRID_PADDING, ROOM_SIZE, TEXT_ACCENT, WHITE, YELLOW
-
-from PIL    import Image
 ################################################################################
 
 __all__ = (
     "convert_all_webp",
     "rounded_rect",
+    "render_text",
+    "clear_text_cache",
     "text_to_multiline_str",
     "text_to_multiline_rect",
     "multicolor_text",
@@ -29,19 +29,15 @@ __all__ = (
 
 ################################################################################
 def convert_all_webp() -> None:
-    """For internal use as needed, not actually used in the game."""
-
-    base = "assets/sprites"
+    """For internal use as needed, not actually used in the game.
 
-    for webp_path in glob.glob(base + "/**/*.webp", recursive=True):
-        img = Image.open(webp_path)
+    Kept for old scripts. Prefer running `python -m utilities.pipeline`.
+    """
 
-        parts = os.path.splitext(webp_path)
-        extension = "GIF" if parts[0].split("\\")[2] == "idle" else "PNG"
-        new_path = parts[0] + f".{extension.lower()}"
+    # Imported here so running the pipeline as a module doesn't import it twice.
+    from utilities.pipeline import convert_assets
 
-        img.save(new_path, extension)
-        os.remove(webp_path)
+    convert_assets()
 
 ################################################################################
 def rounded_rect(
@@ -72,25 +68,53 @@ def rounded_rect(
 
     return surface
 
+# Rendered text surfaces, least recently used first.
+_TEXT_CACHE: OrderedDict[Tuple[Font, str, Tuple[int, ...], bool], Surface] = OrderedDict()
+_TEXT_CACHE_SIZE = 512
+
+_TAG_PATTERN = re.compile(r'\[\/?[a-z]\]')  # pattern to find color tags
+_TAG_COLORS = {  # map tags to colors
+    '[y]' : YELLOW,
+    '[w]' : WHITE,
+    '[a]' : TEXT_ACCENT
+}
+
 ################################################################################
-def text_to_multiline_str(text: str, max_line_length: int) -> List[str]:
+def render_text(
+    font: Font,
+    text: str,
+    color: Tuple[int, ...],
+    antialias: bool = True
+) -> Surface:
+    """Renders the text with the given font, reusing the surface from an
+    earlier call with the same arguments if there was one.
+
+    The returned surface is shared, so it must not be drawn onto.
+    """
+
+    key = (font, text, tuple(color), antialias)
+    try:
+        _TEXT_CACHE.move_to_end(key)
+        return _TEXT_CACHE[key]
+    except KeyError:
+        pass
+
+    surface = _TEXT_CACHE[key] = font.render(text, antialias, color)
+    if len(_TEXT_CACHE) > _TEXT_CACHE_SIZE:
+        _TEXT_CACHE.popitem(last=False)
 
-    words = text.split(' ')
-    lines = []
-    current_line = []
+    return surface
 
-    for word in words:
-        if len(' '.join(current_line) + ' ' + word) <= max_line_length:
-            current_line.append(word)
-        else:
-            lines.append(' '.join(current_line))
-            current_line = [word]
-    lines.append(' '.join(current_line))  # Add the last line
+################################################################################
+def clear_text_cache() -> None:
 
-    return lines
+    _TEXT_CACHE.clear()
+    _wrap_text.cache_clear()
+    _multicolor_layout.cache_clear()
 
 ################################################################################
-def text_to_multiline_rect(text: str, rect: Rect, max_line_length: int, line_height: int) -> Dict[str, Rect]:
+@lru_cache(maxsize=256)
+def _wrap_text(text: str, max_line_length: int) -> Tuple[str, ...]:
 
     words = text.split(' ')
     lines = []
@@ -104,6 +128,18 @@ def text_to_multiline_rect(text: str, rect: Rect, max_line_length: int, line_hei
             current_line = [word]
     lines.append(' '.join(current_line))  # Add the last line
 
+    return tuple(lines)
+
+################################################################################
+def text_to_multiline_str(text: str, max_line_length: int) -> List[str]:
+
+    return list(_wrap_text(text, max_line_length))
+
+################################################################################
+def text_to_multiline_rect(text: str, rect: Rect, max_line_length: int, line_height: int) -> Dict[str, Rect]:
+
+    lines = _wrap_text(text, max_line_length)
+
     line_rects = {}
     for i, line in enumerate(lines):
         line_rect = Rect(rect.x, rect.y + i * line_height, rect.width, line_height)
@@ -119,36 +155,47 @@ def multicolor_text(
     pos: Union[pygame.Vector2, pygame.Rect]
 ):
 
-    color_dict = {  # map tags to colors
-        '[y]' : YELLOW,
-        '[w]' : WHITE,
-        '[a]' : TEXT_ACCENT
-    }
-    tag_pattern = r'\[\/?[a-z]\]'  # pattern to find tags
-
-    lines = text_to_multiline_str(text, 25)  # split text into lines
+    lines = _multicolor_layout(text, font)
     y = pos[1] + (surface.get_height() - len(lines) * font.get_height()) // 2
 
-    for line in lines:
-        parts = re.split(tag_pattern, line)  # split each line by tags
-        tags = re.findall(tag_pattern, line)  # get list of all tags in the line
-        color = (255, 255, 255)  # default color is white
-
-        # Determine the total width of the line
-        total_width = sum(font.size(part)[0] for part in parts)
-
+    for total_width, fragments in lines:
         # Set x to the starting x-coordinate of the centered line
         x = pos[0] + (surface.get_width() - total_width) // 2
 
-        for part, tag in zip(parts, tags + ['']):
-            if tag in color_dict:
-                color = color_dict[tag]
-            img = font.render(part, True, color)
+        for part, color in fragments:
+            img = render_text(font, part, color)
             surface.blit(img, (x, y))
             x += img.get_width()  # update x-coordinate
 
         y += font.get_height() + 3  # update y-coordinate
 
+################################################################################
+@lru_cache(maxsize=128)
+def _multicolor_layout(
+    text: str,
+    font: Font
+) -> Tuple[Tuple[int, Tuple[Tuple[str, Tuple[int, ...]], ...]], ...]:
+    """Splits tagged text into lines of (total width, (fragment, color) pairs)."""
+
+    layout = []
+    for line in _wrap_text(text, 25):  # split text into lines
+        parts = _TAG_PATTERN.split(line)  # split each line by tags
+        tags = _TAG_PATTERN.findall(line)  # get list of all tags in the line
+        color = (255, 255, 255)  # default color is white
+
+        # Determine the total width of the line
+        total_width = sum(font.size(part)[0] for part in parts)
+
+        fragments = []
+        for part, tag in zip(parts, tags + ['']):
+            if tag in _TAG_COLORS:
+                color = _TAG_COLORS[tag]
+            fragments.append((part, color))
+
+        layout.append((total_width, tuple(fragments)))
+
+    return tuple(layout)
+
 ################################################################################
 def pixel_to_grid(screen_position: Vector2) -> Vector2:
 
@@ -183,8 +230,11 @@ def center_text(surface: Surface, text: Surface):
 ################################################################################
 def class_to_file_name(obj: Any):
 
+    # Accepts either an instance or the class itself.
+    cls = obj if isinstance(obj, type) else obj.__class__
+
     return ''.join(
-        ['_' + i.lower() if i.isupper() else i for i in obj.__class__.__name__]
+        ['_' + i.lower() if i.isupper() else i for i in cls.__name__]
     ).lstrip('_')
 
 ################################################################################